@@ -1,14 +1,119 @@
 #!/usr/bin/env python3
 """
 Backfill translation for stored articles.
+
+The original English text is kept in original_title/original_content and the
+Korean translation goes to title/content, so the web layer only ever serves
+stored text. translate_pending_articles() is also run periodically in the
+background by the scheduler and the web app; each run leases the articles it
+picks, so several runners never translate the same article at once.
 """
 
 import argparse
+import logging
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from config import Config
+from database import get_db_session, get_untranslated_articles
+
+logger = logging.getLogger(__name__)
+
+
+def translate_pending_articles(analyzer=None, limit: int = 50, include_title: bool = True,
+                               include_content: bool = True, update_summary: bool = False,
+                               dry_run: bool = False) -> Dict[str, int]:
+    """Detect the language of unchecked articles and translate English ones.
+
+    An article is marked translated only once every requested field is done;
+    until then it stays pending and is retried from the original after a
+    backoff that doubles with each failed attempt, so articles that keep
+    failing do not crowd out the rest. Without an OpenAI key only the
+    language check is done.
+    """
+    if analyzer is None:
+        from news_analyzer import NewsAnalyzer
+        analyzer = NewsAnalyzer()
+    counts = {'total': 0, 'korean': 0, 'translated': 0, 'pending': 0}
+
+    session = get_db_session()
+    try:
+        articles = get_untranslated_articles(
+            session, limit=limit, unchecked_only=not analyzer.openai_api_key,
+            claim_minutes=None if dry_run else Config.TRANSLATION_JOB_LEASE_MINUTES
+        )
+        counts['total'] = len(articles)
+        english = []
+        for article in articles:
+            if article.original_title is None:
+                article.original_title = article.title
+            if article.original_content is None:
+                article.original_content = article.content
+            if article.language is None:
+                article.language = analyzer.detect_language(article.original_title, article.original_content)
+            if article.language != 'en':
+                article.translation_retry_at = None
+                counts['korean'] += 1
+            elif not analyzer.openai_api_key:
+                article.translation_retry_at = None
+                counts['pending'] += 1
+            else:
+                english.append(article)
+
+        # Titles and contents each go out as batched requests.
+        titles = _translate_fields(analyzer, [article.original_title for article in english], is_title=True) \
+            if include_title else [None] * len(english)
+        contents = _translate_fields(analyzer, [article.original_content for article in english], is_title=False) \
+            if include_content else [None] * len(english)
+        for article, title, content in zip(english, titles, contents):
+            if title is not None:
+                article.title = title
+            if content is not None:
+                if update_summary and content != article.content:
+                    article.summary = analyzer.summarize_article(content)
+                article.content = content
+            if (title is not None or not include_title) and (content is not None or not include_content):
+                article.translated_at = datetime.now()
+                article.translation_retry_at = None
+                counts['translated'] += 1
+            else:
+                _schedule_retry(article)
+                counts['pending'] += 1
+
+        if dry_run:
+            session.rollback()
+        else:
+            session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
 
-from database import get_db_session, NewsArticle
-from news_analyzer import NewsAnalyzer
+    if counts['translated'] or counts['korean']:
+        logger.info(
+            f"Article translation: {counts['translated']} translated, "
+            f"{counts['korean']} already Korean, {counts['pending']} pending"
+        )
+    return counts
+
+
+def _schedule_retry(article) -> None:
+    """Count a failed attempt and hold the article back until its next retry time."""
+    article.translation_attempts = (article.translation_attempts or 0) + 1
+    delay = min(Config.TRANSLATION_JOB_INTERVAL_MINUTES * 2 ** (article.translation_attempts - 1),
+                Config.TRANSLATION_RETRY_MAX_HOURS * 60)
+    article.translation_retry_at = datetime.utcnow() + timedelta(minutes=delay)
+
+
+def _translate_fields(analyzer, texts: List[Optional[str]], is_title: bool) -> List[Optional[str]]:
+    """Translated texts (non-English texts unchanged), None where translation failed."""
+    translated = analyzer.translate_batch([text or '' for text in texts], is_title=is_title)
+    return [
+        None if text and analyzer._is_english_text(text) and result == text else (result or text)
+        for text, result in zip(texts, translated)
+    ]
 
 
 def parse_args() -> argparse.Namespace:
@@ -29,58 +134,34 @@ def main() -> int:
         print("Nothing to do. Use --include-title and/or --include-content.")
         return 1
 
+    from news_analyzer import NewsAnalyzer
     analyzer = NewsAnalyzer()
     if not analyzer.openai_api_key and not args.allow_no_api:
         print("OPENAI_API_KEY is missing. Set it or use --allow-no-api.")
         return 1
 
-    session = get_db_session()
-    query = session.query(NewsArticle).order_by(NewsArticle.id.asc())
-    if args.limit and args.limit > 0:
-        query = query.limit(args.limit)
-
-    articles = query.all()
-    total = len(articles)
-    updated = 0
-    skipped = 0
-
-    for article in articles:
-        changed = False
-
-        if args.include_title and article.title and analyzer._is_english_text(article.title):
-            new_title = analyzer._translate_text(article.title, is_title=True)
-            if new_title and new_title != article.title:
-                article.title = new_title
-                changed = True
-
-        if args.include_content and article.content and analyzer._is_english_text(article.content):
-            new_content = analyzer._translate_text(article.content, is_title=False)
-            if new_content and new_content != article.content:
-                article.content = new_content
-                changed = True
-
-                if args.update_summary:
-                    article.summary = analyzer.summarize_article(new_content)
-
-        if changed:
-            updated += 1
-            if args.dry_run:
-                continue
-            session.add(article)
-        else:
-            skipped += 1
-
-    if args.dry_run:
-        session.close()
-        print(f"Dry run complete at {datetime.now().isoformat()}.")
-        print(f"Total: {total}, Updated: {updated}, Skipped: {skipped}")
-        return 0
-
-    session.commit()
-    session.close()
-
-    print(f"Backfill complete at {datetime.now().isoformat()}.")
-    print(f"Total: {total}, Updated: {updated}, Skipped: {skipped}")
+    totals = {'total': 0, 'korean': 0, 'translated': 0, 'pending': 0}
+    # A dry run returns the same articles again and a run with failures would
+    # only reach articles that are due later, so both stop after one batch.
+    while True:
+        batch_size = Config.TRANSLATION_JOB_BATCH_SIZE
+        if args.limit and args.limit > 0:
+            batch_size = min(batch_size, args.limit - totals['total'])
+        counts = translate_pending_articles(
+            analyzer, limit=batch_size, include_title=args.include_title,
+            include_content=args.include_content, update_summary=args.update_summary,
+            dry_run=args.dry_run
+        )
+        for key, value in counts.items():
+            totals[key] += value
+        if (args.dry_run or counts['total'] < batch_size or counts['pending'] or
+                (args.limit and args.limit > 0 and totals['total'] >= args.limit)):
+            break
+
+    label = "Dry run" if args.dry_run else "Backfill"
+    print(f"{label} complete at {datetime.now().isoformat()}.")
+    print(f"Total: {totals['total']}, Translated: {totals['translated']}, "
+          f"Korean: {totals['korean']}, Pending: {totals['pending']}")
     return 0
 
 
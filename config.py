@@ -22,6 +22,62 @@ class Config:
     CRAWL_INTERVAL_HOURS = int(os.getenv('CRAWL_INTERVAL_HOURS', '1'))
     MAX_ARTICLES_PER_SOURCE = int(os.getenv('MAX_ARTICLES_PER_SOURCE', '10'))
     REQUEST_DELAY_SECONDS = float(os.getenv('REQUEST_DELAY_SECONDS', '2.0'))
+    CRAWL_CONCURRENT = os.getenv('CRAWL_CONCURRENT', 'True').lower() == 'true'
+    CRAWL_MAX_CONCURRENCY = int(os.getenv('CRAWL_MAX_CONCURRENCY', '16'))
+    CRAWL_PER_HOST_CONCURRENCY = int(os.getenv('CRAWL_PER_HOST_CONCURRENCY', '2'))
+    CRAWL_HOST_BURST = float(os.getenv('CRAWL_HOST_BURST', '2'))
+    HTTP_CACHE_MAX_AGE_DAYS = int(os.getenv('HTTP_CACHE_MAX_AGE_DAYS', '30'))
+    CRAWL_INCREMENTAL = os.getenv('CRAWL_INCREMENTAL', 'True').lower() == 'true'
+    CRAWL_MAX_LIST_PAGES = int(os.getenv('CRAWL_MAX_LIST_PAGES', '3'))
+    CRAWL_MAX_ARTICLE_BYTES = int(os.getenv('CRAWL_MAX_ARTICLE_BYTES', '262144'))
+    CRAWL_PARSE_WORKERS = int(os.getenv('CRAWL_PARSE_WORKERS', '0'))
+    CRAWL_SELECTOR_REVALIDATE_EVERY = int(os.getenv('CRAWL_SELECTOR_REVALIDATE_EVERY', '50'))
+    CRAWL_SOURCE_MIN_INTERVAL_MINUTES = float(os.getenv('CRAWL_SOURCE_MIN_INTERVAL_MINUTES', '30'))
+    CRAWL_SOURCE_MAX_INTERVAL_MINUTES = float(os.getenv('CRAWL_SOURCE_MAX_INTERVAL_MINUTES', '2880'))
+    CRAWL_SOURCE_INITIAL_INTERVAL_MINUTES = float(os.getenv('CRAWL_SOURCE_INITIAL_INTERVAL_MINUTES', '720'))
+    CRAWL_SOURCE_TARGET_YIELD = float(os.getenv('CRAWL_SOURCE_TARGET_YIELD', '3'))
+    CRAWL_SCHEDULER_TICK_MINUTES = int(os.getenv('CRAWL_SCHEDULER_TICK_MINUTES', '10'))
+    CRAWL_BREAKER_FAILURE_THRESHOLD = int(os.getenv('CRAWL_BREAKER_FAILURE_THRESHOLD', '3'))
+    CRAWL_BREAKER_COOLDOWN_MINUTES = float(os.getenv('CRAWL_BREAKER_COOLDOWN_MINUTES', '360'))
+    CRAWL_BREAKER_MAX_COOLDOWN_MINUTES = float(os.getenv('CRAWL_BREAKER_MAX_COOLDOWN_MINUTES', '10080'))
+    CRAWL_FRONTIER_LEASE_SECONDS = int(os.getenv('CRAWL_FRONTIER_LEASE_SECONDS', '900'))
+    CRAWL_FRONTIER_MAX_ATTEMPTS = int(os.getenv('CRAWL_FRONTIER_MAX_ATTEMPTS', '3'))
+    CRAWL_FRONTIER_RETENTION_DAYS = int(os.getenv('CRAWL_FRONTIER_RETENTION_DAYS', '30'))
+    CRAWL_FETCH_BUDGET_REQUESTS = int(os.getenv('CRAWL_FETCH_BUDGET_REQUESTS', '0'))
+    CRAWL_FETCH_BUDGET_SECONDS = float(os.getenv('CRAWL_FETCH_BUDGET_SECONDS', '0'))
+    CRAWL_API_DEADLINE_SECONDS = float(os.getenv('CRAWL_API_DEADLINE_SECONDS', '8'))
+    
+    # 피드/사이트맵 자동 탐색 (찾으면 HTML 목록 대신 피드 사용)
+    FEED_DISCOVERY_ENABLED = os.getenv('FEED_DISCOVERY_ENABLED', 'True').lower() == 'true'
+    FEED_DISCOVERY_RECHECK_DAYS = int(os.getenv('FEED_DISCOVERY_RECHECK_DAYS', '7'))
+    FEED_MAX_FAILURES = int(os.getenv('FEED_MAX_FAILURES', '3'))
+    
+    # 근접 중복 기사 설정 (MinHash 추정 자카드 유사도 하한, 비교 기간)
+    # 측정 예: 다른 매체가 고쳐 쓴 같은 보도 0.57, 같은 주제의 다른 기사 0.35
+    NEAR_DUPLICATE_MIN_SIMILARITY = float(os.getenv('NEAR_DUPLICATE_MIN_SIMILARITY', '0.45'))
+    NEAR_DUPLICATE_WINDOW_DAYS = int(os.getenv('NEAR_DUPLICATE_WINDOW_DAYS', '14'))
+    FEED_COLLAPSE_DUPLICATES = os.getenv('FEED_COLLAPSE_DUPLICATES', 'True').lower() == 'true'
+    
+    # LLM 응답 캐시 (프로세스 내 LRU 항목 수, 종류별)
+    LLM_CACHE_MEMORY_ITEMS = int(os.getenv('LLM_CACHE_MEMORY_ITEMS', '10000'))
+    
+    # LLM 게이트웨이 (동시 요청 수, 분당 요청/토큰 한도, 재시도)
+    LLM_MAX_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', '4'))
+    LLM_REQUESTS_PER_MINUTE = float(os.getenv('LLM_REQUESTS_PER_MINUTE', '500'))
+    LLM_TOKENS_PER_MINUTE = float(os.getenv('LLM_TOKENS_PER_MINUTE', '90000'))
+    LLM_MAX_RETRIES = int(os.getenv('LLM_MAX_RETRIES', '5'))
+    LLM_BACKOFF_BASE_SECONDS = float(os.getenv('LLM_BACKOFF_BASE_SECONDS', '1'))
+    LLM_BACKOFF_MAX_SECONDS = float(os.getenv('LLM_BACKOFF_MAX_SECONDS', '60'))
+    LLM_REQUEST_TIMEOUT_SECONDS = float(os.getenv('LLM_REQUEST_TIMEOUT_SECONDS', '60'))
+    
+    # 저장된 기사 백그라운드 번역 (주기, 한 번에 처리할 기사 수)
+    TRANSLATION_JOB_ENABLED = os.getenv('TRANSLATION_JOB_ENABLED', 'True').lower() == 'true'
+    TRANSLATION_JOB_INTERVAL_MINUTES = int(os.getenv('TRANSLATION_JOB_INTERVAL_MINUTES', '10'))
+    TRANSLATION_JOB_BATCH_SIZE = int(os.getenv('TRANSLATION_JOB_BATCH_SIZE', '50'))
+    # 작업이 가져간 기사의 임대 시간 (이 안에 끝내지 못하면 다른 작업이 다시 가져감)
+    TRANSLATION_JOB_LEASE_MINUTES = float(os.getenv('TRANSLATION_JOB_LEASE_MINUTES', '30'))
+    # 번역에 실패한 기사는 작업 주기 x 2^(실패 횟수-1) 뒤에 다시 시도 (최대 이 시간)
+    TRANSLATION_RETRY_MAX_HOURS = float(os.getenv('TRANSLATION_RETRY_MAX_HOURS', '24'))
     
     # 웹 서버 설정
     FLASK_DEBUG = os.getenv('FLASK_DEBUG', 'True').lower() == 'true'
@@ -37,7 +93,7 @@ class Config:
     SUMMARY_MAX_LENGTH = int(os.getenv('SUMMARY_MAX_LENGTH', '200'))
     USE_OPENAI_SUMMARIZATION = os.getenv('USE_OPENAI_SUMMARIZATION', 'True').lower() == 'true'
     
-    # 반도체 관련 키워드 (우선순위 계산용)
+    # 반도체 관련 키워드 (크롤러가 관련 기사를 고르고 기사에 걸린 키워드로 저장)
     SEMICONDUCTOR_KEYWORDS = [
         'semiconductor', 'chip', 'processor', 'memory', 'DRAM', 'NAND',
         '반도체', '칩', '프로세서', '메모리', '낸드',
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+크롤러 녹화/재생 도구
+실제 사이트 응답(헤더 + 본문)을 디스크에 녹화하고, 로컬 HTTP 서버로 재생해
+라이브 사이트 없이 크롤러를 측정한다.
+
+    python crawl_fixtures.py record crawl_archive
+    python crawl_fixtures.py replay crawl_archive --port 8765 --latency 0.2 --jitter 0.1
+    python crawl_fixtures.py bench crawl_archive --latency 0.2 --jitter 0.1 --repeat 3
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'manifest.json'
+
+# 녹화하지 않는 헤더 (본문은 압축이 풀린 상태로 저장하므로 길이/인코딩은 재계산)
+_SKIPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'keep-alive'}
+
+
+def replay_url(base_url: str, url: str) -> str:
+    """원래 URL을 재생 서버 주소로 변환 (http://127.0.0.1:port/<scheme>/<host><path>?<query>)"""
+    parsed = urlparse(url)
+    replayed = f"{base_url}/{parsed.scheme}/{parsed.netloc}{parsed.path or '/'}"
+    if parsed.query:
+        replayed += f"?{parsed.query}"
+    return replayed
+
+
+def original_url(path: str) -> Optional[str]:
+    """재생 서버 요청 경로에서 원래 URL 복원"""
+    parts = path.lstrip('/').split('/', 2)
+    if len(parts) < 2 or parts[0] not in ('http', 'https'):
+        return None
+    rest = parts[2] if len(parts) == 3 else ''
+    return f"{parts[0]}://{parts[1]}/{rest}"
+
+
+class FixtureArchive:
+    """URL별 응답을 저장하는 디스크 아카이브 (manifest.json + 본문 파일)"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        manifest = os.path.join(directory, MANIFEST_NAME)
+        if os.path.exists(manifest):
+            with open(manifest, encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def _body_path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def record(self, url: str, status: int, headers, body: bytes):
+        """응답 하나 저장 (같은 URL은 마지막 응답으로 덮어씀)"""
+        name = hashlib.sha1(url.encode('utf-8')).hexdigest()[:20] + '.body'
+        kept = {key: value for key, value in headers.items() if key.lower() not in _SKIPPED_HEADERS}
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._body_path(name), 'wb') as f:
+            f.write(body)
+        with self._lock:
+            self.entries[url] = {'status': status, 'headers': kept, 'body': name}
+
+    def load_body(self, url: str) -> Optional[Dict]:
+        """저장된 응답(status, headers, body bytes) 조회"""
+        entry = self.entries.get(url)
+        if not entry:
+            return None
+        with open(self._body_path(entry['body']), 'rb') as f:
+            return {'status': entry['status'], 'headers': entry['headers'], 'body': f.read()}
+
+    def save(self):
+        """manifest.json 저장"""
+        os.makedirs(self.directory, exist_ok=True)
+        with self._lock:
+            with open(os.path.join(self.directory, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=2)
+
+
+def attach_recorder(crawler, archive: FixtureArchive):
+    """크롤러 세션의 모든 응답을 아카이브에 녹화 (조기 중단 없이 본문 전체를 받음)"""
+    def record(response, *args, **kwargs):
+        if response.status_code == 304:
+            return
+        archive.record(response.url, response.status_code, response.headers, response.content)
+
+    crawler.session.hooks['response'].append(record)
+
+
+class ReplayAdapter(HTTPAdapter):
+    """모든 요청을 재생 서버로 보내는 어댑터 (크롤러에는 원래 URL이 그대로 보임)"""
+
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = base_url.rstrip('/')
+
+    def send(self, request, **kwargs):
+        request.url = replay_url(self.base_url, request.url)
+        return super().send(request, **kwargs)
+
+
+def attach_replay(crawler, base_url: str):
+    """크롤러 세션이 재생 서버로 요청하도록 설정"""
+    adapter = ReplayAdapter(base_url, pool_maxsize=crawler.max_concurrency)
+    crawler.session.mount('http://', adapter)
+    crawler.session.mount('https://', adapter)
+
+
+class ReplayServer:
+    """녹화된 응답을 지연/지터를 섞어 돌려주는 로컬 HTTP 서버"""
+
+    def __init__(self, archive: FixtureArchive, host: str = '127.0.0.1', port: int = 0,
+                 latency: float = 0.0, jitter: float = 0.0):
+        self.archive = archive
+        self.latency = latency
+        self.jitter = jitter
+        self.stats = {'requests': 0, 'bytes': 0, 'missing': 0}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _delay(self) -> float:
+        return max(0.0, self.latency + random.uniform(-self.jitter, self.jitter))
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+            def do_GET(self):
+                time.sleep(server._delay())
+                url = original_url(self.path)
+                entry = server.archive.load_body(url) if url else None
+
+                with server._lock:
+                    server.stats['requests'] += 1
+                    if entry is None:
+                        server.stats['missing'] += 1
+
+                if entry is None:
+                    self.send_error(404, 'not recorded')
+                    return
+
+                headers = entry['headers']
+                etag = next((v for k, v in headers.items() if k.lower() == 'etag'), None)
+                if etag and self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+
+                body = entry['body']
+                self.send_response(entry['status'])
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                with server._lock:
+                    server.stats['bytes'] += len(body)
+
+        return Handler
+
+    def start(self) -> 'ReplayServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _make_crawler(delay: Optional[float]):
+    """DB 상태를 쓰지 않는 크롤러 생성 (매 실행이 같은 조건에서 시작)"""
+    from news_crawler import NewsCrawler
+
+    crawler = NewsCrawler()
+    crawler.set_db_state(False)
+    if delay is not None:
+        crawler.scheduler.default_delay = delay
+    return crawler
+
+
+def record(args) -> int:
+    archive = FixtureArchive(args.archive)
+    crawler = _make_crawler(args.delay)
+    attach_recorder(crawler, archive)
+    articles = crawler.crawl_semiconductor_news(concurrent=not args.sequential)
+    archive.save()
+    print(f"녹화 완료: 응답 {len(archive.entries)}개, 기사 {len(articles)}개 -> {args.archive}")
+    return 0
+
+
+def replay(args) -> int:
+    archive = FixtureArchive(args.archive)
+    server = ReplayServer(archive, port=args.port, latency=args.latency, jitter=args.jitter)
+    print(f"재생 서버 시작: {server.base_url} (응답 {len(archive.entries)}개)")
+    try:
+        server.start()._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+
+def bench(args) -> int:
+    archive = FixtureArchive(args.archive)
+    if not archive.entries:
+        print(f"녹화된 응답이 없습니다: {args.archive}")
+        return 1
+
+    server = ReplayServer(archive, latency=args.latency, jitter=args.jitter).start()
+    mode = '순차' if args.sequential else '동시'
+    print(f"재생 서버 {server.base_url}, 지연 {args.latency}±{args.jitter}초, {mode} 모드")
+    try:
+        for run in range(1, args.repeat + 1):
+            crawler = _make_crawler(args.delay)
+            attach_replay(crawler, server.base_url)
+            before = dict(server.stats)
+
+            started = time.perf_counter()
+            articles = crawler.crawl_semiconductor_news(concurrent=not args.sequential, workers=args.workers)
+            elapsed = time.perf_counter() - started
+
+            requests_made = server.stats['requests'] - before['requests']
+            bytes_sent = server.stats['bytes'] - before['bytes']
+            missing = server.stats['missing'] - before['missing']
+            print(
+                f"[{run}] {elapsed:.2f}초, 요청 {requests_made}건 (미녹화 {missing}건), "
+                f"{bytes_sent:,}B, 기사 {len(articles)}개 ({len(articles) / elapsed if elapsed else 0:.1f}개/초), "
+                f"파싱 {crawler.last_crawl_stats.get('parse_seconds', 0):.2f}초"
+            )
+    finally:
+        server.stop()
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="크롤러 응답 녹화/재생 및 벤치마크")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = sub.add_parser('record', help="실제 사이트를 크롤링하며 응답 녹화")
+    record_parser.add_argument('archive', help="아카이브 디렉터리")
+    record_parser.add_argument('--sequential', action='store_true', help="순차 모드로 크롤링")
+    record_parser.add_argument('--delay', type=float, default=None, help="호스트별 요청 간격(초)")
+
+    replay_parser = sub.add_parser('replay', help="녹화된 응답을 로컬 서버로 재생")
+    replay_parser.add_argument('archive', help="아카이브 디렉터리")
+    replay_parser.add_argument('--port', type=int, default=8765)
+    replay_parser.add_argument('--latency', type=float, default=0.0, help="응답 지연(초)")
+    replay_parser.add_argument('--jitter', type=float, default=0.0, help="지연 편차(초, ±)")
+
+    bench_parser = sub.add_parser('bench', help="재생 서버로 crawl_semiconductor_news 측정")
+    bench_parser.add_argument('archive', help="아카이브 디렉터리")
+    bench_parser.add_argument('--latency', type=float, default=0.0, help="응답 지연(초)")
+    bench_parser.add_argument('--jitter', type=float, default=0.0, help="지연 편차(초, ±)")
+    bench_parser.add_argument('--repeat', type=int, default=1, help="반복 횟수")
+    bench_parser.add_argument('--sequential', action='store_true', help="순차 모드로 크롤링")
+    bench_parser.add_argument('--workers', type=int, default=None, help="파싱 워커 프로세스 수")
+    bench_parser.add_argument('--delay', type=float, default=None,
+                              help="호스트별 요청 간격(초, 기본은 REQUEST_DELAY_SECONDS)")
+    return parser.parse_args()
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.WARNING)
+    args = parse_args()
+    return {'record': record, 'replay': replay, 'bench': bench}[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+"""
+크롤링 프런티어
+발견한 기사 URL을 처리 단계(discovered -> fetched -> analyzed -> stored)와 함께 DB에 저장해
+중단된 실행을 이어서 처리하고, 여러 작업 프로세스가 중복 없이 나눠 처리하도록 함
+"""
+
+import json
+import os
+import socket
+import uuid
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, or_
+
+from config import Config
+from database import get_db_session, CrawlFrontierEntry
+from url_canonical import canonical_url
+
+logger = logging.getLogger(__name__)
+
+DISCOVERED = 'discovered'
+FETCHED = 'fetched'
+ANALYZED = 'analyzed'
+STORED = 'stored'
+FAILED = 'failed'
+DUPLICATE = 'duplicate'  # 이미 처리한 기사의 근접 중복이라 번역/요약 없이 건너뜀
+
+# 처리 실패 후 다시 임대할 수 있을 때까지의 대기 시간 (실패 횟수만큼 늘어남)
+RETRY_BACKOFF_SECONDS = 60
+
+
+class CrawlFrontier:
+    """DB 기반 크롤링 프런티어
+
+    항목은 claim()으로 임대(lease)한 작업자만 다음 단계로 넘길 수 있다.
+    임대는 조건부 UPDATE의 영향 행 수로 확인하므로 여러 프로세스가 동시에
+    claim해도 한 항목은 한 작업자에게만 간다. 작업자가 죽으면 임대가 만료된
+    뒤 다른 작업자가 같은 단계부터 다시 처리한다.
+    """
+
+    def __init__(self, owner: Optional[str] = None, lease_seconds: Optional[int] = None,
+                 max_attempts: Optional[int] = None):
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.lease_seconds = lease_seconds or Config.CRAWL_FRONTIER_LEASE_SECONDS
+        self.max_attempts = max_attempts or Config.CRAWL_FRONTIER_MAX_ATTEMPTS
+
+    def add(self, candidates: List[Dict]) -> int:
+        """기사 후보를 discovered 상태로 추가 (URL이나 정규 URL이 이미 있으면 무시), 새로 추가한 수 반환"""
+        if not candidates:
+            return 0
+        session = get_db_session()
+        try:
+            urls = [candidate['url'] for candidate in candidates]
+            canonicals = [candidate.get('canonical_url') or canonical_url(candidate['url']) for candidate in candidates]
+            existing = set()
+            for row in session.query(CrawlFrontierEntry.url, CrawlFrontierEntry.canonical_url).filter(or_(
+                CrawlFrontierEntry.url.in_(urls),
+                CrawlFrontierEntry.canonical_url.in_(canonicals)
+            )):
+                existing.update((row.url, row.canonical_url))
+            added = 0
+            for candidate, canonical in zip(candidates, canonicals):
+                if candidate['url'] in existing or canonical in existing:
+                    continue
+                existing.update((candidate['url'], canonical))
+                session.add(CrawlFrontierEntry(
+                    url=candidate['url'],
+                    canonical_url=canonical,
+                    source=candidate['source'],
+                    state=DISCOVERED,
+                    title=candidate['title'],
+                    content=candidate.get('content') or '',
+                    published_date=candidate.get('published_date'),
+                    matched_keywords=json.dumps(candidate.get('matched_keywords', []), ensure_ascii=False),
+                    priority=candidate.get('expected_priority', 0.0)
+                ))
+                added += 1
+            session.commit()
+            return added
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _claimable(self, query, now: datetime):
+        # 임대 중이거나 재시도 대기 중인 항목은 lease_expires_at이 지나야 다시 임대 가능
+        return query.filter(or_(
+            CrawlFrontierEntry.lease_expires_at.is_(None),
+            CrawlFrontierEntry.lease_expires_at < now
+        ))
+
+    def claim(self, state: str, limit: int, source: Optional[str] = None) -> List[Dict]:
+        """해당 단계의 항목을 예상 우선순위가 높은 순으로 최대 limit개 임대해서 반환"""
+        now = datetime.utcnow()
+        session = get_db_session()
+        try:
+            query = session.query(CrawlFrontierEntry.id).filter(CrawlFrontierEntry.state == state)
+            if source:
+                query = query.filter(CrawlFrontierEntry.source == source)
+            ids = [row.id for row in self._claimable(query, now).order_by(
+                CrawlFrontierEntry.priority.desc(), CrawlFrontierEntry.id
+            ).limit(limit)]
+
+            claimed = []
+            for entry_id in ids:
+                updated = self._claimable(
+                    session.query(CrawlFrontierEntry).filter(
+                        CrawlFrontierEntry.id == entry_id,
+                        CrawlFrontierEntry.state == state
+                    ),
+                    now
+                ).update({
+                    CrawlFrontierEntry.lease_owner: self.owner,
+                    CrawlFrontierEntry.lease_expires_at: now + timedelta(seconds=self.lease_seconds)
+                }, synchronize_session=False)
+                if updated == 1:
+                    claimed.append(entry_id)
+            session.commit()
+
+            if not claimed:
+                return []
+            entries = session.query(CrawlFrontierEntry).filter(CrawlFrontierEntry.id.in_(claimed)).all()
+            return sorted((entry.to_dict() for entry in entries), key=lambda entry: claimed.index(entry['id']))
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def advance(self, entry_id: int, state: str, **fields) -> bool:
+        """임대한 항목을 다음 단계로 넘기고 임대 해제 (임대를 잃었으면 False)"""
+        values = {getattr(CrawlFrontierEntry, key): value for key, value in fields.items()}
+        values.update({
+            CrawlFrontierEntry.state: state,
+            CrawlFrontierEntry.lease_owner: None,
+            CrawlFrontierEntry.lease_expires_at: None,
+            CrawlFrontierEntry.last_error: None,
+            CrawlFrontierEntry.updated_at: datetime.utcnow()
+        })
+        return self._update_owned(entry_id, values)
+
+    def release(self, entry_id: int, error: Optional[str] = None) -> bool:
+        """처리에 실패한 항목의 임대 해제 - 실패 횟수에 비례해 재시도를 미루고, max_attempts번 실패하면 failed"""
+        session = get_db_session()
+        try:
+            entry = session.query(CrawlFrontierEntry).filter_by(id=entry_id, lease_owner=self.owner).first()
+            if not entry:
+                return False
+            entry.attempts = (entry.attempts or 0) + 1
+            entry.last_error = error
+            entry.lease_owner = None
+            entry.lease_expires_at = datetime.utcnow() + timedelta(seconds=RETRY_BACKOFF_SECONDS * entry.attempts)
+            if entry.attempts >= self.max_attempts:
+                logger.warning(f"프런티어 항목 처리 포기 ({entry.attempts}회 실패): {entry.url}")
+                entry.state = FAILED
+            session.commit()
+            return True
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def unclaim(self, entry_id: int) -> bool:
+        """처리하지 않은 항목의 임대만 해제 (실패 횟수는 늘리지 않음, 예산 초과로 미룬 항목용)"""
+        return self._update_owned(entry_id, {
+            CrawlFrontierEntry.lease_owner: None,
+            CrawlFrontierEntry.lease_expires_at: None
+        })
+
+    def _update_owned(self, entry_id: int, values: Dict) -> bool:
+        session = get_db_session()
+        try:
+            updated = session.query(CrawlFrontierEntry).filter(
+                CrawlFrontierEntry.id == entry_id,
+                CrawlFrontierEntry.lease_owner == self.owner
+            ).update(values, synchronize_session=False)
+            session.commit()
+            if not updated:
+                logger.warning(f"프런티어 항목 {entry_id} 임대가 만료되어 결과를 버립니다")
+            return updated == 1
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def counts(self) -> Dict[str, int]:
+        """단계별 항목 수"""
+        session = get_db_session()
+        try:
+            rows = session.query(CrawlFrontierEntry.state, func.count(CrawlFrontierEntry.id)).group_by(
+                CrawlFrontierEntry.state
+            ).all()
+            return {state: count for state, count in rows}
+        finally:
+            session.close()
+
+    def prune(self, days: Optional[int] = None) -> int:
+        """저장 완료/포기/중복 처리한 오래된 항목 정리"""
+        cutoff = datetime.utcnow() - timedelta(days=days or Config.CRAWL_FRONTIER_RETENTION_DAYS)
+        session = get_db_session()
+        try:
+            deleted = session.query(CrawlFrontierEntry).filter(
+                CrawlFrontierEntry.state.in_([STORED, FAILED, DUPLICATE]),
+                CrawlFrontierEntry.updated_at < cutoff
+            ).delete(synchronize_session=False)
+            session.commit()
+            return deleted
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+
+def entry_to_candidate(entry: Dict) -> Dict:
+    """프런티어 항목을 크롤러 기사 후보 형식으로 변환"""
+    return {
+        'title': entry['title'],
+        'content': entry['content'] or '',
+        'url': entry['url'],
+        'canonical_url': entry.get('canonical_url') or canonical_url(entry['url']),
+        'source': entry['source'],
+        'published_date': entry['published_date'] or datetime.now(),
+        'matched_keywords': entry['matched_keywords'],
+        'expected_priority': entry.get('priority', 0.0),
+        'frontier_id': entry['id']
+    }
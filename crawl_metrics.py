@@ -0,0 +1,202 @@
+"""
+크롤링 실행 계측
+요청마다 대기/응답 시간, 받은 바이트, 파싱 시간, 오류 종류를 소스별로 모아
+실행이 끝나면 crawl_runs / crawl_source_stats 테이블에 저장
+"""
+
+import contextvars
+import json
+import logging
+import math
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import requests
+
+from database import get_db_session, save_crawl_run
+
+logger = logging.getLogger(__name__)
+
+# 지금 처리 중인 소스 이름 (요청/파싱 측정값을 소스별로 나누는 데 사용)
+current_source: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar('crawl_source', default=None)
+
+# 소스를 알 수 없는 요청(공통 robots.txt 등)을 모으는 이름
+UNATTRIBUTED = '(unknown)'
+
+
+@contextmanager
+def attribute(name: str):
+    """블록 안에서 일어난 요청/파싱을 name 소스로 집계"""
+    token = current_source.set(name)
+    try:
+        yield
+    finally:
+        current_source.reset(token)
+
+
+def percentile(values: List[float], fraction: float) -> Optional[float]:
+    """정렬된 값 목록의 백분위수 (nearest-rank, 값이 없으면 None)"""
+    if not values:
+        return None
+    return values[min(len(values), max(1, math.ceil(fraction * len(values)))) - 1]
+
+
+def error_class(error) -> str:
+    """오류를 집계용 이름으로 분류 (HTTP 오류는 상태 코드까지)"""
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return f"HTTP {error.response.status_code}"
+    if isinstance(error, BaseException):
+        return type(error).__name__
+    return str(error)
+
+
+class CrawlMetrics:
+    """크롤링 실행 하나의 소스별 측정값 (여러 스레드에서 동시에 기록 가능)"""
+
+    def __init__(self):
+        self.started_at = datetime.utcnow()
+        self._lock = threading.Lock()
+        self._sources: Dict[str, Dict] = {}
+
+    def _source(self, name: Optional[str]) -> Dict:
+        name = name or current_source.get() or UNATTRIBUTED
+        stats = self._sources.get(name)
+        if stats is None:
+            stats = self._sources[name] = {
+                'latencies': [], 'requests': 0, 'not_modified': 0, 'bytes': 0,
+                'wait_seconds': 0.0, 'fetch_seconds': 0.0, 'parse_seconds': 0.0,
+                'relevant': 0, 'duplicates': 0, 'errors': Counter()
+            }
+        return stats
+
+    def record_request(self, seconds: float, wait_seconds: float = 0.0, size: int = 0,
+                       not_modified: bool = False, error=None, source: Optional[str] = None):
+        """요청 한 건 기록 (seconds: 호스트 대기를 뺀 요청~본문 수신 시간)"""
+        with self._lock:
+            stats = self._source(source)
+            stats['requests'] += 1
+            stats['latencies'].append(seconds)
+            stats['fetch_seconds'] += seconds
+            stats['wait_seconds'] += wait_seconds
+            stats['bytes'] += size
+            if not_modified:
+                stats['not_modified'] += 1
+            if error is not None:
+                stats['errors'][error_class(error)] += 1
+
+    def record_parse(self, seconds: float, source: Optional[str] = None):
+        with self._lock:
+            self._source(source)['parse_seconds'] += seconds
+
+    def count(self, key: str, amount: int = 1, source: Optional[str] = None):
+        """관련 기사(relevant)/중복(duplicates) 수 누적"""
+        with self._lock:
+            self._source(source)[key] += amount
+
+    def source_stats(self, source_results: Dict[str, Dict]) -> List[Dict]:
+        """소스별 요약 (크롤러의 source_results와 합쳐 crawl_source_stats 행 형식으로)"""
+        with self._lock:
+            names = sorted(set(self._sources) | set(source_results))
+            rows = []
+            for name in names:
+                stats = self._source(name)
+                result = source_results.get(name, {})
+                latencies = sorted(stats['latencies'])
+                rows.append({
+                    'source': name,
+                    'requests': stats['requests'],
+                    'not_modified': stats['not_modified'],
+                    'bytes_downloaded': stats['bytes'],
+                    'fetch_p50_ms': self._ms(percentile(latencies, 0.5)),
+                    'fetch_p90_ms': self._ms(percentile(latencies, 0.9)),
+                    'fetch_p99_ms': self._ms(percentile(latencies, 0.99)),
+                    'fetch_max_ms': self._ms(latencies[-1] if latencies else None),
+                    'wait_seconds': round(stats['wait_seconds'], 3),
+                    'fetch_seconds': round(stats['fetch_seconds'], 3),
+                    'parse_seconds': round(stats['parse_seconds'], 3),
+                    'seconds': round(result.get('seconds', 0.0), 3),
+                    'links': result.get('links', 0),
+                    'relevant': stats['relevant'],
+                    'new_articles': result.get('articles', 0),
+                    'duplicates': stats['duplicates'],
+                    'errors': sum(stats['errors'].values()),
+                    'error_classes': dict(stats['errors']),
+                    'last_error': result.get('error'),
+                    'skipped': result.get('skipped', False),
+                    'unfinished': result.get('unfinished', False)
+                })
+            return rows
+
+    @staticmethod
+    def _ms(seconds: Optional[float]) -> Optional[float]:
+        return round(seconds * 1000, 1) if seconds is not None else None
+
+    def save(self, mode: str, articles: int, source_results: Dict[str, Dict], run_stats: Dict,
+             deadline: Optional[float] = None, unfinished_sources: Optional[List[str]] = None) -> Optional[int]:
+        """실행 요약과 소스별 측정값 저장 (실패해도 크롤링 결과에는 영향 없음), 실행 ID 반환"""
+        finished_at = datetime.utcnow()
+        sources = self.source_stats(source_results)
+        run = {
+            'started_at': self.started_at,
+            'finished_at': finished_at,
+            'duration_seconds': round((finished_at - self.started_at).total_seconds(), 3),
+            'mode': mode,
+            'deadline_seconds': deadline,
+            'sources': sum(1 for source in sources if source['source'] != UNATTRIBUTED and not source['skipped']),
+            'requests': sum(source['requests'] for source in sources),
+            'bytes_downloaded': sum(source['bytes_downloaded'] for source in sources),
+            'wait_seconds': round(sum(source['wait_seconds'] for source in sources), 3),
+            'fetch_seconds': round(sum(source['fetch_seconds'] for source in sources), 3),
+            'parse_seconds': round(sum(source['parse_seconds'] for source in sources), 3),
+            'articles': articles,
+            'errors': sum(source['errors'] for source in sources),
+            'unfinished_sources': json.dumps(unfinished_sources or [], ensure_ascii=False),
+            'stats': json.dumps(run_stats, ensure_ascii=False, default=str)
+        }
+        for source in sources:
+            source['error_classes'] = json.dumps(source['error_classes'], ensure_ascii=False)
+            source['skipped'] = int(source['skipped'])
+            source['unfinished'] = int(source['unfinished'])
+        session = get_db_session()
+        try:
+            return save_crawl_run(run, sources, session)
+        except Exception as e:
+            logger.warning(f"크롤링 실행 기록 저장 실패: {str(e)}")
+            session.rollback()
+            return None
+        finally:
+            session.close()
+
+
+def source_trends(runs: List[Dict]) -> List[Dict]:
+    """get_crawl_runs() 결과를 소스별로 합쳐 느린 소스 순으로 정렬 (p90 지연의 중앙값 기준)"""
+    by_source: Dict[str, List[Dict]] = {}
+    for run in runs:
+        for stats in run['source_stats']:
+            if not stats['skipped'] and stats['source'] != UNATTRIBUTED:
+                by_source.setdefault(stats['source'], []).append(stats)
+
+    trends = []
+    for name, rows in by_source.items():
+        p90s = sorted(row['fetch_p90_ms'] for row in rows if row['fetch_p90_ms'] is not None)
+        error_classes = Counter()
+        for row in rows:
+            error_classes.update(row['error_classes'])
+        trends.append({
+            'source': name,
+            'runs': len(rows),
+            'median_fetch_p90_ms': percentile(p90s, 0.5),
+            'avg_seconds': round(sum(row['seconds'] for row in rows) / len(rows), 3),
+            'avg_wait_seconds': round(sum(row['wait_seconds'] for row in rows) / len(rows), 3),
+            'bytes_downloaded': sum(row['bytes_downloaded'] for row in rows),
+            'new_articles': sum(row['new_articles'] for row in rows),
+            'bytes_per_article': (sum(row['bytes_downloaded'] for row in rows) //
+                                  max(sum(row['new_articles'] for row in rows), 1)),
+            'errors': sum(row['errors'] for row in rows),
+            'error_classes': dict(error_classes)
+        })
+    trends.sort(key=lambda trend: trend['median_fetch_p90_ms'] or 0, reverse=True)
+    return trends
@@ -0,0 +1,179 @@
+"""
+호스트별 요청 스케줄러
+도메인마다 토큰 버킷을 두고 robots.txt의 Crawl-delay를 반영
+"""
+
+import contextvars
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+logger = logging.getLogger(__name__)
+
+# robots.txt Crawl-delay 캐시 (프로세스 전역, "scheme://host" -> (지연 초, 조회 시각))
+_robots_cache: Dict[str, Tuple[float, float]] = {}
+_robots_cache_lock = threading.Lock()
+
+# 비동기 엔진이 미리 기다린 호스트 대기 ("scheme://host", 대기 초) - 작업 스레드로 컨텍스트와 함께 전달
+_prepaid_wait: contextvars.ContextVar[Optional[Tuple[str, float]]] = contextvars.ContextVar(
+    'prepaid_host_wait', default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """크롤링 마감 시간이 지나 요청을 보내지 않거나 중단함"""
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 (rate: 초당 토큰 수, capacity: 최대 버스트)"""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self, deadline: Optional[float] = None) -> Optional[float]:
+        """토큰 하나를 예약하고 사용 가능해질 때까지 기다려야 할 시간(초)을 반환
+
+        deadline(time.monotonic() 기준)까지 토큰을 쓸 수 없으면 예약하지 않고 None.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            delay = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+            if deadline is not None and now + delay >= deadline:
+                return None
+            self.tokens -= 1
+            return delay
+
+
+class HostScheduler:
+    """도메인별 토큰 버킷으로 요청 간격을 조절하는 스케줄러
+
+    같은 호스트로 가는 요청만 서로 기다리고, 다른 호스트 요청은 겹쳐서 진행된다.
+    호스트 간격은 default_delay와 robots.txt Crawl-delay 중 큰 값을 사용한다.
+    """
+
+    def __init__(self, session, default_delay: float = 2.0, burst: float = 1.0,
+                 robots_ttl: float = 86400.0):
+        self.session = session
+        self.default_delay = default_delay
+        self.burst = burst
+        self.robots_ttl = robots_ttl
+        self.user_agent = session.headers.get('User-Agent', '*')
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._host_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _host_key(self, url: str) -> str:
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    def _crawl_delay(self, host_key: str) -> float:
+        """캐시된 robots.txt에서 Crawl-delay 조회 (없으면 0)"""
+        now = time.time()
+        with _robots_cache_lock:
+            cached = _robots_cache.get(host_key)
+        if cached and now - cached[1] < self.robots_ttl:
+            return cached[0]
+
+        delay = 0.0
+        try:
+            response = self.session.get(f"{host_key}/robots.txt", timeout=5)
+            if response.status_code == 200:
+                parser = RobotFileParser()
+                parser.parse(response.text.splitlines())
+                delay = float(parser.crawl_delay(self.user_agent) or 0)
+        except Exception as e:
+            logger.debug(f"robots.txt 조회 실패 {host_key}: {str(e)}")
+
+        with _robots_cache_lock:
+            _robots_cache[host_key] = (delay, now)
+        return delay
+
+    def _bucket_for(self, url: str) -> TokenBucket:
+        host_key = self._host_key(url)
+        with self._lock:
+            bucket = self._buckets.get(host_key)
+            if bucket is not None:
+                return bucket
+            host_lock = self._host_locks.setdefault(host_key, threading.Lock())
+
+        # robots.txt 조회는 호스트 단위로만 직렬화
+        with host_lock:
+            with self._lock:
+                bucket = self._buckets.get(host_key)
+            if bucket is None:
+                delay = max(self.default_delay, self._crawl_delay(host_key))
+                bucket = TokenBucket(rate=1.0 / delay if delay > 0 else float('inf'),
+                                     capacity=self.burst)
+                if delay > self.default_delay:
+                    logger.info(f"{host_key} robots.txt Crawl-delay 적용: {delay}초")
+                with self._lock:
+                    self._buckets[host_key] = bucket
+        return bucket
+
+    def reserve(self, url: str, deadline: Optional[float] = None) -> float:
+        """해당 호스트의 토큰을 예약하고 기다려야 할 시간(초)을 반환 (기다리지는 않음)
+
+        deadline(time.monotonic() 기준)을 넘겨서 기다려야 하면 DeadlineExceeded.
+        """
+        bucket = self._bucket_for(url)
+        if bucket.rate == float('inf'):
+            return 0.0
+        # 마감을 넘기는 요청은 토큰을 가져가지 않음 (거절된 요청이 다음 요청 시각을 밀지 않게)
+        delay = bucket.reserve(deadline)
+        if delay is None:
+            raise DeadlineExceeded(f"호스트 대기가 마감 시간을 넘음: {url}")
+        return delay
+
+    def wait(self, url: str, deadline: Optional[float] = None) -> float:
+        """해당 호스트의 토큰을 받을 때까지 대기하고 대기 시간(초)을 반환
+
+        deadline(time.monotonic() 기준)을 넘겨서 기다려야 하면 기다리지 않고 DeadlineExceeded.
+        prepaid()로 이미 기다린 호스트면 한 번은 기다리지 않고 그때 기다린 시간을 반환한다.
+        """
+        prepaid = _prepaid_wait.get()
+        if prepaid is not None and prepaid[0] == self._host_key(url):
+            _prepaid_wait.set(None)
+            return prepaid[1]
+        delay = self.reserve(url, deadline)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def prepaid_seconds(self, url: str) -> float:
+        """prepaid()로 이미 기다렸고 아직 wait()가 쓰지 않은 대기 시간 (요청 시간 측정을 그만큼 앞당길 때)"""
+        prepaid = _prepaid_wait.get()
+        return prepaid[1] if prepaid is not None and prepaid[0] == self._host_key(url) else 0.0
+
+    @contextmanager
+    def prepaid(self, url: str, waited: float):
+        """비동기 엔진이 reserve() 후 이미 기다린 요청 - 블록 안의 첫 wait()(같은 호스트)는 바로 통과"""
+        token = _prepaid_wait.set((self._host_key(url), waited))
+        try:
+            yield
+        finally:
+            _prepaid_wait.reset(token)
+
+    def get(self, url: str, deadline: Optional[float] = None, **kwargs):
+        """호스트 간격을 지켜 GET 요청"""
+        return self.request(url, deadline, **kwargs)[0]
+
+    def request(self, url: str, deadline: Optional[float] = None, **kwargs):
+        """호스트 간격을 지켜 GET 요청하고 (응답, 호스트 대기 시간(초)) 반환
+
+        요청이 실패해도 대기 시간을 알 수 있도록 예외에 host_wait_seconds로 붙여 다시 올린다.
+        """
+        waited = self.wait(url, deadline)
+        try:
+            return self.session.get(url, **kwargs), waited
+        except Exception as e:
+            e.host_wait_seconds = waited
+            raise
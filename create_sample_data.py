@@ -4,7 +4,7 @@
 테스트용 반도체 뉴스 데이터를 데이터베이스에 추가
 """
 
-from database import init_db, NewsArticle, database_session
+from database import init_db, NewsArticle, database_session, find_article_by_url
 from news_analyzer import NewsAnalyzer
 from datetime import datetime, timedelta
 import random
@@ -93,7 +93,7 @@ def insert_sample_data():
     for i, article_data in enumerate(sample_articles):
         try:
             # 중복 체크
-            existing = database_session.query(NewsArticle).filter_by(url=article_data['url']).first()
+            existing = find_article_by_url(article_data['url'], database_session)
             if existing:
                 print(f"기사 {i+1}: 이미 존재함 - {article_data['title'][:50]}...")
                 continue
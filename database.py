@@ -3,12 +3,16 @@
 SQLAlchemy를 사용한 뉴스 기사 데이터 모델
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Float
+from sqlalchemy import (create_engine, inspect, text, exists, Column, Integer, BigInteger, String, Text,
+                        DateTime, Float, func)
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from datetime import datetime
+from sqlalchemy.orm import sessionmaker, aliased
+from datetime import datetime, timedelta
+import json
 import os
 
+from url_canonical import canonical_url
+
 # 데이터베이스 설정
 DATABASE_URL = "sqlite:///./news_database.db"
 engine = create_engine(DATABASE_URL, echo=False)
@@ -17,6 +21,10 @@ database_session = SessionLocal()
 
 Base = declarative_base()
 
+def _default_canonical_url(context):
+    """canonical_url 없이 추가한 행은 url로 정규 URL 계산"""
+    return canonical_url(context.get_current_parameters().get('url'))
+
 class ArticleComment(Base):
     """기사 댓글 테이블"""
     __tablename__ = "article_comments"
@@ -123,7 +131,6 @@ class UserPreferences(Base):
     
     def to_dict(self):
         """객체를 딕셔너리로 변환"""
-        import json
         return {
             'id': self.id,
             'user_id': self.user_id,
@@ -147,17 +154,30 @@ class NewsArticle(Base):
     content = Column(Text, nullable=False)
     summary = Column(Text)
     url = Column(String, unique=True, index=True, nullable=False)
+    canonical_url = Column(String, index=True, default=_default_canonical_url)  # 중복 판단용 정규 URL
     source = Column(String, index=True, nullable=False)
     published_date = Column(DateTime)
     crawled_at = Column(DateTime, default=datetime.utcnow, index=True)  # 성능 개선용 인덱스
     priority_score = Column(Float, default=0.0, index=True)  # 성능 개선용 인덱스
     category = Column(String, default="semiconductor")
+    cluster_id = Column(Integer, index=True)  # 근접 중복 묶음 ID (같은 보도를 다룬 기사끼리 같음)
+    matched_keywords = Column(Text)  # 수집할 때 걸린 반도체 키워드 (JSON 목록)
+    # 번역 전 원문과 언어 (title/content는 화면에 보여줄 한국어 텍스트)
+    original_title = Column(String)
+    original_content = Column(Text)
+    language = Column(String, index=True)  # 'ko' 또는 'en' (NULL이면 아직 확인 전)
+    translated_at = Column(DateTime)  # 영어 기사를 번역해 title/content에 넣은 시각
+    translation_attempts = Column(Integer, default=0)  # 번역에 실패한 횟수
+    # 이 시각 전에는 번역 작업이 가져가지 않음 (작업 중이면 임대 만료 시각, 실패했으면 다시 시도할 시각)
+    translation_retry_at = Column(DateTime, index=True)
     
     def to_dict(self):
         """객체를 딕셔너리로 변환"""
         return {
             'id': self.id,
             'title': self.title,
+            'original_title': self.original_title,
+            'language': self.language,
             'content': self.content,
             'summary': self.summary,
             'url': self.url,
@@ -165,16 +185,396 @@ class NewsArticle(Base):
             'published_date': self.published_date.isoformat() if self.published_date else None,
             'crawled_at': self.crawled_at.isoformat() if self.crawled_at else None,
             'priority_score': self.priority_score,
-            'category': self.category
+            'category': self.category,
+            'cluster_id': self.cluster_id,
+            'matched_keywords': json.loads(self.matched_keywords) if self.matched_keywords else []
         }
     
     def __repr__(self):
         return f"<NewsArticle(title='{self.title[:50]}...', source='{self.source}')>"
 
+class HttpCacheEntry(Base):
+    """조건부 요청(ETag/Last-Modified) 캐시 테이블"""
+    __tablename__ = "http_cache_entries"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    url = Column(String, unique=True, index=True, nullable=False)
+    etag = Column(String)
+    last_modified = Column(String)
+    payload = Column(Text)  # 파싱 결과 JSON
+    content_length = Column(Integer, default=0)  # 원본 응답 크기 (304 절감량 계산용)
+    fetched_at = Column(DateTime, default=datetime.utcnow, index=True)
+    
+    def __repr__(self):
+        return f"<HttpCacheEntry(url='{self.url}', etag='{self.etag}')>"
+
+class CrawlListCursor(Base):
+    """목록 페이지별 증분 크롤링 커서 (가장 최근에 본 기사)"""
+    __tablename__ = "crawl_list_cursors"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    list_url = Column(String, unique=True, index=True, nullable=False)
+    source = Column(String, index=True, nullable=False)
+    newest_url = Column(String)
+    newest_id = Column(BigInteger)  # URL에서 추출한 기사 번호
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def to_dict(self):
+        return {
+            'list_url': self.list_url,
+            'source': self.source,
+            'newest_url': self.newest_url,
+            'newest_id': self.newest_id,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+class ContentSelectorRule(Base):
+    """도메인별로 학습된 기사 본문 선택자"""
+    __tablename__ = "content_selector_rules"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    host = Column(String, unique=True, index=True, nullable=False)
+    selector = Column(String, nullable=False)
+    hits = Column(Integer, default=0)    # 학습된 선택자가 바로 맞은 횟수
+    misses = Column(Integer, default=0)  # 레이아웃 변경 등으로 다시 학습한 횟수
+    uses_since_validation = Column(Integer, default=0)
+    validated_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def to_dict(self):
+        return {
+            'host': self.host,
+            'selector': self.selector,
+            'hits': self.hits or 0,
+            'misses': self.misses or 0,
+            'uses_since_validation': self.uses_since_validation or 0,
+            'validated_at': self.validated_at
+        }
+
+class SourceFeed(Base):
+    """뉴스 소스별로 찾은 RSS/Atom/뉴스 사이트맵 주소 (빈 목록이면 피드 없음으로 확인된 소스)"""
+    __tablename__ = "source_feeds"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    source = Column(String, unique=True, index=True, nullable=False)
+    feed_urls = Column(Text, default='[]')  # JSON 배열
+    kind = Column(String)                   # rss / atom / sitemap
+    discovered_via = Column(String)         # link / path / robots
+    checked_at = Column(DateTime)
+    failures = Column(Integer, default=0)   # 연속으로 피드 요청에 실패한 실행 수
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def to_dict(self):
+        return {
+            'source': self.source,
+            'feed_urls': json.loads(self.feed_urls or '[]'),
+            'kind': self.kind,
+            'discovered_via': self.discovered_via,
+            'checked_at': self.checked_at,
+            'failures': self.failures or 0
+        }
+
+class CrawlSourceState(Base):
+    """뉴스 소스별 크롤링 주기 상태 (새 기사 수/실패율 기반 적응형 스케줄링)"""
+    __tablename__ = "crawl_source_states"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    source = Column(String, unique=True, index=True, nullable=False)
+    interval_minutes = Column(Float, nullable=False)
+    next_due_at = Column(DateTime, index=True)
+    last_crawled_at = Column(DateTime)
+    yield_ewma = Column(Float, default=0.0)    # 실행당 새 기사 수 (지수 이동 평균)
+    failure_ewma = Column(Float, default=0.0)  # 실행 실패율 (지수 이동 평균)
+    runs = Column(Integer, default=0)
+    last_new_articles = Column(Integer, default=0)
+    last_error = Column(Text)
+    
+    # 서킷 브레이커 (closed / open / half_open)
+    breaker_state = Column(String, default='closed')
+    consecutive_failures = Column(Integer, default=0)
+    cooldown_minutes = Column(Float)
+    retry_at = Column(DateTime)
+    breaker_reason = Column(Text)
+    failure_seconds = Column(Float, default=0.0)     # 실패한 실행 한 번에 드는 평균 시간
+    skipped_runs = Column(Integer, default=0)
+    time_saved_seconds = Column(Float, default=0.0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def to_dict(self):
+        return {
+            'source': self.source,
+            'interval_minutes': self.interval_minutes,
+            'next_due_at': self.next_due_at,
+            'last_crawled_at': self.last_crawled_at,
+            'yield_ewma': self.yield_ewma or 0.0,
+            'failure_ewma': self.failure_ewma or 0.0,
+            'runs': self.runs or 0,
+            'last_new_articles': self.last_new_articles or 0,
+            'last_error': self.last_error,
+            'breaker_state': self.breaker_state or 'closed',
+            'consecutive_failures': self.consecutive_failures or 0,
+            'cooldown_minutes': self.cooldown_minutes,
+            'retry_at': self.retry_at,
+            'breaker_reason': self.breaker_reason,
+            'failure_seconds': self.failure_seconds or 0.0,
+            'skipped_runs': self.skipped_runs or 0,
+            'time_saved_seconds': self.time_saved_seconds or 0.0
+        }
+
+class CrawlFrontierEntry(Base):
+    """크롤링 프런티어 (발견한 기사 URL의 처리 단계: discovered -> fetched -> analyzed -> stored)"""
+    __tablename__ = "crawl_frontier"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    url = Column(String, unique=True, index=True, nullable=False)
+    canonical_url = Column(String, index=True, default=_default_canonical_url)  # 중복 판단용 정규 URL
+    source = Column(String, index=True, nullable=False)
+    state = Column(String, index=True, nullable=False, default='discovered')
+    title = Column(Text, nullable=False)
+    content = Column(Text)
+    published_date = Column(DateTime)
+    matched_keywords = Column(Text)  # JSON 형태로 저장
+    priority = Column(Float, index=True, default=0.0)  # 제목만으로 계산한 예상 우선순위 (본문 요청 순서)
+    cluster_id = Column(Integer)  # 근접 중복 묶음 ID (분석 단계에서 지정)
+    
+    # 분석 결과 (번역/요약을 다시 하지 않도록 저장 전까지 보관)
+    translated_title = Column(Text)
+    translated_content = Column(Text)
+    summary = Column(Text)
+    priority_score = Column(Float)
+    article_id = Column(Integer)
+    
+    # 작업자 임대 (여러 프로세스가 같은 항목을 중복 처리하지 않도록)
+    lease_owner = Column(String, index=True)
+    lease_expires_at = Column(DateTime)
+    attempts = Column(Integer, default=0)
+    last_error = Column(Text)
+    discovered_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'url': self.url,
+            'canonical_url': self.canonical_url,
+            'source': self.source,
+            'state': self.state,
+            'title': self.title,
+            'content': self.content,
+            'published_date': self.published_date,
+            'matched_keywords': json.loads(self.matched_keywords) if self.matched_keywords else [],
+            'priority': self.priority or 0.0,
+            'cluster_id': self.cluster_id,
+            'translated_title': self.translated_title,
+            'translated_content': self.translated_content,
+            'summary': self.summary,
+            'priority_score': self.priority_score,
+            'article_id': self.article_id,
+            'attempts': self.attempts or 0
+        }
+
+class NearDuplicateFingerprint(Base):
+    """근접 중복 탐지용 기사 서명 (MinHash, 분석을 마친 기사만)"""
+    __tablename__ = "near_duplicate_signatures"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    url = Column(String, unique=True, index=True, nullable=False)
+    source = Column(String)
+    signature = Column(Text, nullable=False)  # MinHash 값 목록 (JSON)
+    cluster_id = Column(Integer, index=True)  # 묶음에서 처음 색인된 서명의 id
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+class NearDuplicateBand(Base):
+    """근접 중복 후보 조회용 LSH 구간 키 (서명 하나에 구간 수만큼)"""
+    __tablename__ = "near_duplicate_bands"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    fingerprint_id = Column(Integer, index=True, nullable=False)
+    key = Column(BigInteger, index=True, nullable=False)
+
+class LLMCacheEntry(Base):
+    """LLM 응답 캐시 (번역/요약 입력의 SHA-256 -> 응답)"""
+    __tablename__ = "llm_cache_entries"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    key = Column(String(64), unique=True, index=True, nullable=False)
+    kind = Column(String, index=True, nullable=False)  # translation / summary
+    model = Column(String)
+    value = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+class CrawlRun(Base):
+    """크롤링 실행 기록 (전체 요청 수, 바이트, 대기/요청/파싱 시간)"""
+    __tablename__ = "crawl_runs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    started_at = Column(DateTime, index=True, nullable=False)
+    finished_at = Column(DateTime)
+    duration_seconds = Column(Float)
+    mode = Column(String)                  # async / sync
+    deadline_seconds = Column(Float)
+    sources = Column(Integer, default=0)
+    requests = Column(Integer, default=0)
+    bytes_downloaded = Column(BigInteger, default=0)
+    wait_seconds = Column(Float, default=0.0)   # 호스트 간격/robots.txt Crawl-delay 대기
+    fetch_seconds = Column(Float, default=0.0)  # 요청~본문 수신
+    parse_seconds = Column(Float, default=0.0)
+    articles = Column(Integer, default=0)
+    errors = Column(Integer, default=0)
+    unfinished_sources = Column(Text, default='[]')  # JSON 배열
+    stats = Column(Text)                             # 실행 통계 JSON (캐시/예산/마감)
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'duration_seconds': self.duration_seconds,
+            'mode': self.mode,
+            'deadline_seconds': self.deadline_seconds,
+            'sources': self.sources or 0,
+            'requests': self.requests or 0,
+            'bytes_downloaded': self.bytes_downloaded or 0,
+            'wait_seconds': self.wait_seconds or 0.0,
+            'fetch_seconds': self.fetch_seconds or 0.0,
+            'parse_seconds': self.parse_seconds or 0.0,
+            'articles': self.articles or 0,
+            'errors': self.errors or 0,
+            'unfinished_sources': json.loads(self.unfinished_sources or '[]'),
+            'stats': json.loads(self.stats) if self.stats else {}
+        }
+
+class CrawlSourceStat(Base):
+    """크롤링 실행별 소스 측정값 (요청 지연 백분위수, 바이트, 수집량, 오류 종류)"""
+    __tablename__ = "crawl_source_stats"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    run_id = Column(Integer, index=True, nullable=False)
+    source = Column(String, index=True, nullable=False)
+    requests = Column(Integer, default=0)
+    not_modified = Column(Integer, default=0)   # 304 응답 수
+    bytes_downloaded = Column(BigInteger, default=0)
+    fetch_p50_ms = Column(Float)
+    fetch_p90_ms = Column(Float)
+    fetch_p99_ms = Column(Float)
+    fetch_max_ms = Column(Float)
+    wait_seconds = Column(Float, default=0.0)
+    fetch_seconds = Column(Float, default=0.0)
+    parse_seconds = Column(Float, default=0.0)
+    seconds = Column(Float, default=0.0)        # 소스 처리 전체 시간
+    links = Column(Integer, default=0)          # 목록/피드에서 찾은 링크
+    relevant = Column(Integer, default=0)       # 키워드가 맞은 링크
+    new_articles = Column(Integer, default=0)   # 본문까지 수집한 새 기사
+    duplicates = Column(Integer, default=0)     # 이미 저장됐거나 정규 URL이 같은 기사
+    errors = Column(Integer, default=0)
+    error_classes = Column(Text, default='{}')  # JSON {"HTTP 404": 2, "ReadTimeout": 1}
+    last_error = Column(Text)
+    skipped = Column(Integer, default=0)        # 서킷 브레이커로 건너뜀 (Boolean 대체)
+    unfinished = Column(Integer, default=0)     # 마감 시간에 끊김
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    
+    def to_dict(self):
+        return {
+            'run_id': self.run_id,
+            'source': self.source,
+            'requests': self.requests or 0,
+            'not_modified': self.not_modified or 0,
+            'bytes_downloaded': self.bytes_downloaded or 0,
+            'fetch_p50_ms': self.fetch_p50_ms,
+            'fetch_p90_ms': self.fetch_p90_ms,
+            'fetch_p99_ms': self.fetch_p99_ms,
+            'fetch_max_ms': self.fetch_max_ms,
+            'wait_seconds': self.wait_seconds or 0.0,
+            'fetch_seconds': self.fetch_seconds or 0.0,
+            'parse_seconds': self.parse_seconds or 0.0,
+            'seconds': self.seconds or 0.0,
+            'links': self.links or 0,
+            'relevant': self.relevant or 0,
+            'new_articles': self.new_articles or 0,
+            'duplicates': self.duplicates or 0,
+            'errors': self.errors or 0,
+            'error_classes': json.loads(self.error_classes or '{}'),
+            'last_error': self.last_error,
+            'skipped': bool(self.skipped),
+            'unfinished': bool(self.unfinished),
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
+
+def _ensure_columns():
+    """기존 테이블에 모델에 새로 추가된 컬럼이 없으면 추가 (create_all은 기존 테이블을 바꾸지 않음)"""
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                column_type = column.type.compile(dialect=engine.dialect)
+                connection.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                print(f"컬럼 추가: {table.name}.{column.name}")
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=connection, checkfirst=True)
+
+def _backfill_canonical_urls():
+    """정규 URL 컬럼이 비어 있는 기존 행 채우기"""
+    session = SessionLocal()
+    try:
+        filled = 0
+        for model in (NewsArticle, CrawlFrontierEntry):
+            for row in session.query(model).filter(model.canonical_url.is_(None)):
+                row.canonical_url = canonical_url(row.url)
+                filled += 1
+        session.commit()
+        if filled:
+            print(f"정규 URL {filled}개 채움")
+    finally:
+        session.close()
+
+def get_untranslated_articles(session=None, limit=50, unchecked_only=False, claim_minutes=None):
+    """번역이 필요한 기사 조회 (언어 확인 전이거나 아직 번역하지 못한 영어 기사)
+
+    실패 횟수가 적은 기사, 최근 기사부터 가져오고 다시 시도할 시각이 안 된 기사는 건너뛴다.
+    unchecked_only면 언어를 아직 확인하지 않은 기사만 (번역 API를 쓸 수 없을 때).
+    claim_minutes를 주면 가져온 기사의 translation_retry_at을 그만큼 뒤로 미뤄 임대하고 커밋하므로
+    여러 프로세스/스레드에서 번역 작업이 돌아도 같은 기사를 동시에 번역하지 않는다.
+    """
+    if not session:
+        session = database_session
+    now = datetime.utcnow()
+    pending = NewsArticle.language.is_(None)
+    if not unchecked_only:
+        pending = pending | ((NewsArticle.language == 'en') & NewsArticle.translated_at.is_(None))
+    due = NewsArticle.translation_retry_at.is_(None) | (NewsArticle.translation_retry_at <= now)
+    query = session.query(NewsArticle).filter(pending, due).order_by(
+        func.coalesce(NewsArticle.translation_attempts, 0), NewsArticle.crawled_at.desc(), NewsArticle.id.desc()
+    )
+    if claim_minutes is None:
+        return query.limit(limit).all()
+
+    ids = [row.id for row in query.with_entities(NewsArticle.id).limit(limit)]
+    lease_until = now + timedelta(minutes=claim_minutes)
+    claimed = []
+    for article_id in ids:
+        updated = session.query(NewsArticle).filter(NewsArticle.id == article_id, pending, due).update(
+            {NewsArticle.translation_retry_at: lease_until}, synchronize_session=False
+        )
+        if updated == 1:
+            claimed.append(article_id)
+    session.commit()
+    if not claimed:
+        return []
+    articles = session.query(NewsArticle).filter(NewsArticle.id.in_(claimed)).all()
+    return sorted(articles, key=lambda article: claimed.index(article.id))
+
 def init_db():
     """데이터베이스 초기화"""
     print("데이터베이스를 초기화합니다...")
     Base.metadata.create_all(bind=engine)
+    _ensure_columns()
+    _backfill_canonical_urls()
     print("데이터베이스 초기화 완료!")
 
 def get_db_session():
@@ -182,56 +582,204 @@ def get_db_session():
     return SessionLocal()
 
 # 유틸리티 함수들
-def get_articles_by_priority(session=None, limit=10):
-    """우선순위 순으로 기사 조회 (중복 제거)"""
+def collapse_near_duplicates(query):
+    """근접 중복 묶음(cluster_id)마다 가장 먼저 저장된 기사만 남기는 쿼리 필터"""
+    earlier = aliased(NewsArticle)
+    return query.filter(~exists().where(
+        earlier.cluster_id == NewsArticle.cluster_id,
+        earlier.id < NewsArticle.id
+    ))
+
+def get_articles_by_priority(session=None, limit=10, collapse_duplicates=False):
+    """우선순위 순으로 기사 조회 (중복 제거, collapse_duplicates면 근접 중복도 하나로)"""
     if not session:
         session = database_session
-    articles = session.query(NewsArticle).order_by(NewsArticle.priority_score.desc()).limit(limit * 2).all()
-    # URL 기반 중복 제거
+    query = session.query(NewsArticle)
+    if collapse_duplicates:
+        query = collapse_near_duplicates(query)
+    articles = query.order_by(NewsArticle.priority_score.desc()).limit(limit * 2).all()
+    # 정규 URL 기반 중복 제거
     seen_urls = set()
     unique_articles = []
     for article in articles:
-        if article.url not in seen_urls:
-            seen_urls.add(article.url)
+        key = article.canonical_url or article.url
+        if key not in seen_urls:
+            seen_urls.add(key)
             unique_articles.append(article)
             if len(unique_articles) >= limit:
                 break
     return unique_articles
 
-def get_recent_articles(session=None, limit=20):
-    """최근 기사 조회 (중복 제거)"""
+def get_known_article_urls(session=None):
+    """저장된 모든 기사의 정규 URL 집합 조회 (크롤러 중복 요청 방지용)"""
+    if not session:
+        session = database_session
+    return {
+        canonical or canonical_url(url)
+        for url, canonical in session.query(NewsArticle.url, NewsArticle.canonical_url).all()
+    }
+
+def find_article_by_url(url, session=None):
+    """URL 또는 같은 정규 URL로 저장된 기사 조회"""
+    if not session:
+        session = database_session
+    return session.query(NewsArticle).filter(
+        (NewsArticle.url == url) | (NewsArticle.canonical_url == canonical_url(url))
+    ).first()
+
+def get_list_cursors(session=None):
+    """목록 URL별 증분 크롤링 커서 조회"""
+    if not session:
+        session = database_session
+    return {cursor.list_url: cursor.to_dict() for cursor in session.query(CrawlListCursor).all()}
+
+def save_list_cursors(cursors, session=None):
+    """목록 URL별 증분 크롤링 커서 저장 (list_url -> {'source', 'newest_url', 'newest_id'})"""
     if not session:
         session = database_session
-    articles = session.query(NewsArticle).order_by(
+    for list_url, data in cursors.items():
+        cursor = session.query(CrawlListCursor).filter_by(list_url=list_url).first()
+        if not cursor:
+            cursor = CrawlListCursor(list_url=list_url, source=data['source'])
+            session.add(cursor)
+        cursor.newest_url = data['newest_url']
+        cursor.newest_id = data['newest_id']
+        cursor.updated_at = datetime.utcnow()
+    session.commit()
+
+def get_selector_rules(session=None):
+    """도메인별 학습된 본문 선택자 조회"""
+    if not session:
+        session = database_session
+    return {rule.host: rule.to_dict() for rule in session.query(ContentSelectorRule).all()}
+
+def save_selector_rules(rules, session=None):
+    """도메인별 학습된 본문 선택자 저장 (host -> to_dict() 형식)"""
+    if not session:
+        session = database_session
+    for host, data in rules.items():
+        rule = session.query(ContentSelectorRule).filter_by(host=host).first()
+        if not rule:
+            rule = ContentSelectorRule(host=host)
+            session.add(rule)
+        rule.selector = data['selector']
+        rule.hits = data['hits']
+        rule.misses = data['misses']
+        rule.uses_since_validation = data['uses_since_validation']
+        rule.validated_at = data['validated_at']
+    session.commit()
+
+def get_source_feeds(session=None):
+    """뉴스 소스별로 찾은 피드 주소 조회"""
+    if not session:
+        session = database_session
+    return {feed.source: feed.to_dict() for feed in session.query(SourceFeed).all()}
+
+def save_source_feeds(feeds, session=None):
+    """뉴스 소스별 피드 주소 저장 (source -> to_dict() 형식, 일부 필드만 있어도 됨)"""
+    if not session:
+        session = database_session
+    for source, data in feeds.items():
+        feed = session.query(SourceFeed).filter_by(source=source).first()
+        if not feed:
+            feed = SourceFeed(source=source)
+            session.add(feed)
+        for key, value in data.items():
+            if key == 'feed_urls':
+                value = json.dumps(value, ensure_ascii=False)
+            if key != 'source':
+                setattr(feed, key, value)
+    session.commit()
+
+def save_crawl_run(run, source_stats, session=None):
+    """크롤링 실행 기록과 소스별 측정값 저장, 실행 ID 반환"""
+    if not session:
+        session = database_session
+    crawl_run = CrawlRun(**run)
+    session.add(crawl_run)
+    session.flush()
+    for stats in source_stats:
+        session.add(CrawlSourceStat(run_id=crawl_run.id, **stats))
+    session.commit()
+    return crawl_run.id
+
+def get_crawl_runs(limit=20, source=None, session=None):
+    """최근 크롤링 실행 기록 조회 (source를 주면 그 소스의 측정값만 포함)"""
+    if not session:
+        session = database_session
+    runs = session.query(CrawlRun).order_by(CrawlRun.started_at.desc()).limit(limit).all()
+    if not runs:
+        return []
+    query = session.query(CrawlSourceStat).filter(CrawlSourceStat.run_id.in_([run.id for run in runs]))
+    if source:
+        query = query.filter(CrawlSourceStat.source == source)
+    stats_by_run = {}
+    for stats in query.order_by(CrawlSourceStat.source):
+        stats_by_run.setdefault(stats.run_id, []).append(stats.to_dict())
+    return [{**run.to_dict(), 'source_stats': stats_by_run.get(run.id, [])} for run in runs]
+
+def get_source_states(session=None):
+    """뉴스 소스별 크롤링 주기 상태 조회"""
+    if not session:
+        session = database_session
+    return {state.source: state.to_dict() for state in session.query(CrawlSourceState).all()}
+
+def save_source_states(states, session=None):
+    """뉴스 소스별 크롤링 주기 상태 저장 (source -> to_dict() 형식)"""
+    if not session:
+        session = database_session
+    for source, data in states.items():
+        state = session.query(CrawlSourceState).filter_by(source=source).first()
+        if not state:
+            state = CrawlSourceState(source=source)
+            session.add(state)
+        for key, value in data.items():
+            if key != 'source':
+                setattr(state, key, value)
+    session.commit()
+
+def get_recent_articles(session=None, limit=20, collapse_duplicates=False):
+    """최근 기사 조회 (중복 제거, collapse_duplicates면 근접 중복도 하나로)"""
+    if not session:
+        session = database_session
+    query = session.query(NewsArticle)
+    if collapse_duplicates:
+        query = collapse_near_duplicates(query)
+    articles = query.order_by(
         NewsArticle.crawled_at.desc(),
         NewsArticle.id.desc()
     ).limit(limit * 2).all()
-    # URL 기반 중복 제거
+    # 정규 URL 기반 중복 제거
     seen_urls = set()
     unique_articles = []
     for article in articles:
-        if article.url not in seen_urls:
-            seen_urls.add(article.url)
+        key = article.canonical_url or article.url
+        if key not in seen_urls:
+            seen_urls.add(key)
             unique_articles.append(article)
             if len(unique_articles) >= limit:
                 break
     return unique_articles
 
-def search_articles(query, session=None, limit=20):
-    """기사 검색 (중복 제거)"""
+def search_articles(query, session=None, limit=20, collapse_duplicates=False):
+    """기사 검색 (중복 제거, collapse_duplicates면 근접 중복도 하나로)"""
     if not session:
         session = database_session
     articles = session.query(NewsArticle).filter(
         NewsArticle.title.contains(query) | 
         NewsArticle.content.contains(query) |
         NewsArticle.summary.contains(query)
-    ).order_by(NewsArticle.priority_score.desc()).limit(limit * 2).all()
-    # URL 기반 중복 제거
+    )
+    if collapse_duplicates:
+        articles = collapse_near_duplicates(articles)
+    articles = articles.order_by(NewsArticle.priority_score.desc()).limit(limit * 2).all()
+    # 정규 URL 기반 중복 제거
     seen_urls = set()
     unique_articles = []
     for article in articles:
-        if article.url not in seen_urls:
-            seen_urls.add(article.url)
+        key = article.canonical_url or article.url
+        if key not in seen_urls:
+            seen_urls.add(key)
             unique_articles.append(article)
             if len(unique_articles) >= limit:
                 break
@@ -255,8 +803,6 @@ def create_default_preferences(user_id="default", session=None):
     if not session:
         session = database_session
     
-    import json
-    
     default_keywords = [
         "AI", "인공지능", "머신러닝", "deep learning",
         "5nm", "3nm", "2nm", "process technology",
@@ -293,8 +839,6 @@ def update_user_preferences(user_id="default", preferences_data=None, session=No
     if not preferences_data:
         return None
     
-    import json
-    
     prefs = session.query(UserPreferences).filter_by(user_id=user_id).first()
     if not prefs:
         prefs = create_default_preferences(user_id, session)
@@ -326,7 +870,8 @@ def update_user_preferences(user_id="default", preferences_data=None, session=No
     
     return prefs
 
-def get_filtered_articles(user_id="default", session=None, limit=20, sort_by='priority'):
+def get_filtered_articles(user_id="default", session=None, limit=20, sort_by='priority',
+                          collapse_duplicates=False):
     """사용자 설정에 따라 필터링된 기사 조회"""
     if not session:
         session = database_session
@@ -355,6 +900,10 @@ def get_filtered_articles(user_id="default", session=None, limit=20, sort_by='pr
                   NewsArticle.summary.contains(keyword))
             )
     
+    # 근접 중복 묶음은 하나만
+    if collapse_duplicates:
+        query = collapse_near_duplicates(query)
+    
     # 관심 키워드가 있는 경우 우선순위 부스트 (간단한 구현)
     if prefs_dict['interested_keywords']:
         # 실제로는 더 복잡한 스코어링 로직이 필요
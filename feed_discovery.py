@@ -0,0 +1,153 @@
+"""
+피드/사이트맵 탐색
+뉴스 소스의 RSS/Atom 피드와 뉴스 사이트맵 주소를 찾아 저장해, 크롤러가 무거운
+HTML 목록 페이지 대신 작고 발행 시각이 들어 있는 피드를 조건부 GET으로 받게 함
+
+    python feed_discovery.py            # 확인 주기가 지난 소스만 탐색
+    python feed_discovery.py --force    # 모든 소스 다시 탐색
+"""
+
+import argparse
+import logging
+import re
+import sys
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urljoin, urlparse, parse_qs
+
+from html_parsing import feed_document_kind, parse_feed_items, parse_feed_links, parse_sitemap_index
+
+logger = logging.getLogger(__name__)
+
+# 흔한 피드 경로 (/rss/allArticle.xml은 국내 언론사 CMS의 전체 기사 피드)
+COMMON_FEED_PATHS = ['/rss/allArticle.xml', '/feed', '/rss', '/rss.xml', '/feed.xml', '/atom.xml', '/index.xml']
+
+# robots.txt에서 확인할 사이트맵/하위 사이트맵 최대 수
+MAX_SITEMAPS = 3
+
+_SITEMAP_LINE_RE = re.compile(r'^\s*sitemap\s*:\s*(\S+)', re.I | re.M)
+
+
+def _site_root(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+class FeedDiscovery:
+    """소스 하나의 피드 주소를 요청이 적은 방법부터 차례로 찾는다
+
+    1. 목록 URL의 섹션 코드로 만든 섹션 피드 (/rss/S1N3.xml)
+    2. 목록 페이지/홈페이지의 <link rel="alternate"> 피드
+    3. 흔한 피드 경로 (선택자 소스는 WordPress 분류 피드 {url}/feed/ 먼저)
+    4. robots.txt의 Sitemap: 항목 중 뉴스 사이트맵
+    항목이 하나 이상 있는 RSS/Atom/뉴스 사이트맵을 찾으면 그 단계에서 멈춘다.
+    fetch는 URL을 받아 200 응답 본문(bytes)을, 실패하면 None을 돌려줘야 한다.
+    """
+
+    def __init__(self, fetch: Callable[[str], Optional[bytes]]):
+        self.fetch = fetch
+
+    def discover(self, source: Dict) -> Dict:
+        """소스의 피드 주소 탐색 - {'feed_urls', 'kind', 'discovered_via'} (못 찾으면 feed_urls가 빈 목록)"""
+        pages = list(source.get('list_urls') or []) or ([source['url']] if source.get('url') else [])
+        if not pages:
+            return {'feed_urls': [], 'kind': None, 'discovered_via': None}
+        root = _site_root(pages[0])
+
+        section_feeds = self._section_feeds(pages)
+        if section_feeds:
+            kinds = [self._validate(url) for url in section_feeds]
+            if all(kinds):
+                return {'feed_urls': section_feeds, 'kind': kinds[0], 'discovered_via': 'path'}
+
+        for page in (pages[0], root + '/'):
+            body = self.fetch(page)
+            if not body:
+                continue
+            for url in parse_feed_links(body, page):
+                if 'comment' in url.lower():
+                    continue  # WordPress 댓글 피드
+                kind = self._validate(url)
+                if kind:
+                    return {'feed_urls': [url], 'kind': kind, 'discovered_via': 'link'}
+
+        paths = [root + path for path in COMMON_FEED_PATHS]
+        if source.get('selector') and urlparse(source['url']).path.strip('/'):
+            paths.insert(0, source['url'].rstrip('/') + '/feed/')
+        for url in paths:
+            kind = self._validate(url)
+            if kind:
+                return {'feed_urls': [url], 'kind': kind, 'discovered_via': 'path'}
+
+        for url in self._news_sitemaps(root):
+            return {'feed_urls': [url], 'kind': 'sitemap', 'discovered_via': 'robots'}
+
+        return {'feed_urls': [], 'kind': None, 'discovered_via': None}
+
+    def _section_feeds(self, list_urls: List[str]) -> List[str]:
+        """국내 언론사 CMS 목록 URL(sc_section_code=S1N3)에 대응하는 섹션 피드 주소"""
+        feeds = []
+        for list_url in list_urls:
+            codes = parse_qs(urlparse(list_url).query).get('sc_section_code')
+            if not codes:
+                return []
+            feed = f"{_site_root(list_url)}/rss/{codes[0]}.xml"
+            if feed not in feeds:
+                feeds.append(feed)
+        return feeds
+
+    def _validate(self, url: str) -> Optional[str]:
+        """피드 주소가 항목이 있는 RSS/Atom/뉴스 사이트맵이면 종류 반환"""
+        body = self.fetch(url)
+        if not body:
+            return None
+        kind = feed_document_kind(body)
+        if kind not in ('rss', 'atom', 'sitemap'):
+            return None
+        return kind if parse_feed_items(body) else None
+
+    def _news_sitemaps(self, root: str):
+        """robots.txt에 적힌 사이트맵 중 기사 제목이 들어 있는 뉴스 사이트맵 주소 (찾는 대로 반환)"""
+        body = self.fetch(root + '/robots.txt')
+        if not body:
+            return
+        sitemaps = _SITEMAP_LINE_RE.findall(body.decode('utf-8', errors='replace'))
+        # 이름에 news가 들어간 사이트맵을 먼저 확인
+        sitemaps.sort(key=lambda url: 'news' not in url.lower())
+        for sitemap in sitemaps[:MAX_SITEMAPS]:
+            sitemap = urljoin(root, sitemap)
+            sitemap_body = self.fetch(sitemap)
+            if not sitemap_body:
+                continue
+            kind = feed_document_kind(sitemap_body)
+            if kind == 'sitemap' and parse_feed_items(sitemap_body):
+                yield sitemap
+            elif kind == 'sitemapindex':
+                children = [child for child in parse_sitemap_index(sitemap_body) if 'news' in child.lower()]
+                for child in children[:MAX_SITEMAPS]:
+                    if self._validate(child) == 'sitemap':
+                        yield child
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="뉴스 소스 피드/사이트맵 탐색")
+    parser.add_argument('--force', action='store_true', help="확인 주기와 관계없이 모든 소스 다시 탐색")
+    parser.add_argument('--source', action='append', help="탐색할 소스 이름 (여러 번 지정 가능)")
+    return parser.parse_args()
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    args = parse_args()
+    from database import init_db
+    from news_crawler import NewsCrawler
+    init_db()
+    crawler = NewsCrawler()
+    feeds = crawler.refresh_feeds(names=args.source, force=args.force)
+    for name, feed in sorted(feeds.items()):
+        found = ', '.join(feed['feed_urls']) if feed['feed_urls'] else "없음 (HTML 목록 사용)"
+        print(f"{name}: {found}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
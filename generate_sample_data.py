@@ -6,7 +6,7 @@
 
 from datetime import datetime, timedelta
 import random
-from database import init_db, NewsArticle, get_db_session
+from database import init_db, NewsArticle, get_db_session, find_article_by_url
 from news_analyzer import NewsAnalyzer
 
 # 샘플 뉴스 데이터
@@ -105,7 +105,7 @@ def create_sample_data():
     
     for article_data in sample_articles:
         # 중복 체크
-        existing = session.query(NewsArticle).filter_by(url=article_data['url']).first()
+        existing = find_article_by_url(article_data['url'], session)
         if existing:
             continue
         
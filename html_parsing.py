@@ -0,0 +1,375 @@
+"""
+HTML 파싱 계층
+lxml이 있으면 lxml로, 없으면 html.parser로 파싱하고
+SoupStrainer로 필요한 요소만 트리로 만든다
+"""
+
+import re
+import sys
+import time
+import logging
+from functools import lru_cache
+from html import unescape
+from typing import Dict, List, Optional
+from urllib.parse import urljoin
+import xml.etree.ElementTree as ET
+
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+logger = logging.getLogger(__name__)
+
+# 일반적인 기사 내용 선택자들 (우선순위 순)
+CONTENT_SELECTORS = [
+    '.entry-content',
+    '.article-content',
+    '.post-content',
+    '.content',
+    '.article-body',
+    'main article',
+    '[class*="content"]'
+]
+
+_CONTENT_CLASS_RE = re.compile(r'content|article-body')
+_CANONICAL_REL_RE = re.compile(r'^canonical$', re.IGNORECASE)
+
+
+def _is_content_candidate(name, attrs=None) -> bool:
+    """기사 본문 후보 요소인지 판단 (SoupStrainer 필터, 정규 URL용 link/meta 포함)"""
+    if name in ('p', 'main'):
+        return True
+    if name == 'link':
+        rel = (attrs or {}).get('rel') or ''
+        if isinstance(rel, (list, tuple)):
+            rel = ' '.join(rel)
+        return 'canonical' in rel.lower()
+    if name == 'meta':
+        return (attrs or {}).get('property') == 'og:url'
+    class_attr = (attrs or {}).get('class') or ''
+    if isinstance(class_attr, (list, tuple)):
+        class_attr = ' '.join(class_attr)
+    return bool(_CONTENT_CLASS_RE.search(class_attr))
+
+
+def is_content_container(attrs) -> bool:
+    """본문 선택자(class에 content/article-body)에 걸리는 요소인지 - attrs는 {속성: 값}"""
+    return bool(_CONTENT_CLASS_RE.search((attrs or {}).get('class') or ''))
+
+
+ANCHOR_STRAINER = SoupStrainer('a', href=True)
+CONTENT_STRAINER = SoupStrainer(_is_content_candidate)
+
+
+@lru_cache(maxsize=256)
+def compiled_selector(selector: str):
+    """CSS 선택자를 한 번만 컴파일해서 재사용"""
+    return soupsieve.compile(selector)
+
+
+def make_soup(body, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """설정된 파서로 BeautifulSoup 생성"""
+    return BeautifulSoup(body, HTML_PARSER, parse_only=parse_only)
+
+
+def collect_text(elements, limit: int) -> str:
+    """요소들의 텍스트를 이어 붙이되 limit 글자를 넘으면 더 보지 않음"""
+    parts = []
+    total = 0
+    for elem in elements:
+        text = elem.get_text(strip=True)
+        parts.append(text)
+        total += len(text) + 1
+        if total >= limit:
+            break
+    return ' '.join(parts)
+
+
+def parse_list_links(body: bytes, list_url: str, link_pattern: Optional[str] = None,
+                     link_regex: Optional[str] = None) -> List[Dict]:
+    """목록 페이지에서 링크 패턴에 맞는 기사 링크(제목, URL) 추출 - <a href>만 파싱"""
+    links = []
+    seen_urls = set()
+    soup = make_soup(body, ANCHOR_STRAINER)
+
+    for anchor in soup.find_all('a'):
+        href = anchor.get('href', '').strip()
+        if not href:
+            continue
+
+        if href.startswith('/'):
+            href = urljoin(list_url, href)
+
+        if link_pattern and link_pattern not in href:
+            continue
+
+        if link_regex and not re.search(link_regex, href):
+            continue
+
+        if href in seen_urls:
+            continue
+
+        title = anchor.get_text(strip=True)
+        if not title or len(title) < 5:
+            continue
+
+        seen_urls.add(href)
+        links.append({'title': title, 'url': href})
+
+    return links
+
+
+def parse_selector_links(body: bytes, base_url: str, selector: Dict, limit: int) -> List[Dict]:
+    """선택자 기반 소스 페이지에서 기사 링크(제목, URL) 추출"""
+    links = []
+    soup = make_soup(body)
+
+    article_elements = compiled_selector(selector['articles']).select(soup, limit=limit)
+    title_selector = compiled_selector(selector['title'])
+    link_selector = compiled_selector(selector['link']) if selector.get('link') else None
+
+    for element in article_elements:
+        # 제목 추출
+        title_elem = title_selector.select_one(element)
+        if not title_elem:
+            continue
+        title = title_elem.get_text(strip=True)
+
+        # 링크 추출 (링크 선택자가 비어 있으면 요소 자체가 링크)
+        link_elem = link_selector.select_one(element) if link_selector else element
+        if not link_elem:
+            continue
+
+        link = link_elem.get('href', '')
+        if link.startswith('/'):
+            link = urljoin(base_url, link)
+
+        links.append({'title': title, 'url': link})
+
+    return links
+
+
+FEED_LINK_TYPES = ('application/rss+xml', 'application/atom+xml')
+SITEMAP_NS = {
+    'sm': 'http://www.sitemaps.org/schemas/sitemap/0.9',
+    'news': 'http://www.google.com/schemas/sitemap-news/0.9'
+}
+_FEED_ROOT_RE = re.compile(rb'^\s*(?:<\?xml[^>]*>\s*)?(?:<!--.*?-->\s*|<\?xml-stylesheet[^>]*>\s*)*'
+                           rb'<(?:[\w-]+:)?(rss|feed|RDF|urlset|sitemapindex)\b', re.S)
+
+
+def feed_document_kind(body) -> Optional[str]:
+    """본문이 RSS/Atom/사이트맵 XML이면 종류('rss', 'atom', 'sitemap', 'sitemapindex'), 아니면 None"""
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    match = _FEED_ROOT_RE.match(body.removeprefix(b'\xef\xbb\xbf')[:2048])
+    if not match:
+        return None
+    return {'rss': 'rss', 'RDF': 'rss', 'feed': 'atom', 'urlset': 'sitemap'}.get(match.group(1).decode(),
+                                                                                  'sitemapindex')
+
+
+def parse_feed_links(body: bytes, base_url: str) -> List[str]:
+    """HTML <head>의 <link rel="alternate" type="application/rss+xml|atom+xml"> 피드 주소 목록"""
+    soup = make_soup(body, parse_only=SoupStrainer('link', href=True))
+    links = []
+    for link in soup.find_all('link'):
+        rel = [value.lower() for value in (link.get('rel') or [])]
+        if 'alternate' in rel and (link.get('type') or '').lower() in FEED_LINK_TYPES:
+            url = urljoin(base_url, link['href'].strip())
+            if url not in links:
+                links.append(url)
+    return links
+
+
+def parse_sitemap_index(xml_text) -> List[str]:
+    """사이트맵 인덱스에서 하위 사이트맵 주소 목록 추출"""
+    try:
+        root = ET.fromstring(xml_text)
+    except ET.ParseError:
+        return []
+    return [loc.text.strip() for loc in root.findall('sm:sitemap/sm:loc', SITEMAP_NS) if loc.text]
+
+
+def _parse_news_sitemap(root) -> List[Dict]:
+    """뉴스 사이트맵(<news:news>)의 기사 목록 (제목이 없는 일반 사이트맵 항목은 제외)"""
+    items = []
+    for url in root.findall('sm:url', SITEMAP_NS):
+        link = (url.findtext('sm:loc', default='', namespaces=SITEMAP_NS) or '').strip()
+        title = (url.findtext('news:news/news:title', default='', namespaces=SITEMAP_NS) or '').strip()
+        if not title or not link:
+            continue
+        items.append({
+            'title': unescape(title),
+            'link': link,
+            'description': '',  # 사이트맵에는 본문 요약이 없음 (키워드는 관련성 판단에만)
+            'keywords': (url.findtext('news:news/news:keywords', default='', namespaces=SITEMAP_NS) or '').strip(),
+            'pub_date': (url.findtext('news:news/news:publication_date', default='',
+                                      namespaces=SITEMAP_NS) or '').strip()
+        })
+    return items
+
+
+def parse_feed_items(xml_text) -> List[Dict]:
+    """RSS/Atom/뉴스 사이트맵 XML(str 또는 bytes)에서 기사 목록 추출"""
+    items = []
+    try:
+        root = ET.fromstring(xml_text)
+    except ET.ParseError as e:
+        logger.error(f"RSS XML 파싱 실패: {str(e)}")
+        return items
+
+    if root.tag == f"{{{SITEMAP_NS['sm']}}}urlset":
+        return _parse_news_sitemap(root)
+
+    # RSS 2.0 형태 (RSS 1.0/RDF는 item이 channel 밖에 있음)
+    channel = root.find('channel')
+    rdf_items = root.findall('{http://purl.org/rss/1.0/}item')
+    if channel is not None or rdf_items:
+        rdf = '{http://purl.org/rss/1.0/}'
+        for item in (channel.findall('item') if channel is not None else rdf_items):
+            title = (item.findtext('title') or item.findtext(f'{rdf}title') or '').strip()
+            link = (item.findtext('link') or item.findtext(f'{rdf}link') or '').strip()
+            description = (item.findtext('description') or item.findtext(f'{rdf}description') or '').strip()
+            pub_date = (item.findtext('pubDate') or
+                        item.findtext('{http://purl.org/dc/elements/1.1/}date') or '').strip()
+
+            if not title or not link:
+                continue
+
+            items.append({
+                'title': unescape(title),
+                'link': link,
+                'description': description,
+                'pub_date': pub_date
+            })
+        return items
+
+    # Atom 형태
+    ns = {'atom': 'http://www.w3.org/2005/Atom'}
+    for entry in root.findall('atom:entry', ns):
+        title = entry.findtext('atom:title', default='', namespaces=ns).strip()
+        link_elems = entry.findall('atom:link', ns)
+        link_elem = next((elem for elem in link_elems if elem.get('rel', 'alternate') == 'alternate'),
+                         link_elems[0] if link_elems else None)
+        link = link_elem.get('href', '').strip() if link_elem is not None else ''
+        summary = entry.findtext('atom:summary', default='', namespaces=ns).strip()
+        updated = (entry.findtext('atom:published', default='', namespaces=ns) or
+                   entry.findtext('atom:updated', default='', namespaces=ns)).strip()
+
+        if not title or not link:
+            continue
+
+        items.append({
+            'title': unescape(title),
+            'link': link,
+            'description': summary,
+            'pub_date': updated
+        })
+
+    return items
+
+
+def _select_content(soup, selector: str):
+    """본문 선택자 하나 적용 ('p'는 백업 규칙: 모든 p 태그)"""
+    if selector == 'p':
+        return soup.find_all('p')
+    return compiled_selector(selector).select(soup)
+
+
+def extract_article(body: bytes, max_chars: int = 5000, preferred_selector: Optional[str] = None,
+                    revalidate: bool = False) -> Dict:
+    """기사 페이지에서 본문 텍스트와 실제로 맞은 선택자 추출 - 본문 후보 요소만 파싱
+
+    preferred_selector(도메인별로 학습된 선택자)가 있으면 먼저 시도하고,
+    맞지 않거나 revalidate가 True면 전체 선택자 목록을 순서대로 확인한다.
+    반환값: {'content': 본문, 'selector': 맞은 선택자 ('p'는 백업 규칙, 없으면 ''),
+             'canonical': <link rel=canonical> 또는 og:url 주소 (없으면 '')}
+    """
+    soup = make_soup(body, CONTENT_STRAINER)
+    canonical = canonical_link(soup)
+
+    if preferred_selector and not revalidate:
+        elements = _select_content(soup, preferred_selector)
+        if elements:
+            content = collect_text(elements, max_chars)
+            if content:
+                return {'content': content[:max_chars], 'selector': preferred_selector, 'canonical': canonical}
+
+    content = ""
+    matched = ''
+    for selector in CONTENT_SELECTORS:
+        elements = _select_content(soup, selector)
+        if elements:
+            content = collect_text(elements, max_chars)
+            matched = selector
+            break
+
+    if not content:
+        # 백업: 모든 p 태그에서 텍스트 추출
+        content = collect_text(_select_content(soup, 'p'), max_chars)
+        matched = 'p' if content else ''
+
+    return {'content': content[:max_chars], 'selector': matched, 'canonical': canonical}
+
+
+def canonical_link(soup) -> str:
+    """페이지가 밝힌 정규 URL (<link rel=canonical>, 없으면 og:url)"""
+    # 본문 안의 다른 <link>/<meta>(preload, itemprop 등)는 정규 URL이 아님
+    link = soup.find('link', rel=_CANONICAL_REL_RE, href=True)
+    if link is not None and link['href'].strip():
+        return link['href'].strip()
+    meta = soup.find('meta', property='og:url', content=True)
+    return meta['content'].strip() if meta is not None else ''
+
+
+def extract_article_text(body: bytes, max_chars: int = 5000) -> str:
+    """기사 페이지에서 본문 텍스트 추출"""
+    return extract_article(body, max_chars)['content']
+
+
+def _legacy_extract_article_text(body: bytes, max_chars: int = 5000) -> str:
+    """비교용: 전체 트리를 html.parser로 만들고 매번 선택자를 해석하는 기존 방식"""
+    soup = BeautifulSoup(body, 'html.parser')
+    content = ""
+    for selector in CONTENT_SELECTORS:
+        elements = soup.select(selector)
+        if elements:
+            content = ' '.join(elem.get_text(strip=True) for elem in elements)
+            break
+    if not content:
+        content = ' '.join(p.get_text(strip=True) for p in soup.find_all('p'))
+    return content[:max_chars]
+
+
+def benchmark(paths: List[str], repeat: int = 5):
+    """저장된 HTML 파일로 기존 방식과 현재 파싱 계층의 본문 추출 시간 비교"""
+    bodies = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            bodies.append(f.read())
+
+    def run(func) -> float:
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for body in bodies:
+                func(body)
+        return time.perf_counter() - started
+
+    legacy = run(_legacy_extract_article_text)
+    current = run(extract_article_text)
+    print(f"파서: {HTML_PARSER}, 파일 {len(bodies)}개 x {repeat}회")
+    print(f"기존 방식: {legacy:.3f}초")
+    print(f"현재 방식: {current:.3f}초 ({legacy / current if current else 0:.1f}배)")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python html_parsing.py <기사 HTML 파일>...")
+        sys.exit(1)
+    benchmark(sys.argv[1:])
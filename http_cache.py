@@ -0,0 +1,142 @@
+"""
+조건부 요청(ETag / Last-Modified) 캐시
+URL별 검증자와 파싱 결과를 DB에 저장하고 304 응답 시 재사용
+"""
+
+import json
+import threading
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from database import get_db_session, HttpCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+class HttpValidatorCache:
+    """URL 기준 HTTP 검증자 캐시
+
+    실행 시작 시 DB에서 한 번에 읽어 메모리에 두고, 크롤링이 끝나면
+    변경된 항목만 저장한다. ETag/Last-Modified가 없는 응답은 저장하지 않는다.
+    persistent가 False면 DB를 읽거나 쓰지 않고 메모리에서만 동작한다.
+    """
+
+    def __init__(self, max_age_days: int = 30, persistent: bool = True):
+        self.max_age_days = max_age_days
+        self.persistent = persistent
+        self._entries: Dict[str, Dict] = {}
+        self._dirty = set()
+        self._loaded = False
+        self._lock = threading.Lock()
+        self.stats = {
+            'requests': 0,
+            'not_modified': 0,
+            'bytes_downloaded': 0,
+            'bytes_saved': 0
+        }
+
+    def load(self):
+        """DB에서 캐시 항목 로드 (한 번만 수행)"""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            if not self.persistent:
+                return
+            session = get_db_session()
+            try:
+                for entry in session.query(HttpCacheEntry).all():
+                    self._entries[entry.url] = {
+                        'etag': entry.etag,
+                        'last_modified': entry.last_modified,
+                        'payload': entry.payload,
+                        'content_length': entry.content_length or 0,
+                        'fetched_at': entry.fetched_at
+                    }
+                logger.info(f"HTTP 캐시 {len(self._entries)}개 항목 로드")
+            except Exception as e:
+                logger.warning(f"HTTP 캐시 로드 실패 (캐시 없이 진행): {str(e)}")
+            finally:
+                session.close()
+
+    def request_headers(self, url: str) -> Dict[str, str]:
+        """저장된 검증자로 조건부 요청 헤더 생성"""
+        self.load()
+        with self._lock:
+            entry = self._entries.get(url)
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def not_modified(self, url: str) -> Optional[Any]:
+        """304 응답 처리 - 캐시된 파싱 결과를 반환 (없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if not entry or entry.get('payload') is None:
+                return None
+            entry['fetched_at'] = datetime.utcnow()
+            self._dirty.add(url)
+            self.stats['requests'] += 1
+            self.stats['not_modified'] += 1
+            self.stats['bytes_saved'] += entry.get('content_length', 0)
+            payload = entry['payload']
+        return json.loads(payload)
+
+    def store(self, url: str, headers, content_length: int, parsed: Any):
+        """200 응답의 검증자와 파싱 결과 저장"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+
+        with self._lock:
+            self.stats['requests'] += 1
+            self.stats['bytes_downloaded'] += content_length
+            if not etag and not last_modified:
+                return
+            self._entries[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'payload': json.dumps(parsed, ensure_ascii=False),
+                'content_length': content_length,
+                'fetched_at': datetime.utcnow()
+            }
+            self._dirty.add(url)
+
+    def save(self):
+        """변경된 항목을 DB에 저장하고 오래된 항목 정리"""
+        with self._lock:
+            if not self._loaded or not self.persistent:
+                return
+            dirty = {url: dict(self._entries[url]) for url in self._dirty if url in self._entries}
+            self._dirty.clear()
+
+        session = get_db_session()
+        try:
+            for url, data in dirty.items():
+                entry = session.query(HttpCacheEntry).filter_by(url=url).first()
+                if not entry:
+                    entry = HttpCacheEntry(url=url)
+                    session.add(entry)
+                entry.etag = data['etag']
+                entry.last_modified = data['last_modified']
+                entry.payload = data['payload']
+                entry.content_length = data['content_length']
+                entry.fetched_at = data['fetched_at']
+
+            cutoff = datetime.utcnow() - timedelta(days=self.max_age_days)
+            session.query(HttpCacheEntry).filter(HttpCacheEntry.fetched_at < cutoff).delete()
+            session.commit()
+        except Exception as e:
+            logger.warning(f"HTTP 캐시 저장 실패: {str(e)}")
+            session.rollback()
+        finally:
+            session.close()
+
+    def summary(self) -> str:
+        """절감 통계 요약 문자열"""
+        return (f"요청 {self.stats['requests']}건 중 304 재사용 {self.stats['not_modified']}건, "
+                f"다운로드 {self.stats['bytes_downloaded']:,}B, 절감 {self.stats['bytes_saved']:,}B")
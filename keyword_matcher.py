@@ -0,0 +1,91 @@
+"""
+키워드 매칭 모듈
+Aho-Corasick 오토마톤으로 여러 키워드를 텍스트 한 번 순회로 찾음
+"""
+
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+
+class KeywordMatcher:
+    """대소문자를 구분하지 않는 다중 키워드 매처
+
+    결과는 키워드마다 `keyword.lower() in text.lower()`를 검사한 것과 같고,
+    텍스트 길이에 비례한 한 번의 순회로 모든 키워드를 찾는다.
+    포함 여부만 필요한 matches()는 같은 키워드로 만든 정규식 한 번으로 검사한다.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        seen = set()
+        for keyword in keywords:
+            pattern = keyword.lower()
+            if not pattern or pattern in seen:
+                continue
+            seen.add(pattern)
+            self.keywords.append(keyword)
+            self._add(pattern, len(self.keywords) - 1)
+        self._build()
+        self._any = re.compile('|'.join(re.escape(pattern) for pattern in seen)) if seen else None
+
+    def _add(self, pattern: str, index: int):
+        """트라이에 키워드 추가"""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] = self._output[state] + (index,)
+
+    def _build(self):
+        """실패 링크 계산 (너비 우선)"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                candidate = self._goto[fail].get(char, 0)
+                self._fail[next_state] = candidate if candidate != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def _scan(self, text: str):
+        """텍스트를 한 번 순회하며 매칭된 키워드 번호를 차례로 반환"""
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                yield from output[state]
+
+    def find_all(self, text: str) -> List[str]:
+        """텍스트에 들어 있는 키워드 목록 (키워드 등록 순서, 중복 없음)"""
+        if not text or not self.keywords:
+            return []
+        found = set()
+        for index in self._scan(text):
+            found.add(index)
+            if len(found) == len(self.keywords):
+                break
+        return [self.keywords[index] for index in sorted(found)]
+
+    def matches(self, text: str) -> bool:
+        """키워드가 하나라도 있으면 True (첫 매칭에서 중단)"""
+        if not text or self._any is None:
+            return False
+        return self._any.search(text.lower()) is not None
+
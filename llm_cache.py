@@ -0,0 +1,170 @@
+"""
+LLM 응답 캐시
+같은 입력(텍스트, 모델, 프롬프트 버전)에 대한 OpenAI 응답을 DB에 저장하고
+프로세스 안에서는 LRU로 먼저 찾아, 같은 번역/요약을 다시 요청하지 않게 함
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy.exc import IntegrityError
+
+from config import Config
+from database import get_db_session, LLMCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+class _LRU:
+    """스레드 안전 LRU (키 -> 응답 문자열)"""
+
+    def __init__(self, max_items: int):
+        self.max_items = max_items
+        self._items: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: str):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+# 종류별 LRU는 프로세스 전역 (요청마다 분석기를 새로 만들어도 공유)
+_lrus: Dict[str, _LRU] = {}
+_lrus_lock = threading.Lock()
+
+
+def _lru_for(kind: str) -> _LRU:
+    with _lrus_lock:
+        lru = _lrus.get(kind)
+        if lru is None:
+            lru = _lrus[kind] = _LRU(Config.LLM_CACHE_MEMORY_ITEMS)
+        return lru
+
+
+def content_hash(text: str) -> str:
+    """정규화한 본문의 SHA-256 (유니코드 NFKC, 공백 정리, 소문자화 - 매체별 서식 차이는 같은 본문으로 봄)"""
+    normalized = re.sub(r'\s+', ' ', unicodedata.normalize('NFKC', text or '')).strip().lower()
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+class LLMCache:
+    """DB 기반 LLM 응답 캐시 (앞에 프로세스 내 LRU)
+
+    키는 종류와 입력 요소를 JSON으로 묶은 SHA-256이라 모델이나 프롬프트 버전이
+    바뀌면 자연스럽게 새 키가 된다. 캐시 조회/저장 실패는 경고만 남기고
+    캐시 없이 진행한다.
+    """
+
+    # 프로세스 전체 적중 통계 (종류별)
+    stats: Dict[str, Dict[str, int]] = {}
+
+    def __init__(self, kind: str, persistent: bool = True):
+        self.kind = kind
+        self.persistent = persistent
+        self.memory = _lru_for(kind)
+        LLMCache.stats.setdefault(kind, {'memory_hits': 0, 'db_hits': 0, 'misses': 0, 'stores': 0})
+
+    def make_key(self, *parts) -> str:
+        payload = json.dumps([self.kind, *parts], ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _count(self, name: str, amount: int = 1):
+        LLMCache.stats[self.kind][name] += amount
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 응답 조회 (LRU -> DB 순서, 없으면 None)"""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """여러 키를 한 번에 조회 (DB는 LRU에 없는 키만 한 번의 쿼리로)"""
+        found = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            value = self.memory.get(key)
+            if value is None:
+                missing.append(key)
+            else:
+                found[key] = value
+        self._count('memory_hits', len(found))
+
+        if missing and self.persistent:
+            session = get_db_session()
+            try:
+                rows = session.query(LLMCacheEntry.key, LLMCacheEntry.value).filter(
+                    LLMCacheEntry.key.in_(missing)
+                ).all()
+                for key, value in rows:
+                    found[key] = value
+                    self.memory.put(key, value)
+                self._count('db_hits', len(rows))
+            except Exception as e:
+                logger.warning(f"LLM 캐시 조회 실패 ({self.kind}): {str(e)}")
+            finally:
+                session.close()
+
+        self._count('misses', sum(1 for key in missing if key not in found))
+        return found
+
+    def set(self, key: str, value: str, model: Optional[str] = None):
+        """응답 저장 (다른 프로세스가 먼저 저장한 키면 그대로 둠)"""
+        if not value:
+            return
+        self.memory.put(key, value)
+        self._count('stores')
+        if not self.persistent:
+            return
+        session = get_db_session()
+        try:
+            session.add(LLMCacheEntry(key=key, kind=self.kind, model=model, value=value))
+            session.commit()
+        except IntegrityError:
+            session.rollback()
+        except Exception as e:
+            session.rollback()
+            logger.warning(f"LLM 캐시 저장 실패 ({self.kind}): {str(e)}")
+        finally:
+            session.close()
+
+
+class TranslationCache(LLMCache):
+    """번역 캐시 - (원문, 제목 여부, 모델, 프롬프트 버전) 기준"""
+
+    def __init__(self, persistent: bool = True):
+        super().__init__('translation', persistent)
+
+    def key(self, text: str, is_title: bool, model: str, prompt_version: int) -> str:
+        return self.make_key(text.strip(), bool(is_title), model, prompt_version)
+
+
+class SummaryCache(LLMCache):
+    """요약 캐시 - (정규화한 본문 해시, 프롬프트 버전, 모델, 최대 길이) 기준
+
+    같은 본문을 다시 처리하거나 여러 매체가 같은 기사를 실어도 요약은 한 번만 만들고,
+    프롬프트를 바꿔 버전을 올릴 때만 새로 만든다.
+    """
+
+    def __init__(self, persistent: bool = True):
+        super().__init__('summary', persistent)
+
+    def key(self, content: str, model: str, prompt_version: int, max_length: int) -> str:
+        return self.make_key(content_hash(content), prompt_version, model, max_length)
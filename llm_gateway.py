@@ -0,0 +1,225 @@
+"""
+LLM 호출 게이트웨이
+OpenAI 채팅 요청을 백그라운드 이벤트 루프의 AsyncOpenAI 클라이언트로 보내
+동시 요청 수, 분당 요청 수(RPM)/토큰 수(TPM) 한도 안에서 여러 요청을 동시에 처리하고
+429/5xx/연결 오류는 지터를 준 지수 백오프로 다시 시도
+"""
+
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Union
+
+import openai
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# 다시 시도할 오류 (한도 초과, 서버 오류, 연결 끊김/시간 초과)
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.InternalServerError,
+                    openai.APIConnectionError, openai.APITimeoutError)
+
+
+class LLMError(Exception):
+    """LLM 요청이 재시도 후에도 실패함"""
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (영문/숫자는 4글자당 1토큰, 한글 등 그 밖의 글자는 글자당 1토큰)"""
+    ascii_chars = sum(1 for c in text if ord(c) < 128)
+    return ascii_chars // 4 + (len(text) - ascii_chars) + 1
+
+
+class RateBudget:
+    """분당 한도를 초당 충전량으로 나눈 비동기 토큰 버킷 (limit이 0 이하면 제한 없음)"""
+
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self.capacity = per_minute
+        self.available = per_minute
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0):
+        """amount만큼 쓸 수 있을 때까지 대기 (한 번에 한도보다 많이 요청하면 한도만큼만 기다림)"""
+        if self.per_minute <= 0:
+            return
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.available = min(self.capacity,
+                                     self.available + (now - self.updated_at) * self.per_minute / 60.0)
+                self.updated_at = now
+                if self.available >= amount:
+                    self.available -= amount
+                    return
+                await asyncio.sleep((amount - self.available) * 60.0 / self.per_minute)
+
+
+class LLMGateway:
+    """OpenAI 채팅 요청 게이트웨이
+
+    전용 스레드의 이벤트 루프에서 요청을 처리하므로 동기 코드에서는 chat()/chat_many()로
+    호출하고 결과를 기다리면 된다. chat_many()는 요청들을 동시 한도(max_concurrency)만큼
+    겹쳐 보낸다. 429 응답을 받으면 Retry-After(없으면 백오프 시간) 동안 모든 요청을 멈춘다.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, max_concurrency: Optional[int] = None,
+                 requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None,
+                 max_retries: Optional[int] = None, timeout: Optional[float] = None):
+        self.api_key = api_key or os.getenv('OPENAI_API_KEY')
+        self.max_concurrency = max_concurrency or Config.LLM_MAX_CONCURRENCY
+        self.requests_per_minute = requests_per_minute if requests_per_minute is not None \
+            else Config.LLM_REQUESTS_PER_MINUTE
+        self.tokens_per_minute = tokens_per_minute if tokens_per_minute is not None \
+            else Config.LLM_TOKENS_PER_MINUTE
+        self.max_retries = max_retries if max_retries is not None else Config.LLM_MAX_RETRIES
+        self.timeout = timeout or Config.LLM_REQUEST_TIMEOUT_SECONDS
+        self.stats = {'requests': 0, 'retries': 0, 'rate_limited': 0, 'failures': 0}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._started = threading.Lock()
+        self._client = None
+        self._semaphore = None
+        self._request_budget = None
+        self._token_budget = None
+        self._paused_until = 0.0
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """백그라운드 이벤트 루프 스레드 시작 (처음 요청할 때 한 번)"""
+        with self._started:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run():
+                    asyncio.set_event_loop(loop)
+                    # 루프에 묶이는 객체는 루프 스레드에서 생성
+                    self._client = openai.AsyncOpenAI(api_key=self.api_key, max_retries=0,
+                                                      timeout=self.timeout)
+                    self._semaphore = asyncio.Semaphore(self.max_concurrency)
+                    self._request_budget = RateBudget(self.requests_per_minute)
+                    self._token_budget = RateBudget(self.tokens_per_minute)
+                    ready.set()
+                    loop.run_forever()
+
+                threading.Thread(target=run, name='llm-gateway', daemon=True).start()
+                ready.wait()
+                self._loop = loop
+        return self._loop
+
+    def chat(self, messages: List[Dict], model: str, max_tokens: int, temperature: float = 0.3) -> str:
+        """채팅 요청 하나를 보내고 응답 텍스트 반환 (재시도 후에도 실패하면 LLMError)"""
+        return self._run(self.achat(messages, model, max_tokens, temperature))
+
+    def chat_many(self, requests: List[Dict], timeout: Optional[float] = None) -> List[Union[str, LLMError]]:
+        """여러 요청을 동시에 보내고 순서대로 응답 텍스트 또는 LLMError 반환
+
+        각 요청은 achat()의 인자(messages, model, max_tokens, temperature)를 담은 딕셔너리.
+        timeout(초)이 지나면 끝나지 않은 요청은 재시도 대기 중인 것까지 취소하고 LLMError로 돌려준다.
+        """
+        if not requests:
+            return []
+
+        async def gather():
+            tasks = [asyncio.ensure_future(self.achat(**request)) for request in requests]
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            if pending:
+                logger.warning(f"LLM 요청 시간 초과: {len(pending)}/{len(tasks)}개 취소")
+            results = []
+            for task in tasks:
+                if task in pending:
+                    results.append(LLMError("시간 초과로 요청 취소"))
+                else:
+                    results.append(task.exception() or task.result())
+            return results
+
+        results = self._run(gather())
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, LLMError):
+                raise result
+        return results
+
+    def _run(self, coro):
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def achat(self, messages: List[Dict], model: str, max_tokens: int, temperature: float = 0.3) -> str:
+        """채팅 요청 (게이트웨이 루프 안에서 실행)"""
+        if not self.api_key:
+            raise LLMError("OPENAI_API_KEY가 설정되지 않았습니다")
+        # TPM은 요청 토큰 + max_tokens로 계산 (OpenAI도 max_tokens를 한도에 미리 반영)
+        tokens = sum(estimate_tokens(message['content']) for message in messages) + max_tokens
+
+        for attempt in range(self.max_retries + 1):
+            async with self._semaphore:
+                await self._wait_for_pause()
+                await self._request_budget.acquire()
+                await self._token_budget.acquire(tokens)
+                self.stats['requests'] += 1
+                try:
+                    response = await self._client.chat.completions.create(
+                        model=model, messages=messages, max_tokens=max_tokens, temperature=temperature
+                    )
+                    return (response.choices[0].message.content or '').strip()
+                except RETRYABLE_ERRORS as e:
+                    error = e
+                except openai.OpenAIError as e:
+                    self.stats['failures'] += 1
+                    raise LLMError(f"{type(e).__name__}: {str(e)[:200]}") from e
+
+            if attempt == self.max_retries:
+                break
+            delay = self._backoff(attempt, error)
+            self.stats['retries'] += 1
+            logger.warning(f"LLM 요청 재시도 {attempt + 1}/{self.max_retries} ({delay:.1f}초 후): "
+                           f"{type(error).__name__}")
+            await asyncio.sleep(delay)
+
+        self.stats['failures'] += 1
+        raise LLMError(f"{type(error).__name__}: {str(error)[:200]}") from error
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        """다음 시도까지 대기 시간 - full jitter 지수 백오프, 429는 Retry-After를 우선하고 모든 요청을 멈춤"""
+        delay = random.uniform(0, min(Config.LLM_BACKOFF_MAX_SECONDS,
+                                      Config.LLM_BACKOFF_BASE_SECONDS * (2 ** attempt)))
+        if isinstance(error, openai.RateLimitError):
+            self.stats['rate_limited'] += 1
+            retry_after = self._retry_after(error)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        return delay
+
+    @staticmethod
+    def _retry_after(error: openai.APIStatusError) -> Optional[float]:
+        try:
+            value = error.response.headers.get('retry-after')
+            return min(float(value), Config.LLM_BACKOFF_MAX_SECONDS) if value else None
+        except (AttributeError, ValueError):
+            return None
+
+    async def _wait_for_pause(self):
+        delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_gateway() -> LLMGateway:
+    """프로세스 전역 게이트웨이 (동시 한도와 RPM/TPM 예산을 모든 분석기가 공유)"""
+    global _gateway
+    with _gateway_lock:
+        if _gateway is None:
+            _gateway = LLMGateway()
+        return _gateway
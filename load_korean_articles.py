@@ -7,7 +7,7 @@ Render 데이터베이스에 한국 뉴스 기사를 직접 로드하는 스크
 import os
 import sys
 from datetime import datetime
-from database import init_db, NewsArticle, get_db_session
+from database import init_db, NewsArticle, get_db_session, find_article_by_url
 from news_analyzer import NewsAnalyzer
 
 # 한국 반도체 뉴스 샘플 데이터 (실제 크롤링된 기사들)
@@ -69,7 +69,7 @@ def load_korean_articles():
         for article_data in korean_articles:
             try:
                 # 중복 체크
-                existing = session.query(NewsArticle).filter_by(url=article_data['url']).first()
+                existing = find_article_by_url(article_data['url'], session)
                 if existing:
                     print(f"⊘ 이미 존재: {article_data['title'][:50]}")
                     continue
@@ -90,7 +90,10 @@ def load_korean_articles():
                     published_date=article_data['published_date'],
                     priority_score=priority,
                     crawled_at=datetime.now(),
-                    category='semiconductor'
+                    category='semiconductor',
+                    original_title=article_data['title'],
+                    original_content=article_data['content'],
+                    language='ko'
                 )
                 
                 session.add(article)
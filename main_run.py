@@ -10,9 +10,11 @@ import schedule
 import time
 from datetime import datetime
 from web_app import create_app
-from news_crawler import NewsCrawler
-from news_analyzer import NewsAnalyzer
-from database import init_db, NewsArticle, database_session
+from news_pipeline import NewsPipeline
+from source_scheduler import SourceScheduler
+from backfill_translate_articles import translate_pending_articles
+from config import Config
+from database import init_db
 import logging
 
 # 로깅 설정
@@ -26,70 +28,58 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def update_news():
-    """뉴스를 크롤링하고 분석하는 주기적 작업"""
+def update_news(adaptive=False):
+    """뉴스를 크롤링하고 분석하는 주기적 작업
+
+    adaptive가 True면 소스별 적응형 스케줄에 따라 차례가 된 소스만 크롤링한다.
+    크롤링할 소스가 없어도 이전 실행에서 남은 프런티어 항목은 분석/저장한다.
+    """
     try:
-        logger.info("뉴스 업데이트 작업 시작")
-        
-        # 크롤링
-        crawler = NewsCrawler()
-        articles = crawler.crawl_semiconductor_news()
-        
-        # 분석 및 요약
-        analyzer = NewsAnalyzer()
+        pipeline = NewsPipeline()
+        scheduler = None
+        sources = None
+        if adaptive:
+            scheduler = SourceScheduler().load()
+            sources = scheduler.due_sources(pipeline.crawler.news_sources)
+            if sources:
+                logger.info(f"뉴스 업데이트 작업 시작 (대상 소스 {len(sources)}개: {', '.join(sources)})")
+        else:
+            logger.info("뉴스 업데이트 작업 시작")
         
-        for article_data in articles:
-            # 중복 체크
-            existing = database_session.query(NewsArticle).filter_by(url=article_data['url']).first()
-            if existing:
-                continue
-            
-            # 영어 제목 번역
-            translated_title = analyzer._translate_text(article_data['title'], is_title=True)
-            
-            # 영어 내용 번역
-            translated_content = analyzer._translate_text(article_data['content'], is_title=False)
-            
-            # 우선순위 계산 (번역된 제목 기반)
-            priority = analyzer.calculate_priority({
-                **article_data,
-                'title': translated_title,
-                'content': translated_content
-            })
-            
-            # 분석 및 요약 (번역된 내용으로)
-            summary = analyzer.summarize_article(translated_content)
-            
-            # DB에 저장
-            article = NewsArticle(
-                title=translated_title,  # 번역된 제목
-                content=translated_content,  # 번역된 내용
-                summary=summary,
-                url=article_data['url'],
-                source=article_data['source'],
-                published_date=article_data['published_date'],
-                priority_score=priority,
-                crawled_at=datetime.now()
-            )
-            
-            database_session.add(article)
+        result = pipeline.run(sources=sources, crawl=not adaptive or bool(sources))
+        if scheduler and sources:
+            scheduler.record_run(pipeline.crawler.source_results)
         
-        database_session.commit()
-        logger.info(f"뉴스 업데이트 완료: {len(articles)}개의 새 기사 처리")
+        if result['crawled'] or result['stored']:
+            logger.info(f"뉴스 업데이트 완료: {len(result['stored'])}개의 새 기사 처리 (대기 {result['pending']})")
         
     except Exception as e:
         logger.error(f"뉴스 업데이트 중 오류 발생: {str(e)}")
-        database_session.rollback()
+
+def translate_articles():
+    """저장된 기사 중 번역되지 않은 기사를 번역하는 주기적 작업"""
+    try:
+        translate_pending_articles(limit=Config.TRANSLATION_JOB_BATCH_SIZE)
+    except Exception as e:
+        logger.error(f"기사 번역 중 오류 발생: {str(e)}")
 
 def run_scheduler():
     """스케줄러 실행"""
-    # 하루 2회 뉴스 업데이트
-    schedule.every(12).hours.do(update_news)
+    # 소스별 주기는 SourceScheduler가 관리하고, 여기서는 차례가 된 소스가 있는지 주기적으로 확인
+    tick = Config.CRAWL_SCHEDULER_TICK_MINUTES
+    schedule.every(tick).minutes.do(update_news, adaptive=True)
+    if Config.TRANSLATION_JOB_ENABLED:
+        schedule.every(Config.TRANSLATION_JOB_INTERVAL_MINUTES).minutes.do(translate_articles)
     
     # 초기 실행
-    update_news()
+    update_news(adaptive=True)
+    if Config.TRANSLATION_JOB_ENABLED:
+        translate_articles()
     
-    logger.info("스케줄러 시작 - 12시간마다 뉴스 업데이트")
+    logger.info(
+        f"스케줄러 시작 - {tick}분마다 소스별 주기 확인 "
+        f"({Config.CRAWL_SOURCE_MIN_INTERVAL_MINUTES:.0f}~{Config.CRAWL_SOURCE_MAX_INTERVAL_MINUTES:.0f}분)"
+    )
     while True:
         schedule.run_pending()
         time.sleep(60)
@@ -5,15 +5,81 @@ AI를 활용한 기사 요약과 우선순위 계산
 
 import os
 import re
+import json
+import time
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-import openai
 from dotenv import load_dotenv
 
+from llm_cache import TranslationCache, SummaryCache
+from llm_gateway import get_gateway, estimate_tokens, LLMError
+
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# 번역 모델과 프롬프트 (프롬프트를 바꾸면 버전을 올려 이전 번역 캐시를 쓰지 않게 함)
+# 버전 2: 본문을 조각으로 나눠 끝까지 번역 (버전 1은 본문 번역이 300토큰에서 잘림)
+TRANSLATION_MODEL = "gpt-3.5-turbo"
+TRANSLATION_PROMPT_VERSION = 2
+TRANSLATION_SYSTEM_PROMPT = "당신은 전문 번역가입니다. 주어진 영어 텍스트를 자연스러운 한글로 번역하세요. 번역 결과만 제공하세요."
+TRANSLATION_BATCH_SYSTEM_PROMPT = (
+    "당신은 전문 번역가입니다. JSON 객체의 각 값(영어 텍스트)을 자연스러운 한글로 번역하세요. "
+    "입력과 같은 키에 번역 결과만 담은 JSON 객체 하나만 출력하세요."
+)
+
+# 요약 모델과 프롬프트 (시스템/사용자 프롬프트를 바꾸면 버전을 올려 이전 요약 캐시를 쓰지 않게 함)
+SUMMARY_MODEL = "gpt-3.5-turbo"
+SUMMARY_PROMPT_VERSION = 1
+SUMMARY_SYSTEM_PROMPT = """당신은 반도체 산업 전문가이자 취업 컨설턴트입니다. 취업 준비생들이 이력서, 면접, 에세이에서 활용할 수 있도록 다음 구조로 실용적인 한국어 요약을 제공해주세요:
+
+💼 **산업 동향 & 기술 이해**
+이 뉴스가 반도체 산업에 미치는 영향과 핵심 기술을 3-4문장으로 설명해주세요. 취업 준비생이 "최신 기술 트렌드를 이해하고 있다"고 어필할 수 있는 내용으로 구성해주세요.
+
+🏭 **주요 기업 분석 & 취업 시장**
+관련 기업들의 사업 전략과 시장 포지션을 설명하고, 해당 기업들의 채용 동향이나 필요 역량과 연결해주세요. 어떤 직무에 도움이 될지도 언급해주세요.
+
+📈 **구체적 성과 지표**
+면접에서 언급할 수 있는 핵심 수치들(성능 개선률, 투자 규모, 시장 규모 등)을 정리하고, 이 수치들이 업계에서 갖는 의미를 설명해주세요.
+
+🎯 **커리어 연관성**
+이 기술/산업 변화가 향후 5-10년간 어떤 새로운 직업이나 역량 수요를 만들어낼지 분석해주세요. 취업 준비생이 어떤 방향으로 준비하면 좋을지 제시해주세요.
+
+💡 **면접 활용 포인트**
+이 내용을 면접에서 어떻게 활용할 수 있는지 구체적으로 제시해주세요. "업계 동향에 대한 이해도"나 "미래 비전"을 보여줄 수 있는 답변 소재로 구성해주세요.
+
+각 섹션을 명확히 구분하고, 취업 준비생 관점에서 실용적으로 작성해주세요."""
+
+# 묶음 번역 한도 (토큰 수는 estimate_tokens 추정치, 원문 + 응답이 모델 컨텍스트 4k 안에 들도록)
+TRANSLATION_BATCH_MAX_ITEMS = 20
+TRANSLATION_BATCH_INPUT_TOKENS = 800
+TRANSLATION_MAX_OUTPUT_TOKENS = 2400
+TRANSLATION_SEGMENT_TOKENS = 400  # 긴 본문을 나누는 조각 크기
+
+
+def _parse_batch_translation(content: str, count: int) -> List[Optional[str]]:
+    """묶음 번역 응답({"0": "...", ...})을 항목별 번역으로 (해석할 수 없는 항목은 None)"""
+    text = re.sub(r'^```(?:json)?\s*|\s*```$', '', (content or '').strip())
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return [None] * count
+    if isinstance(data, dict) and isinstance(data.get('translations'), (dict, list)):
+        data = data['translations']
+    if isinstance(data, list) and len(data) == count:
+        data = {str(index): value for index, value in enumerate(data)}
+    if not isinstance(data, dict):
+        return [None] * count
+    return [_valid_translation(data.get(str(index))) for index in range(count)]
+
+
+def _valid_translation(value) -> Optional[str]:
+    """번역 응답으로 쓸 수 있는 텍스트면 앞뒤 공백을 뺀 값, 아니면 None"""
+    if isinstance(value, str) and len(value.strip()) > 2:
+        return value.strip()
+    return None
+
+
 class NewsAnalyzer:
     def __init__(self):
         """분석기 초기화"""
@@ -24,10 +90,14 @@ class NewsAnalyzer:
             'tsmc', '삼성', 'samsung', '하이닉스', 'hynix',
             'hbm', 'dram', 'nand'
         ]
-        # OpenAI API 키 설정
+        # OpenAI API 키 설정 (요청은 프로세스 전역 LLM 게이트웨이로 동시 처리)
         self.openai_api_key = os.getenv('OPENAI_API_KEY')
-        if self.openai_api_key:
-            openai.api_key = self.openai_api_key
+        self.llm = get_gateway()
+        
+        # 번역 캐시 (DB + 프로세스 내 LRU, 같은 원문은 한 번만 번역)
+        self.translation_cache = TranslationCache()
+        # 요약 캐시 (같은 본문/프롬프트 버전/모델/길이의 요약은 다시 요청하지 않음)
+        self.summary_cache = SummaryCache()
         
         # 중요도 평가 키워드
         self.high_priority_keywords = [
@@ -90,102 +160,247 @@ class NewsAnalyzer:
         # 한글이 10% 미만, 영어가 30% 이상이면 영어로 봄
         return korean_ratio < 0.1 and english_ratio > 0.3
 
+    def detect_language(self, title: str, content: str = '') -> str:
+        """기사 언어 판별 - 제목이나 본문 앞부분이 영어면 'en', 아니면 'ko'"""
+        if self._is_english_text(title or '') or self._is_english_text((content or '')[:500]):
+            return 'en'
+        return 'ko'
+
     def _translate_text(self, text: str, is_title: bool = False) -> str:
-        """텍스트를 한글로 번역"""
-        if not text or len(text) < 3:
-            return text
-        
-        # 영어 텍스트가 아니면 그대로 반환
-        if not self._is_english_text(text):
-            return text
-        
+        """텍스트를 한글로 번역 (같은 원문/모델/프롬프트 버전의 번역은 캐시에서 반환)"""
+        return self.translate_batch([text], is_title=is_title)[0]
+
+    def translate_batch(self, texts: List[str], is_title: bool = False,
+                        timeout: Optional[float] = None) -> List[str]:
+        """여러 텍스트를 한글로 번역 (영어가 아니거나 번역에 실패한 항목은 원문 그대로)
+
+        캐시에 없는 영어 텍스트만 요청한다. 긴 본문은 문단 단위 조각으로 나누고,
+        제목/조각 여러 개를 JSON 객체 하나로 묶어 토큰 한도 안에서 한 번에 보낸 뒤
+        응답에서 빠지거나 해석할 수 없는 조각만 하나씩 다시 요청한다.
+        timeout(초)이 지나면 끝나지 않은 요청은 취소하고 해당 항목은 원문 그대로 둔다.
+        """
+        results = list(texts)
+        if not self.openai_api_key:
+            return results
+        targets = [index for index, text in enumerate(texts)
+                   if text and len(text) >= 3 and self._is_english_text(text)]
+        if not targets:
+            return results
+
+        keys = {index: self.translation_cache.key(texts[index], is_title, TRANSLATION_MODEL,
+                                                  TRANSLATION_PROMPT_VERSION)
+                for index in targets}
+        cached = self.translation_cache.get_many(keys.values())
+        pending: Dict[str, List[int]] = {}  # 원문 -> 위치 (같은 원문은 한 번만 번역)
+        for index in targets:
+            if keys[index] in cached:
+                results[index] = cached[keys[index]]
+            else:
+                pending.setdefault(texts[index], []).append(index)
+        if not pending:
+            return results
+
+        pieces = []
+        segments = []
+        for text in pending:
+            parts = [(text.strip(), '')] if is_title else self._split_for_translation(text)
+            pieces.append((text, parts))
+            segments.extend(part for part, _ in parts)
+        logger.debug(f"[번역] 시작: {len(pending)}개 텍스트 ({len(segments)}개 조각)")
         try:
-            if self.openai_api_key:
-                max_tokens = 100 if is_title else 300
-                logger.debug(f"[번역] 시작: {text[:40]}...")
-                
-                response = openai.ChatCompletion.create(
-                    model="gpt-3.5-turbo",
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "당신은 전문 번역가입니다. 주어진 영어 텍스트를 자연스러운 한글로 번역하세요. 번역 결과만 제공하세요."
-                        },
-                        {
-                            "role": "user",
-                            "content": f"Translate to Korean: {text}"
-                        }
-                    ],
-                    max_tokens=max_tokens,
-                    temperature=0.3,
-                    timeout=5
-                )
-                
-                translated = response.choices[0].message.content.strip()
-                if translated and len(translated) > 2:
-                    logger.debug(f"[번역] 완료: {translated[:40]}...")
-                    return translated
+            outputs = self._translate_segments(segments, timeout)
         except Exception as e:
-            logger.warning(f"번역 실패 ({text[:30]}...): {str(e)[:50]}")
-        
-        return text
+            logger.warning(f"번역 실패 ({len(segments)}개 조각): {str(e)[:50]}")
+            return results
 
-    def summarize_article(self, content: str, max_length: int = 600) -> str:
-        """기사 상세 요약 생성 - 구체적이고 구조화된 요약"""
-        try:
-            if self.openai_api_key and len(content) > 100:
-                return self._summarize_with_openai(content, max_length)
+        position = 0
+        for text, parts in pieces:
+            translated = outputs[position:position + len(parts)]
+            position += len(parts)
+            if any(output is None for output in translated):
+                continue  # 조각 하나라도 실패하면 원문 유지 (다음 번역 때 다시 시도)
+            result = ''.join(joiner + output for (_, joiner), output in zip(parts, translated))
+            if result.strip() == text.strip():
+                continue  # 원문을 그대로 돌려준 응답은 캐시하지 않음 (다음 번역 때 다시 요청)
+            self.translation_cache.set(keys[pending[text][0]], result, model=TRANSLATION_MODEL)
+            for index in pending[text]:
+                results[index] = result
+        return results
+
+    def _split_for_translation(self, text: str) -> List[Tuple[str, str]]:
+        """긴 본문을 TRANSLATION_SEGMENT_TOKENS 이하 조각으로 - [(조각, 앞 조각과 이을 구분자)]
+
+        문단 경계에서 먼저 나누고, 한 문단이 너무 길면 문장, 문장도 너무 길면 글자 수로 나눈다.
+        """
+        text = text.strip()
+        if estimate_tokens(text) <= TRANSLATION_SEGMENT_TOKENS:
+            return [(text, '')]
+
+        units = []
+        max_chars = TRANSLATION_SEGMENT_TOKENS * 2
+        for paragraph in (line.strip() for line in text.split('\n')):
+            if not paragraph:
+                continue
+            joiner = '\n' if units else ''
+            if estimate_tokens(paragraph) <= TRANSLATION_SEGMENT_TOKENS:
+                units.append((paragraph, joiner))
+                continue
+            for sentence in re.split(r'(?<=[.!?])\s+', paragraph):
+                while estimate_tokens(sentence) > TRANSLATION_SEGMENT_TOKENS:
+                    units.append((sentence[:max_chars], joiner))
+                    sentence = sentence[max_chars:]
+                    joiner = ''
+                if sentence:
+                    units.append((sentence, joiner))
+                    joiner = ' '
+
+        segments = []
+        for unit, joiner in units:
+            if segments and estimate_tokens(segments[-1][0] + unit) <= TRANSLATION_SEGMENT_TOKENS:
+                segments[-1] = (segments[-1][0] + joiner + unit, segments[-1][1])
             else:
-                return self._enhanced_simple_summarize(content, max_length)
-        except Exception as e:
-            logger.error(f"요약 생성 중 오류: {str(e)}")
-            return self._enhanced_simple_summarize(content, max_length)
+                segments.append((unit, joiner))
+        return segments
 
-    def _summarize_with_openai(self, content: str, max_length: int) -> str:
-        """OpenAI API를 사용한 구체적인 요약"""
-        try:
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """당신은 반도체 산업 전문가이자 취업 컨설턴트입니다. 취업 준비생들이 이력서, 면접, 에세이에서 활용할 수 있도록 다음 구조로 실용적인 한국어 요약을 제공해주세요:
+    def _translate_segments(self, segments: List[str], timeout: Optional[float] = None) -> List[Optional[str]]:
+        """조각들을 토큰/개수 한도 안에서 묶어 번역 (실패한 조각은 None, timeout은 다시 요청까지 포함한 전체 시간)"""
+        deadline_at = time.monotonic() + timeout if timeout is not None else None
+        batches = []
+        batch_tokens = 0
+        for index, segment in enumerate(segments):
+            tokens = estimate_tokens(segment)
+            if (not batches or len(batches[-1]) >= TRANSLATION_BATCH_MAX_ITEMS or
+                    batch_tokens + tokens > TRANSLATION_BATCH_INPUT_TOKENS):
+                batches.append([])
+                batch_tokens = 0
+            batches[-1].append(index)
+            batch_tokens += tokens
 
-💼 **산업 동향 & 기술 이해**
-이 뉴스가 반도체 산업에 미치는 영향과 핵심 기술을 3-4문장으로 설명해주세요. 취업 준비생이 "최신 기술 트렌드를 이해하고 있다"고 어필할 수 있는 내용으로 구성해주세요.
+        # 묶음들을 게이트웨이로 동시에 보내고, 응답에서 빠진 조각만 모아 다시 동시에 요청
+        results: List[Optional[str]] = [None] * len(segments)
+        requests = [self._batch_translation_request([segments[index] for index in batch]) if len(batch) > 1
+                    else self._translation_request(segments[batch[0]])
+                    for batch in batches]
+        retry = []
+        for batch, response in zip(batches, self.llm.chat_many(requests, timeout=timeout)):
+            if isinstance(response, LLMError):
+                logger.warning(f"번역 실패 ({len(batch)}개 조각): {str(response)[:50]}")
+                outputs = [None] * len(batch)
+            elif len(batch) > 1:
+                outputs = _parse_batch_translation(response, len(batch))
+            else:
+                outputs = [_valid_translation(response)]
+            for index, output in zip(batch, outputs):
+                results[index] = output
+                if output is None and len(batch) > 1:
+                    retry.append(index)
 
-🏭 **주요 기업 분석 & 취업 시장**
-관련 기업들의 사업 전략과 시장 포지션을 설명하고, 해당 기업들의 채용 동향이나 필요 역량과 연결해주세요. 어떤 직무에 도움이 될지도 언급해주세요.
+        time_left = deadline_at - time.monotonic() if deadline_at is not None else None
+        if retry and (time_left is None or time_left > 0):
+            logger.info(f"묶음 번역에서 받지 못한 {len(retry)}개 조각을 하나씩 다시 요청")
+            responses = self.llm.chat_many([self._translation_request(segments[index]) for index in retry],
+                                           timeout=time_left)
+            for index, response in zip(retry, responses):
+                if isinstance(response, LLMError):
+                    logger.warning(f"번역 실패 ({segments[index][:30]}...): {str(response)[:50]}")
+                else:
+                    results[index] = _valid_translation(response)
+        return results
 
-📈 **구체적 성과 지표**
-면접에서 언급할 수 있는 핵심 수치들(성능 개선률, 투자 규모, 시장 규모 등)을 정리하고, 이 수치들이 업계에서 갖는 의미를 설명해주세요.
+    @staticmethod
+    def _output_tokens(text: str) -> int:
+        """번역 응답에 필요한 max_tokens 추정 (한글 번역은 영어 원문보다 토큰이 많음)"""
+        return estimate_tokens(text) * 2 + 10
 
-🎯 **커리어 연관성**
-이 기술/산업 변화가 향후 5-10년간 어떤 새로운 직업이나 역량 수요를 만들어낼지 분석해주세요. 취업 준비생이 어떤 방향으로 준비하면 좋을지 제시해주세요.
+    def _translation_request(self, text: str) -> Dict:
+        """텍스트 하나 번역 요청 (LLM 게이트웨이 chat_many 형식)"""
+        return {
+            'model': TRANSLATION_MODEL,
+            'messages': [
+                {"role": "system", "content": TRANSLATION_SYSTEM_PROMPT},
+                {"role": "user", "content": f"Translate to Korean: {text}"}
+            ],
+            'max_tokens': min(max(self._output_tokens(text), 100), TRANSLATION_MAX_OUTPUT_TOKENS),
+            'temperature': 0.3
+        }
 
-💡 **면접 활용 포인트**
-이 내용을 면접에서 어떻게 활용할 수 있는지 구체적으로 제시해주세요. "업계 동향에 대한 이해도"나 "미래 비전"을 보여줄 수 있는 답변 소재로 구성해주세요.
+    def _batch_translation_request(self, texts: List[str]) -> Dict:
+        """여러 텍스트를 JSON 객체 하나로 묶은 번역 요청"""
+        payload = json.dumps({str(index): text for index, text in enumerate(texts)}, ensure_ascii=False)
+        return {
+            'model': TRANSLATION_MODEL,
+            'messages': [
+                {"role": "system", "content": TRANSLATION_BATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": payload}
+            ],
+            'max_tokens': min(sum(self._output_tokens(text) for text in texts) + 20,
+                              TRANSLATION_MAX_OUTPUT_TOKENS),
+            'temperature': 0.3
+        }
 
-각 섹션을 명확히 구분하고, 취업 준비생 관점에서 실용적으로 작성해주세요."""
-                    },
-                    {
-                        "role": "user", 
-                        "content": f"다음 반도체 기사를 위 형식으로 취업 준비생 관점에서 분석하여 실용적으로 요약해주세요 (총 {max_length*3}자 이내, 면접/이력서 활용 가능하도록):\n\n{content[:4000]}"
-                    }
-                ],
-                max_tokens=int(max_length*2),
-                temperature=0.2
-            )
-            summary = response.choices[0].message.content.strip()
-            
-            # 너무 길면 자르기
-            if len(summary) > max_length * 3:
-                summary = summary[:max_length * 3] + "..."
-            
-            return summary
+    def summarize_article(self, content: str, max_length: int = 600) -> str:
+        """기사 상세 요약 생성 - 구체적이고 구조화된 요약"""
+        return self.summarize_batch([content], max_length)[0]
+
+    def summarize_batch(self, contents: List[str], max_length: int = 600,
+                        timeout: Optional[float] = None) -> List[str]:
+        """여러 기사 요약을 LLM 게이트웨이로 동시에 생성 (OpenAI를 쓸 수 없거나 실패하면 규칙 기반 요약)
+
+        캐시에 있는 요약은 그대로 쓰고, 같은 본문은 한 번만 요청한다. 규칙 기반 요약은
+        캐시하지 않아 다음 처리 때 OpenAI 요약을 다시 시도한다. timeout(초)이 지나면 끝나지 않은
+        요청은 취소하고 규칙 기반 요약을 쓴다.
+        """
+        summaries: List[Optional[str]] = [None] * len(contents)
+        targets = [index for index, content in enumerate(contents)
+                   if self.openai_api_key and content and len(content) > 100]
+
+        keys = {index: self.summary_cache.key(contents[index], SUMMARY_MODEL, SUMMARY_PROMPT_VERSION, max_length)
+                for index in targets}
+        cached = self.summary_cache.get_many(keys.values()) if keys else {}
+        pending: Dict[str, List[int]] = {}  # 캐시 키 -> 위치 (같은 본문은 한 번만 요약)
+        for index in targets:
+            if keys[index] in cached:
+                summaries[index] = cached[keys[index]]
+            else:
+                pending.setdefault(keys[index], []).append(index)
+
+        try:
+            responses = self.llm.chat_many([self._summary_request(contents[indexes[0]], max_length)
+                                            for indexes in pending.values()], timeout=timeout)
         except Exception as e:
-            logger.error(f"OpenAI API 요약 실패: {str(e)}")
-            return self._enhanced_simple_summarize(content, max_length)
+            logger.error(f"요약 생성 중 오류: {str(e)}")
+            responses = [LLMError(str(e))] * len(pending)
+
+        for (key, indexes), response in zip(pending.items(), responses):
+            if isinstance(response, LLMError):
+                logger.error(f"OpenAI API 요약 실패: {str(response)}")
+            elif response:
+                # 너무 길면 자르기
+                if len(response) > max_length * 3:
+                    response = response[:max_length * 3] + "..."
+                self.summary_cache.set(key, response, model=SUMMARY_MODEL)
+                for index in indexes:
+                    summaries[index] = response
+
+        for index, summary in enumerate(summaries):
+            if summary is None:
+                summaries[index] = self._enhanced_simple_summarize(contents[index] or '', max_length)
+        return summaries
+
+    def _summary_request(self, content: str, max_length: int) -> Dict:
+        """OpenAI 요약 요청 (LLM 게이트웨이 chat_many 형식)"""
+        return {
+            'model': SUMMARY_MODEL,
+            'messages': [
+                {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                {
+                    "role": "user",
+                    "content": f"다음 반도체 기사를 위 형식으로 취업 준비생 관점에서 분석하여 실용적으로 요약해주세요 (총 {max_length*3}자 이내, 면접/이력서 활용 가능하도록):\n\n{content[:4000]}"
+                }
+            ],
+            'max_tokens': int(max_length * 2),
+            'temperature': 0.2
+        }
 
     def _enhanced_simple_summarize(self, content: str, max_length: int) -> str:
         """향상된 규칙 기반 요약 (OpenAI 실패시 대체)"""
@@ -3,20 +3,112 @@
 반도체 관련 뉴스 사이트에서 기사를 수집
 """
 
+import asyncio
+import contextvars
+import threading
+import time
+import codecs
+import multiprocessing
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
-import time
+from email.utils import parsedate_to_datetime
 import re
 import logging
-from urllib.parse import urljoin, urlparse
-from typing import List, Dict
-from html import unescape
-import xml.etree.ElementTree as ET
-import random
+from urllib.parse import urljoin, urlparse, urlunparse, parse_qsl, urlencode
+from typing import Callable, List, Dict, Optional, Tuple
+from html.parser import HTMLParser
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from config import Config
+from crawl_metrics import CrawlMetrics, attribute, current_source
+from crawl_scheduler import HostScheduler, DeadlineExceeded
+from http_cache import HttpValidatorCache
+from keyword_matcher import KeywordMatcher
+from source_health import SourceCircuitBreaker, HALF_OPEN
+from crawl_frontier import DISCOVERED, FETCHED, DUPLICATE, entry_to_candidate
+from feed_discovery import FeedDiscovery
+from html_parsing import (extract_article, parse_feed_items, parse_list_links, parse_selector_links, make_soup,
+                          is_content_container)
+from url_canonical import clean_url, canonical_url
+from database import (get_db_session, get_known_article_urls, get_list_cursors, save_list_cursors,
+                      get_source_feeds, save_source_feeds,
+                      get_selector_rules, save_selector_rules)
 
 logger = logging.getLogger(__name__)
 
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+
+
+def _declared_encoding(response) -> Optional[str]:
+    """Content-Type 헤더가 밝힌 문자 인코딩 (없으면 None - requests는 text/*에 ISO-8859-1을 가정함)"""
+    content_type = response.headers.get('Content-Type', '')
+    return response.encoding if 'charset' in content_type.lower() else None
+
+
+class _ParagraphTextProbe(HTMLParser):
+    """스트리밍 중인 HTML에서 본문 후보 요소의 텍스트 양을 세는 가벼운 파서
+
+    extract_article()이 고르는 본문 요소(class에 content/article-body가 있는 요소, main 안의 article)
+    하나에 목표 글자 수만큼 텍스트가 모였을 때만 멈춘다. 본문 밖의 <p>(메뉴, 관련 기사 등)는 세지 않고,
+    본문 요소가 없는 페이지는 끝까지(또는 크기 상한까지) 내려받는다.
+    인코딩을 모르면 앞부분의 <meta charset>을 보고, 그것도 없으면 UTF-8로 읽는다.
+    """
+
+    def __init__(self, target_chars: int, encoding: Optional[str] = None):
+        super().__init__(convert_charrefs=True)
+        self.target_chars = target_chars
+        self.text_chars = 0  # 가장 많이 모인 본문 요소 하나의 글자 수
+        self.encoding = encoding
+        self._containers: List[List] = []  # 열린 본문 요소 [태그, 같은 태그 중첩 깊이, 글자 수]
+        self._main_depth = 0
+        self._skip_depth = 0
+        self._decoder = None
+
+    def handle_starttag(self, tag, attrs):
+        for container in self._containers:
+            if container[0] == tag:
+                container[1] += 1
+        if tag in ('script', 'style'):
+            self._skip_depth += 1
+        elif tag == 'main':
+            self._main_depth += 1
+        if is_content_container(dict(attrs)) or (tag == 'article' and self._main_depth):
+            self._containers.append([tag, 1, 0])
+
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style') and self._skip_depth:
+            self._skip_depth -= 1
+        elif tag == 'main' and self._main_depth:
+            self._main_depth -= 1
+        for container in self._containers:
+            if container[0] == tag:
+                container[1] -= 1
+        self._containers = [container for container in self._containers if container[1] > 0]
+
+    def handle_data(self, data):
+        if self._skip_depth or not self._containers:
+            return
+        chars = len(data.strip())
+        for container in self._containers:
+            container[2] += chars
+            self.text_chars = max(self.text_chars, container[2])
+
+    def feed_bytes(self, chunk: bytes) -> bool:
+        """청크를 넣고 목표 글자 수에 도달했으면 True"""
+        if self._decoder is None:
+            if not self.encoding:
+                match = _META_CHARSET_RE.search(chunk[:4096])
+                self.encoding = match.group(1).decode('ascii') if match else 'utf-8'
+            try:
+                self._decoder = codecs.getincrementaldecoder(self.encoding)(errors='ignore')
+            except LookupError:
+                self._decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+        self.feed(self._decoder.decode(chunk))
+        return self.text_chars >= self.target_chars
+
 class NewsCrawler:
     def __init__(self):
         """크롤러 초기화"""
@@ -27,6 +119,89 @@ class NewsCrawler:
         self.session.headers.update(self.headers)
         self.max_per_source = 20
         
+        # 기사 본문 다운로드/추출 상한
+        self.max_article_bytes = Config.CRAWL_MAX_ARTICLE_BYTES
+        self.max_content_chars = 5000
+        
+        # 동시 크롤링 설정 (전체 동시 요청 수 / 호스트별 동시 요청 수)
+        self.concurrent = Config.CRAWL_CONCURRENT
+        self.max_concurrency = Config.CRAWL_MAX_CONCURRENCY
+        self.per_host_concurrency = Config.CRAWL_PER_HOST_CONCURRENCY
+        adapter = HTTPAdapter(pool_maxsize=self.max_concurrency)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # 호스트별 요청 간격 스케줄러 (토큰 버킷 + robots.txt Crawl-delay)
+        self.scheduler = HostScheduler(
+            self.session,
+            default_delay=Config.REQUEST_DELAY_SECONDS,
+            burst=Config.CRAWL_HOST_BURST
+        )
+        
+        # DB에 저장된 실행 간 상태(HTTP 캐시, 저장된 URL, 증분 커서, 선택자 규칙) 사용 여부
+        # 벤치마크/녹화처럼 매번 같은 조건으로 돌려야 할 때는 set_db_state(False)
+        self.use_db_state = True
+        
+        # 조건부 GET 캐시 (ETag / Last-Modified)
+        self.http_cache = HttpValidatorCache(max_age_days=Config.HTTP_CACHE_MAX_AGE_DAYS)
+        self.last_crawl_stats = {}
+        
+        # 마지막 실행의 소스별 결과 (새 기사 수, 실패 여부) - 적응형 스케줄러 입력
+        self.source_results: Dict[str, Dict] = {}
+        
+        # 계속 실패하는 소스를 쿨다운 동안 건너뛰는 서킷 브레이커
+        self.breaker = SourceCircuitBreaker()
+        
+        # 크롤링 프런티어 (CrawlFrontier, 설정하면 후보를 DB에 기록하고 임대한 항목만 본문 요청)
+        self.frontier = None
+        
+        # 본문 요청 전 제목만으로 예상 우선순위를 매기는 분석기 (NewsAnalyzer, 처음 쓸 때 생성)
+        # 본문 요청은 예상 우선순위가 높은 순으로, 실행당 요청 수/시간 예산 안에서만 보냄
+        self.prescorer = None
+        self.fetch_budget_requests = Config.CRAWL_FETCH_BUDGET_REQUESTS
+        self.fetch_budget_seconds = Config.CRAWL_FETCH_BUDGET_SECONDS
+        self._run_started = time.monotonic()
+        
+        # 실행 마감 시각 (time.monotonic() 기준, None이면 제한 없음)과 마감 전에 끝내지 못한 소스
+        self._deadline: Optional[float] = None
+        self.unfinished_sources: List[str] = []
+        
+        # 이미 저장된 기사 URL (실행마다 한 번 로드, 본문 재요청 방지)
+        self.known_urls = set()
+        self._run_canonicals = set()  # 이번 실행에서 본문을 받은 기사의 정규 URL
+        self.run_stats = self._empty_run_stats()
+        self._stats_lock = threading.Lock()
+        
+        # 실행별 소스 측정값 (요청 지연/바이트/파싱 시간/오류 종류, 실행 후 crawl_runs에 저장)
+        self.metrics = CrawlMetrics()
+        self._run_mode = 'sync'
+        self._run_deadline_seconds: Optional[float] = None
+        self.last_run_id: Optional[int] = None
+        
+        # 증분 목록 크롤링 (목록 URL별 최신 기사 커서)
+        self.incremental = Config.CRAWL_INCREMENTAL
+        self.max_list_pages = Config.CRAWL_MAX_LIST_PAGES
+        self.list_cursors = {}
+        self._cursor_updates = {}
+        self._candidate_lists = {}  # 후보 URL -> 그 후보를 찾은 목록 URL (커서 확정용)
+        self._dropped_ids = {}  # 목록 URL -> 이번 실행에서 놓친 후보의 기사 번호 (번호가 없으면 None)
+        self._cursor_blocked = set()  # 프런티어 기록에 실패해 커서를 옮기지 않을 소스
+        
+        # 파싱 단계 프로세스 풀 (0이면 요청 스레드에서 바로 파싱)
+        self.parse_workers = Config.CRAWL_PARSE_WORKERS
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        
+        # 도메인별 학습된 본문 선택자 (주기적으로 전체 선택자로 재검증)
+        self.selector_rules = {}
+        self._selector_updates = set()
+        self.selector_revalidate_every = Config.CRAWL_SELECTOR_REVALIDATE_EVERY
+        self.selector_revalidate_days = 7
+        
+        # 소스별로 찾은 RSS/Atom/뉴스 사이트맵 (있으면 HTML 목록 대신 사용)
+        self.feed_discovery_enabled = Config.FEED_DISCOVERY_ENABLED
+        self.source_feeds = {}
+        self._feed_results = {}
+        
         # 반도체 관련 뉴스 사이트 목록
         self.news_sources = [
             {
@@ -47,7 +222,8 @@ class NewsCrawler:
                     'https://www.etnews.com/news/section.html?id1=04'
                 ],
                 'link_pattern': 'https://www.etnews.com/',
-                'link_regex': r'https://www\.etnews\.com/\d{11,}'
+                'link_regex': r'https://www\.etnews\.com/\d{11,}',
+                'page_param': 'page'
             },
             {
                 'name': 'TheElec',
@@ -55,7 +231,8 @@ class NewsCrawler:
                     'https://www.thelec.kr/news/articleList.html?sc_section_code=S1N3&view_type=sm',
                     'https://www.thelec.kr/news/articleList.html?sc_section_code=S1N1&view_type=sm'
                 ],
-                'link_regex': r'https://www\.thelec\.kr/news/articleView\.html\?idxno='
+                'link_regex': r'https://www\.thelec\.kr/news/articleView\.html\?idxno=',
+                'page_param': 'page'
             },
             {
                 'name': '서울경제',
@@ -72,7 +249,8 @@ class NewsCrawler:
                     'https://zdnet.co.kr/news/?lstcode=0100&page=1',
                     'https://zdnet.co.kr/news/?lstcode=0120&page=1'
                 ],
-                'link_pattern': 'https://zdnet.co.kr/view/?no='
+                'link_pattern': 'https://zdnet.co.kr/view/?no=',
+                'page_param': 'page'
             },
             {
                 'name': '머니투데이',
@@ -89,7 +267,8 @@ class NewsCrawler:
                     'https://www.bloter.net/news/articleList.html?sc_section_code=S1N4&view_type=sm',
                     'https://www.bloter.net/news/articleList.html?sc_section_code=S1N20&view_type=sm'
                 ],
-                'link_pattern': 'https://www.bloter.net/news/articleView.html?idxno='
+                'link_pattern': 'https://www.bloter.net/news/articleView.html?idxno=',
+                'page_param': 'page'
             },
             {
                 'name': 'Semiconductor Engineering',
@@ -173,64 +352,262 @@ class NewsCrawler:
             }
         ]
         
-        # 반도체 관련 키워드
-        self.semiconductor_keywords = [
-            'semiconductor', 'chip', 'processor', 'memory', 'DRAM', 'NAND',
-            '반도체', '칩', '프로세서', '메모리', '낸드', 'AI chip', 'GPU',
-            'CPU', 'SoC', 'foundry', 'wafer', 'fab', 'TSMC', 'Samsung',
-            'Intel', 'NVIDIA', 'ARM', 'RISC-V', '5nm', '3nm', '2nm'
-        ]
+        # 반도체 관련 키워드 (Config 목록, 중복 제거)
+        self.semiconductor_keywords = list(dict.fromkeys(Config.SEMICONDUCTOR_KEYWORDS))
+        # 키워드 목록을 한 번에 찾는 매처 (키워드 목록을 바꾸면 다시 생성)
+        self.keyword_matcher = KeywordMatcher(self.semiconductor_keywords)
 
     def is_relevant_article(self, title: str, content: str = "") -> bool:
         """반도체 관련 기사인지 판단"""
-        text = (title + " " + content).lower()
-        return any(keyword.lower() in text for keyword in self.semiconductor_keywords)
+        return self.keyword_matcher.matches(title + " " + content)
+
+    def match_keywords(self, title: str, content: str = "") -> List[str]:
+        """제목/내용에 들어 있는 반도체 키워드 목록 (없으면 관련 없는 기사)"""
+        return self.keyword_matcher.find_all(title + " " + content)
+
+    def _is_known_url(self, url: str) -> bool:
+        """이미 DB에 저장된 기사 URL인지 확인 (정규 URL 기준, 본문 요청 생략용)"""
+        if canonical_url(url) not in self.known_urls:
+            return False
+        with self._stats_lock:
+            self.run_stats['known_skipped'] += 1
+        self.metrics.count('duplicates')
+        return True
+
+    def _read_body(self, response, max_bytes: Optional[int] = None,
+                   probe: Optional['_ParagraphTextProbe'] = None) -> Tuple[bytes, bool]:
+        """응답 본문을 조금씩 읽고, 상한 또는 충분한 본문 텍스트에 도달하면 중단
+
+        반환값은 (읽은 바이트, 중간에 끊었는지 여부).
+        """
+        chunks = []
+        size = 0
+        truncated = False
+        try:
+            for chunk in response.iter_content(chunk_size=16384):
+                chunks.append(chunk)
+                size += len(chunk)
+                if max_bytes and size >= max_bytes:
+                    truncated = True
+                    break
+                if probe and probe.feed_bytes(chunk):
+                    truncated = True
+                    break
+        finally:
+            response.close()
+
+        body = b''.join(chunks)
+        if max_bytes:
+            body = body[:max_bytes]
+
+        if truncated:
+            declared = int(response.headers.get('Content-Length', 0) or 0)
+            with self._stats_lock:
+                self.run_stats['truncated_downloads'] += 1
+                self.run_stats['bytes_not_downloaded'] += max(declared - size, 0)
+        return body, truncated
+
+    def _fetch_parsed(self, url: str, parse: Callable, timeout: int = 15,
+                      max_bytes: Optional[int] = None, stop_after_chars: Optional[int] = None):
+        """조건부 GET으로 요청하고 파싱 결과를 반환 (304면 캐시된 파싱 결과 재사용)
+
+        parse는 응답 본문(bytes)을 받아 JSON 직렬화 가능한 값을 돌려줘야 한다.
+        max_bytes를 주면 그 크기까지만 내려받고, stop_after_chars를 주면
+        본문 요소 하나에 텍스트가 그만큼 모이는 즉시 다운로드를 멈춘다.
+        마감 시각이 있으면 요청 타임아웃을 남은 시간으로 줄이고, 마감 이후의
+        실패는 DeadlineExceeded로 바꿔 올린다.
+        """
+        self._check_deadline(url)
+        # 비동기 엔진이 미리 기다린 호스트 대기도 wait_seconds에 들어오므로 시작 시각을 그만큼 앞당김
+        started = time.perf_counter() - self.scheduler.prepaid_seconds(url)
+        wait_seconds = 0.0
+        try:
+            timeout = self._request_timeout(timeout)
+            headers = self.http_cache.request_headers(url)
+            response, wait_seconds = self.scheduler.request(url, deadline=self._deadline, timeout=timeout,
+                                                            headers=headers, stream=True)
+            if response.status_code == 304:
+                response.close()
+                cached = self.http_cache.not_modified(url)
+                if cached is not None:
+                    self.metrics.record_request(time.perf_counter() - started - wait_seconds, wait_seconds,
+                                                not_modified=True)
+                    return cached
+                # 캐시 항목이 없으면 검증자 없이 다시 요청
+                response, waited = self.scheduler.request(url, deadline=self._deadline, timeout=timeout, stream=True)
+                wait_seconds += waited
+
+            if not response.ok:
+                response.close()
+                response.raise_for_status()
+
+            probe = _ParagraphTextProbe(stop_after_chars, _declared_encoding(response)) if stop_after_chars else None
+            body, _ = self._read_body(response, max_bytes=max_bytes, probe=probe)
+
+            fetched = time.perf_counter()
+            parsed = self._parse(parse, body)
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            wait_seconds += getattr(e, 'host_wait_seconds', 0.0)  # 실패한 요청 전의 호스트 대기
+            self.metrics.record_request(time.perf_counter() - started - wait_seconds, wait_seconds, error=e)
+            if self._deadline_passed():
+                raise DeadlineExceeded(f"마감 시간 초과로 요청 중단: {url}") from e
+            raise
+        parse_seconds = time.perf_counter() - fetched
+        with self._stats_lock:
+            self.run_stats['parse_seconds'] += parse_seconds
+        self.metrics.record_request(fetched - started - wait_seconds, wait_seconds, size=len(body))
+        self.metrics.record_parse(parse_seconds)
+
+        self.http_cache.store(url, response.headers, len(body), parsed)
+        return parsed
+
+    def _deadline_passed(self) -> bool:
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def _time_left(self) -> Optional[float]:
+        """마감까지 남은 시간(초, 마감이 없으면 None)"""
+        if self._deadline is None:
+            return None
+        return max(self._deadline - time.monotonic(), 0.0)
+
+    def _check_deadline(self, url: str = ''):
+        """마감 시간이 지났으면 DeadlineExceeded"""
+        if self._deadline_passed():
+            raise DeadlineExceeded(f"마감 시간 초과: {url}")
+
+    def _request_timeout(self, timeout: float) -> float:
+        """요청 타임아웃을 마감까지 남은 시간 이하로 조정"""
+        left = self._time_left()
+        if left is None:
+            return timeout
+        return max(min(timeout, left), 0.1)
+
+    def _parse(self, parse: Callable, body: bytes):
+        """파싱 단계 실행 - 프로세스 풀이 있으면 워커에 원본 바이트를 넘기고 추출 결과만 받음
+
+        parse는 모듈 수준 함수(또는 그 partial)여야 워커로 보낼 수 있다.
+        """
+        pool = self._parse_pool
+        if pool is None:
+            return parse(body)
+        try:
+            return pool.submit(parse, body).result()
+        except BrokenProcessPool:
+            logger.warning("파싱 프로세스 풀이 중단되어 요청 스레드에서 파싱합니다")
+            self._parse_pool = None
+            return parse(body)
+
+    def _start_parse_pool(self, workers: Optional[int]):
+        """파싱 워커 프로세스 풀 시작 (workers가 1 이하면 풀 없이 진행)"""
+        if workers is None:
+            workers = self.parse_workers
+        if workers <= 1:
+            self._parse_pool = None
+            return
+        # 요청 스레드가 도는 중에 fork하지 않도록 spawn 방식 사용
+        self._parse_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn')
+        )
+        logger.info(f"파싱 워커 프로세스 {workers}개 사용")
+
+    def _stop_parse_pool(self):
+        """파싱 워커 프로세스 풀 종료"""
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=True, cancel_futures=True)
+            self._parse_pool = None
+
+    def _selector_hint(self, host: str) -> Tuple[Optional[str], bool]:
+        """도메인에 학습된 본문 선택자와 재검증 필요 여부"""
+        with self._stats_lock:
+            rule = self.selector_rules.get(host)
+            if not rule:
+                return None, False
+            validated_at = rule.get('validated_at') or datetime.min
+            revalidate = (
+                rule['uses_since_validation'] >= self.selector_revalidate_every
+                or datetime.utcnow() - validated_at > timedelta(days=self.selector_revalidate_days)
+            )
+            return rule['selector'], revalidate
+
+    def _record_selector(self, host: str, preferred: Optional[str], matched: str, revalidated: bool):
+        """본문 추출에 실제로 맞은 선택자를 반영해 도메인 규칙 갱신"""
+        if not matched:
+            return
+        with self._stats_lock:
+            rule = self.selector_rules.get(host)
+            if rule is None:
+                rule = self.selector_rules[host] = {
+                    'selector': matched, 'hits': 0, 'misses': 0,
+                    'uses_since_validation': 0, 'validated_at': datetime.utcnow()
+                }
+            elif matched != preferred:
+                logger.info(f"{host} 본문 선택자 재학습: {preferred} -> {matched}")
+                rule['selector'] = matched
+                rule['misses'] += 1
+                rule['uses_since_validation'] = 0
+                rule['validated_at'] = datetime.utcnow()
+            else:
+                rule['hits'] += 1
+                rule['uses_since_validation'] += 1
+                if revalidated:
+                    rule['uses_since_validation'] = 0
+                    rule['validated_at'] = datetime.utcnow()
+            self._selector_updates.add(host)
 
     def extract_article_content(self, url: str) -> str:
         """기사의 전체 내용 추출"""
+        return self.fetch_article(url)['content']
+
+    def fetch_article(self, url: str) -> Dict:
+        """기사 페이지에서 본문과 페이지가 밝힌 정규 URL 추출 (크기 상한을 둔 스트리밍 다운로드, 도메인별 학습 선택자 우선)"""
+        host = urlparse(url).netloc
+        preferred, revalidate = self._selector_hint(host)
         try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 일반적인 기사 내용 선택자들
-            content_selectors = [
-                '.entry-content',
-                '.article-content', 
-                '.post-content',
-                '.content',
-                '.article-body',
-                'main article',
-                '[class*="content"]'
-            ]
-            
-            content = ""
-            for selector in content_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    content = ' '.join([elem.get_text(strip=True) for elem in elements])
-                    break
-            
-            if not content:
-                # 백업: 모든 p 태그에서 텍스트 추출
-                paragraphs = soup.find_all('p')
-                content = ' '.join([p.get_text(strip=True) for p in paragraphs])
-            
-            return content[:5000]  # 최대 5000자로 제한
-            
+            result = self._fetch_parsed(
+                url,
+                partial(extract_article, max_chars=self.max_content_chars,
+                        preferred_selector=preferred, revalidate=revalidate),
+                timeout=10,
+                max_bytes=self.max_article_bytes,
+                # 본문 요소 하나가 상한의 2배를 넘겨야 멈춤 - 안쪽에 더 우선하는 본문 요소가 있어도 상한만큼은 받아 둠
+                stop_after_chars=self.max_content_chars * 2
+            )
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"기사 내용 추출 실패 {url}: {str(e)}")
-            return ""
+            return {'content': '', 'canonical': ''}
+
+        if isinstance(result, str):  # 이전 형식의 캐시 항목
+            return {'content': result, 'canonical': ''}
+        self._record_selector(host, preferred, result['selector'], revalidate)
+        return {'content': result['content'], 'canonical': result.get('canonical', '')}
 
     def parse_date(self, date_str: str) -> datetime:
-        """날짜 문자열을 datetime 객체로 변환"""
+        """날짜 문자열을 datetime 객체로 변환 (RSS의 RFC 822, Atom/사이트맵의 ISO 8601 포함, 로컬 시각)"""
         if not date_str:
             return datetime.now()
+        date_str = date_str.strip()
         
-        # 간단한 날짜 파싱 (실제로는 더 정교한 파싱이 필요)
+        parsed = None
         try:
+            parsed = parsedate_to_datetime(date_str)  # Tue, 07 May 2024 09:30:00 +0900
+        except (TypeError, ValueError, IndexError):
+            try:
+                parsed = datetime.fromisoformat(date_str)  # 2024-05-07T09:30:00+09:00
+            except ValueError:
+                pass
+        
+        if parsed is None:
             # 몇 가지 일반적인 날짜 형식 시도
             date_formats = [
+                '%Y-%m-%d %H:%M:%S',
+                '%Y-%m-%d %H:%M',
+                '%Y.%m.%d %H:%M:%S',
+                '%Y.%m.%d %H:%M',
                 '%Y-%m-%d',
                 '%Y.%m.%d',
                 '%m/%d/%Y',
@@ -238,287 +615,1038 @@ class NewsCrawler:
                 '%B %d, %Y',
                 '%d %B %Y'
             ]
-            
             for fmt in date_formats:
                 try:
-                    return datetime.strptime(date_str.strip(), fmt)
+                    parsed = datetime.strptime(date_str, fmt)
+                    break
                 except ValueError:
                     continue
-            
+        
+        if parsed is None:
             # 파싱 실패시 현재 시간 반환
             return datetime.now()
-        except:
-            return datetime.now()
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone().replace(tzinfo=None)
+        return parsed
 
-    def _fetch_rss_content(self, rss_urls: List[str]) -> str:
-        """RSS URL 목록에서 첫 번째로 성공하는 RSS 내용을 가져오기"""
+    def _fetch_rss_items(self, rss_urls: List[str], merge: bool = False) -> List[Dict]:
+        """RSS URL 목록에서 첫 번째로 성공하는 RSS의 기사 항목 가져오기 (merge면 모든 피드 항목을 합침)"""
+        merged = []
         for rss_url in rss_urls:
             try:
-                response = self.session.get(rss_url, timeout=15)
-                response.raise_for_status()
-                return response.text
+                items = self._fetch_parsed(rss_url, parse_feed_items)
+            except DeadlineExceeded:
+                raise
             except Exception as e:
                 logger.warning(f"RSS 요청 실패: {rss_url} ({str(e)})")
                 continue
-        return ""
+            if not merge:
+                return items
+            merged.extend(items)
+        return merged
 
-    def _extract_rss_items(self, xml_text: str) -> List[Dict]:
-        """RSS/Atom XML에서 기사 목록 추출"""
-        items = []
-        try:
-            root = ET.fromstring(xml_text)
-        except ET.ParseError as e:
-            logger.error(f"RSS XML 파싱 실패: {str(e)}")
-            return items
-
-        # RSS 2.0 형태
-        channel = root.find('channel')
-        if channel is not None:
-            for item in channel.findall('item'):
-                title = item.findtext('title', '').strip()
-                link = item.findtext('link', '').strip()
-                description = item.findtext('description', '').strip()
-                pub_date = item.findtext('pubDate', '').strip()
-
-                if not title or not link:
-                    continue
+    def _extract_rss_items(self, xml_text) -> List[Dict]:
+        """RSS/Atom XML(str 또는 bytes)에서 기사 목록 추출"""
+        return parse_feed_items(xml_text)
 
-                items.append({
-                    'title': unescape(title),
-                    'link': link,
-                    'description': description,
-                    'pub_date': pub_date
-                })
-            return items
-
-        # Atom 형태
-        ns = {'atom': 'http://www.w3.org/2005/Atom'}
-        for entry in root.findall('atom:entry', ns):
-            title = entry.findtext('atom:title', default='', namespaces=ns).strip()
-            link_elem = entry.find('atom:link', ns)
-            link = link_elem.get('href', '').strip() if link_elem is not None else ''
-            summary = entry.findtext('atom:summary', default='', namespaces=ns).strip()
-            updated = entry.findtext('atom:updated', default='', namespaces=ns).strip()
-
-            if not title or not link:
-                continue
+    def _discover_rss_candidates(self, source: Dict) -> Optional[List[Dict]]:
+        """RSS 피드에서 관련 기사 후보 목록 추출 (본문 요청 없음)
 
-            items.append({
-                'title': unescape(title),
-                'link': link,
-                'description': summary,
-                'pub_date': updated
-            })
-
-        return items
-
-    def crawl_rss_source(self, source: Dict) -> List[Dict]:
-        """RSS 기반 크롤링"""
-        articles = []
+        자동으로 찾은 피드가 실패하고 HTML 목록/선택자가 있는 소스면 None을 반환해
+        호출한 쪽이 HTML 방식으로 대신 수집하게 한다.
+        """
+        candidates = []
         rss_urls = source.get('rss_urls', [])
         if not rss_urls:
-            return articles
+            return candidates
 
-        logger.info(f"{source['name']} RSS에서 뉴스 수집 중...")
-        xml_text = self._fetch_rss_content(rss_urls)
-        if not xml_text:
+        discovered = source.get('feed_discovered', False)
+        items = self._fetch_rss_items(rss_urls, merge=discovered)
+        if discovered:
+            with self._stats_lock:
+                self._feed_results[source['name']] = bool(items)
+            if not items:
+                logger.warning(f"{source['name']} 피드 요청 실패 - HTML 목록으로 수집")
+                return None
+        self._note_source_links(source['name'], len(items))
+        if not items:
             logger.error(f"{source['name']} RSS 수집 실패: 유효한 RSS 응답 없음")
-            return articles
+            self._note_source_error(source['name'], "유효한 RSS 응답 없음")
+            return candidates
 
-        items = self._extract_rss_items(xml_text)
-        for item in items[:10]:
+        seen_links = set()
+        for item in items:
             title = item['title']
-            link = item['link']
-
-            if not self.is_relevant_article(title, item.get('description', '')):
-                continue
+            link = clean_url(item['link'])
+            if link in seen_links:
+                continue  # 여러 섹션 피드에 같은 기사가 실린 경우
+            seen_links.add(link)
 
             description = item.get('description', '')
-            content_text = ''
-            if description:
-                content_text = BeautifulSoup(description, 'html.parser').get_text(" ", strip=True)
+            matched_keywords = self.match_keywords(title, f"{description} {item.get('keywords', '')}")
+            if not matched_keywords:
+                continue
+            self.metrics.count('relevant')
 
-            if not content_text:
-                content_text = self.extract_article_content(link)
+            if self._is_known_url(link):
+                continue
 
-            if not content_text:
-                content_text = title
+            # 자동으로 찾은 피드/사이트맵은 HTML 목록 대신 쓰는 것이라 요약을 본문으로 쓰지 않고
+            # 본문 요청을 하게 둠 (설정된 RSS 소스만 기존처럼 요약을 본문으로 사용)
+            content_text = ''
+            if description and not discovered:
+                content_text = make_soup(description).get_text(" ", strip=True)
 
-            articles.append({
+            candidates.append({
                 'title': title,
                 'content': content_text,
                 'url': link,
+                'canonical_url': canonical_url(link),
                 'source': source['name'],
-                'published_date': self.parse_date(item.get('pub_date', ''))
+                'published_date': self.parse_date(item.get('pub_date', '')),
+                'matched_keywords': matched_keywords
             })
 
-        logger.info(f"{source['name']} RSS에서 {len(articles)}개 기사 수집 완료")
-        return articles
+        return candidates
 
-    def crawl_list_source(self, source: Dict) -> List[Dict]:
-        """목록 페이지 기반 크롤링"""
-        articles = []
-        list_urls = source.get('list_urls', [])
-        if not list_urls:
-            return articles
+    def _article_id(self, url: str) -> Optional[int]:
+        """기사 URL에서 기사 번호 추출 (idxno/no 파라미터 또는 마지막 숫자열)"""
+        match = re.search(r'[?&](?:idxno|no)=(\d+)', url)
+        if match:
+            return int(match.group(1))
+        numbers = re.findall(r'\d{4,}', urlparse(url).path)
+        return int(numbers[-1]) if numbers else None
 
-        link_pattern = source.get('link_pattern')
-        link_regex = source.get('link_regex')
-        seen_urls = set()
+    def _page_url(self, list_url: str, page_param: str, page: int) -> str:
+        """목록 URL의 페이지 파라미터를 바꾼 URL 생성"""
+        parsed = urlparse(list_url)
+        query = [(key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+                 if key != page_param]
+        query.append((page_param, str(page)))
+        return urlunparse(parsed._replace(query=urlencode(query)))
 
-        logger.info(f"{source['name']} 목록 페이지에서 뉴스 수집 중...")
+    def _newest_link(self, links: List[Dict]) -> Optional[Dict]:
+        """링크 목록에서 가장 최신 기사 링크 선택 (기사 번호가 가장 큰 링크, 없으면 첫 링크)"""
+        numbered = [(self._article_id(link['url']), link) for link in links]
+        numbered = [(article_id, link) for article_id, link in numbered if article_id is not None]
+        if numbered:
+            return max(numbered, key=lambda item: item[0])[1]
+        return links[0] if links else None
 
-        for list_url in list_urls:
-            try:
-                response = self.session.get(list_url, timeout=15)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
+    def _is_already_seen(self, url: str, cursor: Dict) -> bool:
+        """증분 커서 기준으로 이미 수집한 기사인지 판단"""
+        article_id = self._article_id(url)
+        if article_id is not None and cursor.get('newest_id') is not None:
+            return article_id <= cursor['newest_id']
+        return url == cursor.get('newest_url') or canonical_url(url) in self.known_urls
 
-                for anchor in soup.select('a[href]'):
-                    href = anchor.get('href', '').strip()
-                    if not href:
-                        continue
+    def _discover_list_url(self, source: Dict, list_url: str) -> List[Dict]:
+        """목록 URL 하나에서 관련 기사 후보 목록 추출 (본문 요청 없음)
 
-                    if href.startswith('/'):
-                        href = urljoin(list_url, href)
+        증분 모드에서는 이전 실행에서 본 가장 최신 기사(커서)까지만 확인하고,
+        한 페이지가 모두 새 기사일 때만 다음 페이지로 넘어간다.
+        """
+        candidates = []
+        cursor = self.list_cursors.get(list_url) if self.incremental else None
+        page_param = source.get('page_param')
+        max_pages = source.get('max_pages', self.max_list_pages) if cursor and page_param else 1
+        newest = None
+        truncated = False
+        numbered_links = []
 
-                    if link_pattern and link_pattern not in href:
-                        continue
+        for page in range(1, max_pages + 1):
+            page_url = list_url if page == 1 else self._page_url(list_url, page_param, page)
+            links = self._fetch_parsed(
+                page_url,
+                partial(parse_list_links, list_url=page_url,
+                        link_pattern=source.get('link_pattern'),
+                        link_regex=source.get('link_regex'))
+            )
+            self._note_source_links(source['name'], len(links))
+            if page == 1:
+                newest = self._newest_link(links)
+            numbered_links.extend((self._article_id(link['url']), link['url']) for link in links)
 
-                    if link_regex and not re.search(link_regex, href):
-                        continue
+            reached_seen = False
+            for link in links:
+                if cursor and self._is_already_seen(link['url'], cursor):
+                    reached_seen = True
+                    if cursor.get('newest_id') is None or self._article_id(link['url']) is None:
+                        break  # 기사 번호가 없으면 첫 기존 기사에서 중단
+                    continue  # 번호가 있으면 사이드바의 과거 기사만 건너뜀
 
-                    if href in seen_urls:
-                        continue
+                matched_keywords = self.match_keywords(link['title'])
+                if not matched_keywords:
+                    continue
+                self.metrics.count('relevant')
 
-                    title = anchor.get_text(strip=True)
-                    if not title or len(title) < 5:
-                        continue
+                if self._is_known_url(link['url']):
+                    continue
 
-                    if not self.is_relevant_article(title):
-                        continue
+                candidates.append({
+                    'title': link['title'],
+                    'content': '',
+                    'url': clean_url(link['url']),
+                    'canonical_url': canonical_url(link['url']),
+                    'source': source['name'],
+                    'published_date': datetime.now(),
+                    'matched_keywords': matched_keywords
+                })
 
-                    seen_urls.add(href)
+                if len(candidates) >= self._max_articles(source):
+                    truncated = True
+                    break
 
-                    content = self.extract_article_content(href)
-                    if not content:
-                        content = title
+            if truncated or reached_seen or not links:
+                break
 
-                    articles.append({
-                        'title': title,
-                        'content': content,
-                        'url': href,
-                        'source': source['name'],
-                        'published_date': datetime.now()
-                    })
+        # 상한에 걸려 남은 새 기사가 있으면 커서를 옮기지 않아 다음 실행에서 다시 확인.
+        # 후보를 모두 지켰는지는 실행이 끝날 때 _settle_list_cursors()에서 보고 커서를 확정
+        if self.incremental and newest and not truncated:
+            with self._stats_lock:
+                self._cursor_updates[list_url] = {
+                    'source': source['name'],
+                    'newest_url': newest['url'],
+                    'newest_id': self._article_id(newest['url']),
+                    'links': [(article_id, url) for article_id, url in numbered_links if article_id is not None]
+                }
+                for candidate in candidates:
+                    self._candidate_lists[candidate['url']] = list_url
 
-                    if len(articles) >= self.max_per_source:
-                        break
+        return candidates
 
-                if len(articles) >= self.max_per_source:
-                    break
+    def _discover_selector_candidates(self, source: Dict) -> List[Dict]:
+        """선택자 기반 소스에서 관련 기사 후보 목록 추출 (본문 요청 없음)"""
+        candidates = []
+        links = self._fetch_parsed(
+            source['url'],
+            partial(parse_selector_links, base_url=source['url'],
+                    selector=source['selector'], limit=self._max_articles(source))
+        )
+        self._note_source_links(source['name'], len(links))
 
-                time.sleep(random.uniform(1, 2))
+        for link in links:
+            # 반도체 관련성 체크
+            matched_keywords = self.match_keywords(link['title'])
+            if not matched_keywords:
+                continue
+            self.metrics.count('relevant')
 
+            if self._is_known_url(link['url']):
+                continue
+
+            candidates.append({
+                'title': link['title'],
+                'content': '',
+                'url': clean_url(link['url']),
+                'canonical_url': canonical_url(link['url']),
+                'source': source['name'],
+                'published_date': datetime.now(),  # 실제로는 각 사이트별로 날짜 파싱 필요
+                'matched_keywords': matched_keywords
+            })
+
+        return candidates
+
+    def _get_prescorer(self):
+        """제목 사전 점수용 분석기 (생성에 실패하면 키워드 수로 대신 점수 매김)"""
+        if self.prescorer is None:
+            try:
+                from news_analyzer import NewsAnalyzer
+                self.prescorer = NewsAnalyzer()
             except Exception as e:
-                logger.error(f"{source['name']} 목록 크롤링 실패: {str(e)}")
+                logger.warning(f"사전 점수 분석기 생성 실패 (키워드 수로 대신 정렬): {str(e)}")
+                self.prescorer = False
+        return self.prescorer or None
+
+    def _prescore(self, candidates: List[Dict]) -> List[Dict]:
+        """본문 요청 전에 제목(과 피드 요약)만으로 후보의 예상 우선순위 계산"""
+        scorer = self._get_prescorer()
+        for candidate in candidates:
+            if scorer is None:
+                candidate['expected_priority'] = float(len(candidate.get('matched_keywords', [])))
                 continue
+            candidate['expected_priority'] = scorer.calculate_priority({
+                'title': candidate['title'],
+                'content': candidate.get('content') or '',
+                'source': candidate['source'],
+                'published_date': candidate.get('published_date') or datetime.now()
+            })
+        return candidates
 
-        logger.info(f"{source['name']} 목록에서 {len(articles)}개 기사 수집 완료")
-        return articles
+    def _fetch_order(self, candidates: List[Dict]) -> List[Dict]:
+        """예상 우선순위가 높은 순으로 정렬 (같으면 발견 순서 유지)"""
+        return sorted(candidates, key=lambda candidate: candidate.get('expected_priority', 0.0), reverse=True)
 
-    def crawl_source(self, source: Dict) -> List[Dict]:
-        """특정 소스에서 뉴스 크롤링"""
-        if source.get('list_urls'):
-            return self.crawl_list_source(source)
+    def _admit_candidates(self, source: Dict, candidates: List[Dict]) -> List[Dict]:
+        """후보에 예상 우선순위를 매기고 상위 _max_articles(source)개를 이 소스의 본문 요청 대상으로 반환
 
-        if source.get('rss_urls'):
-            return self.crawl_rss_source(source)
+        프런티어가 있으면 후보를 기록한 뒤 우선순위 순으로 임대하므로,
+        이전 실행에서 발견만 하고 본문을 받지 못한 항목도 함께 경쟁한다.
+        """
+        limit = self._max_articles(source)
+        candidates = self._fetch_order(self._prescore(candidates))
+        if self.frontier is None:
+            for candidate in candidates[limit:]:
+                self._drop_candidate(candidate)
+            return candidates[:limit]
+        try:
+            self.frontier.add(candidates)
+        except Exception as e:
+            logger.warning(f"{source['name']} 프런티어 기록 실패 (메모리에서 진행, 목록 커서 유지): {str(e)}")
+            with self._stats_lock:
+                self._cursor_blocked.add(source['name'])
+            return candidates[:limit]
+        try:
+            entries = self.frontier.claim(DISCOVERED, limit, source=source['name'])
+            return [entry_to_candidate(entry) for entry in entries]
+        except Exception as e:
+            logger.warning(f"{source['name']} 프런티어 임대 실패 (메모리에서 진행): {str(e)}")
+            return candidates[:limit]
 
+    def _max_articles(self, source: Dict) -> int:
+        """소스 하나에서 본문을 요청할 최대 기사 수 (소스 설정 max_articles, 없으면 max_per_source)"""
+        return source.get('max_articles', self.max_per_source)
+
+    def _drop_candidate(self, candidate: Dict):
+        """프런티어에 남기지 못하고 버리는 목록 후보 기록 - 그 목록의 커서가 이 후보를 넘어가지 않게 함"""
+        with self._stats_lock:
+            list_url = self._candidate_lists.get(candidate['url'])
+            if list_url is not None:
+                self._dropped_ids.setdefault(list_url, []).append(self._article_id(candidate['url']))
+
+    def _reserve_fetch(self) -> bool:
+        """실행 예산(요청 수/경과 시간)에서 본문 요청 한 건을 예약 (예산을 다 썼으면 False)"""
+        with self._stats_lock:
+            if self.fetch_budget_requests and self.run_stats['body_fetches'] >= self.fetch_budget_requests:
+                return False
+            if self.fetch_budget_seconds and time.monotonic() - self._run_started >= self.fetch_budget_seconds:
+                return False
+            self.run_stats['body_fetches'] += 1
+            return True
+
+    def _defer_candidate(self, candidate: Dict, deadline: bool = False):
+        """예산(또는 마감 시간)을 넘은 후보는 본문을 받지 않고 다음 실행으로 미룸"""
+        with self._stats_lock:
+            if deadline:
+                self.run_stats['deadline_deferred'] += 1
+                self._source_result(candidate['source'])['unfinished'] = True
+            else:
+                self.run_stats['budget_deferred'] += 1
+        if self.frontier is not None and candidate.get('frontier_id'):
+            try:
+                self.frontier.unclaim(candidate['frontier_id'])
+            except Exception as e:
+                logger.warning(f"프런티어 임대 해제 실패 {candidate['url']}: {str(e)}")
+        else:
+            self._drop_candidate(candidate)  # 프런티어가 없으면 다음 실행에서 목록으로 다시 찾아야 함
+
+    def _complete_article(self, candidate: Dict) -> Optional[Dict]:
+        """후보에 본문이 없으면 기사 페이지에서 본문을 채워 반환 (예산 초과로 미루면 None)"""
+        started = time.perf_counter()
+        article = dict(candidate)
+        if not article.get('content'):
+            if self._deadline_passed():
+                self._defer_candidate(article, deadline=True)
+                return None
+            if not self._reserve_fetch():
+                self._defer_candidate(article)
+                return None
+            try:
+                with attribute(article['source']):
+                    page = self.fetch_article(article['url'])
+            except DeadlineExceeded:
+                self._defer_candidate(article, deadline=True)
+                return None
+            article['content'] = page['content']
+            page_canonical = self._page_canonical(article['url'], page['canonical'])
+            if page_canonical:
+                article['canonical_url'] = page_canonical
+                if self._is_canonical_duplicate(article):
+                    return None
+        if not article['content']:
+            article['content'] = article['title']  # 내용을 가져올 수 없으면 제목만 사용
+        article.setdefault('canonical_url', canonical_url(article['url']))
+        with self._stats_lock:
+            self._run_canonicals.add(article['canonical_url'])
+        if self.frontier is not None and article.get('frontier_id'):
+            try:
+                self.frontier.advance(article['frontier_id'], FETCHED, content=article['content'],
+                                      canonical_url=article['canonical_url'])
+            except Exception as e:
+                logger.warning(f"프런티어 상태 갱신 실패 {article['url']}: {str(e)}")
+        self._note_source_articles(article['source'], 1, time.perf_counter() - started)
+        logger.debug(f"수집된 기사: {article['title'][:50]}...")
+        return article
+
+    def _page_canonical(self, url: str, declared: str) -> Optional[str]:
+        """페이지가 밝힌 정규 URL을 정규화해서 반환 (없거나 사이트 첫 페이지를 가리키면 None)"""
+        if not declared:
+            return None
+        declared = canonical_url(declared, base_url=url)
+        if urlparse(declared).path in ('', '/'):
+            return None  # 모든 기사에 홈페이지를 canonical로 넣는 사이트가 있음
+        return declared
+
+    def _is_canonical_duplicate(self, article: Dict) -> bool:
+        """페이지 정규 URL이 이미 저장됐거나 이번 실행에서 받은 기사면 중복 처리하고 True"""
+        key = article['canonical_url']
+        with self._stats_lock:
+            duplicate = key in self.known_urls or key in self._run_canonicals
+            self._run_canonicals.add(key)
+            if duplicate:
+                self.run_stats['canonical_duplicates'] += 1
+        if duplicate:
+            self.metrics.count('duplicates', source=article['source'])
+        if not duplicate:
+            return False
+        logger.info(f"정규 URL이 같은 기사 건너뜀: {article['url']} -> {key}")
+        if self.frontier is not None and article.get('frontier_id'):
+            try:
+                self.frontier.advance(article['frontier_id'], DUPLICATE, canonical_url=key)
+            except Exception as e:
+                logger.warning(f"프런티어 상태 갱신 실패 {article['url']}: {str(e)}")
+        return True
+
+    def _complete_candidates(self, candidates: List[Dict]) -> List[Dict]:
+        """후보 본문을 예상 우선순위 순으로 채움 (예산 초과로 미룬 후보는 제외)"""
         articles = []
-        try:
-            logger.info(f"{source['name']}에서 뉴스 수집 중...")
-            
-            response = self.session.get(source['url'], timeout=15)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            article_elements = soup.select(source['selector']['articles'])
-            
-            for element in article_elements[:self.max_per_source]:  # 최대 기사 수 제한
+        for candidate in self._fetch_order(candidates):
+            article = self._complete_article(candidate)
+            if article is not None:
+                articles.append(article)
+        return articles
+
+    def _discover_source(self, source: Dict) -> List[Dict]:
+        """소스에서 기사 후보를 찾아 본문 요청 대상으로 반환 (목록 URL은 모두 확인)"""
+        started = time.perf_counter()
+        candidates = None
+        if source.get('rss_urls'):
+            logger.info(f"{source['name']} RSS에서 뉴스 수집 중...")
+            candidates = self._discover_rss_candidates(source)
+        if candidates is None and source.get('list_urls'):
+            logger.info(f"{source['name']} 목록 페이지에서 뉴스 수집 중...")
+            candidates = []
+            for list_url in source['list_urls']:
                 try:
-                    # 제목 추출
-                    title_elem = element.select_one(source['selector']['title'])
-                    if not title_elem:
-                        continue
-                    title = title_elem.get_text(strip=True)
-                    
-                    # 링크 추출
-                    link_elem = element.select_one(source['selector']['link'])
-                    if not link_elem:
-                        continue
-                    
-                    link = link_elem.get('href', '')
-                    if link.startswith('/'):
-                        link = urljoin(source['url'], link)
-                    
-                    # 반도체 관련성 체크
-                    if not self.is_relevant_article(title):
-                        continue
-                    
-                    # 기사 내용 추출
-                    content = self.extract_article_content(link)
-                    if not content:
-                        content = title  # 내용을 가져올 수 없으면 제목만 사용
-                    
-                    article_data = {
-                        'title': title,
-                        'content': content,
-                        'url': link,
-                        'source': source['name'],
-                        'published_date': datetime.now(),  # 실제로는 각 사이트별로 날짜 파싱 필요
-                    }
-                    
-                    articles.append(article_data)
-                    logger.debug(f"수집된 기사: {title[:50]}...")
-                    
-                    # 요청 간 지연
-                    time.sleep(random.uniform(1, 3))
-                    
+                    candidates.extend(self._discover_list_url(source, list_url))
+                    if len(self._dedupe_articles(candidates)) >= self._max_articles(source):
+                        break
+                except DeadlineExceeded:
+                    raise
                 except Exception as e:
-                    logger.error(f"기사 파싱 오류: {str(e)}")
+                    logger.error(f"{source['name']} 목록 크롤링 실패: {str(e)}")
+                    self._note_source_error(source['name'], e)
                     continue
-            
+            candidates = self._dedupe_articles(candidates)
+        elif candidates is None:
+            logger.info(f"{source['name']}에서 뉴스 수집 중...")
+            candidates = self._discover_selector_candidates(source)
+        candidates = self._admit_candidates(source, candidates)
+        self._note_source_articles(source['name'], 0, time.perf_counter() - started)
+        return candidates
+
+    def crawl_rss_source(self, source: Dict) -> List[Dict]:
+        """RSS 기반 크롤링"""
+        if not source.get('rss_urls'):
+            return []
+        return self.crawl_source(source)
+
+    def crawl_list_source(self, source: Dict) -> List[Dict]:
+        """목록 페이지 기반 크롤링 (목록 URL을 모두 확인한 뒤 예상 우선순위 순으로 본문 요청)"""
+        if not source.get('list_urls'):
+            return []
+        return self.crawl_source(source)
+
+    def crawl_source(self, source: Dict) -> List[Dict]:
+        """특정 소스에서 뉴스 크롤링"""
+        articles = []
+        try:
+            articles = self._complete_candidates(self._discover_source(source))
             logger.info(f"{source['name']}에서 {len(articles)}개 기사 수집 완료")
-            
+        except DeadlineExceeded:
+            self._note_source_unfinished(source['name'])
         except Exception as e:
             logger.error(f"{source['name']} 크롤링 실패: {str(e)}")
-        
+            self._note_source_error(source['name'], e)
+            self._note_source_articles(source['name'], 0)
         return articles
 
-    def crawl_semiconductor_news(self) -> List[Dict]:
-        """모든 소스에서 반도체 뉴스 크롤링"""
-        logger.info("반도체 뉴스 크롤링 시작...")
-        all_articles = []
-        
-        for source in self.news_sources:
-            try:
-                articles = self.crawl_source(source)
-                all_articles.extend(articles)
-                time.sleep(2)  # 소스 간 지연
-            except Exception as e:
-                logger.error(f"소스 {source['name']} 크롤링 실패: {str(e)}")
-                continue
-        
-        # 중복 제거 (URL 기준)
+    def _dedupe_articles(self, all_articles: List[Dict]) -> List[Dict]:
+        """정규 URL 기준 중복 제거 (추적 파라미터/호스트 별칭만 다른 URL은 같은 기사)"""
         unique_articles = []
         seen_urls = set()
         
         for article in all_articles:
-            if article['url'] not in seen_urls:
+            key = article.get('canonical_url') or canonical_url(article['url'])
+            if key not in seen_urls:
                 unique_articles.append(article)
-                seen_urls.add(article['url'])
+                seen_urls.add(key)
+        
+        return unique_articles
+
+    def set_db_state(self, enabled: bool):
+        """실행 간 DB 상태 사용 여부 설정 (끄면 매 실행이 빈 상태에서 시작하고 아무것도 저장하지 않음)"""
+        self.use_db_state = enabled
+        self.http_cache = HttpValidatorCache(
+            max_age_days=Config.HTTP_CACHE_MAX_AGE_DAYS,
+            persistent=enabled
+        )
+
+    def _begin_crawl_run(self, deadline: Optional[float] = None, mode: str = 'sync'):
+        """크롤링 실행 시작 - 실행 단위 상태 준비 (deadline: 지금부터 남은 실행 시간(초))"""
+        self.http_cache.load()
+        for key in self.http_cache.stats:
+            self.http_cache.stats[key] = 0
+        self.run_stats = self._empty_run_stats()
+        self.metrics = CrawlMetrics()
+        self._run_mode = mode
+        self._run_deadline_seconds = deadline
+        self._run_started = time.monotonic()
+        self._deadline = self._run_started + deadline if deadline else None
+        self.unfinished_sources = []
+        self.source_results = {}
+        self._cursor_updates = {}
+        self._candidate_lists = {}
+        self._dropped_ids = {}
+        self._cursor_blocked = set()
+        self._selector_updates = set()
+        self._run_canonicals = set()
+        self._feed_results = {}
+        if not self.use_db_state:
+            self.known_urls = set()
+            self.list_cursors = {}
+            self.selector_rules = {}
+            self.source_feeds = {}
+            self.breaker.states = {}
+            return
+        self.breaker.load()
+        self.known_urls = self._load_known_urls()
+        self.list_cursors = self._load_list_cursors() if self.incremental else {}
+        self.selector_rules = self._load_selector_rules()
+        self.source_feeds = self._load_source_feeds()
+
+    def _source_result(self, name: str) -> Dict:
+        result = self.source_results.get(name)
+        if result is None:
+            result = self.source_results[name] = {
+                'articles': 0, 'links': 0, 'errors': 0, 'error': None,
+                'failed': False, 'skipped': False, 'unfinished': False, 'seconds': 0.0
+            }
+        return result
+
+    def _note_source_links(self, name: str, count: int):
+        """소스 목록/피드에서 찾은 링크 수 기록 (관련성/중복 필터 전, 0이면 선택자 고장 의심)"""
+        with self._stats_lock:
+            self._source_result(name)['links'] += count
+
+    def _note_source_error(self, name: str, error):
+        """소스 크롤링 중 발생한 오류 기록"""
+        with self._stats_lock:
+            result = self._source_result(name)
+            result['errors'] += 1
+            result['error'] = str(error)
+
+    def _note_source_unfinished(self, name: str):
+        """마감 시간 때문에 끝까지 크롤링하지 못한 소스 기록"""
+        with self._stats_lock:
+            self._source_result(name)['unfinished'] = True
+
+    def _note_source_articles(self, name: str, count: int, seconds: float = 0.0):
+        """소스에서 수집한 새 기사 수와 걸린 시간 기록"""
+        with self._stats_lock:
+            result = self._source_result(name)
+            result['articles'] += count
+            result['seconds'] += seconds
+            # 일부 목록 URL만 실패했으면 실패로 보지 않음
+            result['failed'] = result['errors'] > 0 and result['articles'] == 0
+
+    def _select_sources(self, sources: Optional[List[str]]) -> List[Dict]:
+        """크롤링할 소스 목록 (sources가 None이면 전체, 아니면 이름으로 선택)"""
+        if sources is None:
+            selected = list(self.news_sources)
+        else:
+            names = set(sources)
+            selected = [source for source in self.news_sources if source['name'] in names]
+
+        states = {}
+        for source in selected:
+            state = self.breaker.allow(source['name'])
+            if state is None:
+                logger.info(f"{source['name']} 서킷 브레이커 open - 이번 실행에서 건너뜀")
+                with self._stats_lock:
+                    self._source_result(source['name'])['skipped'] = True
+                continue
+            states[source['name']] = state
+
+        selected = [source for source in selected if source['name'] in states]
+        if self._deadline is None:
+            # 피드 탐색은 요청이 많아 마감 시간이 있는 실행(웹 요청)에서는 하지 않음
+            self._discover_feeds(selected)
+
+        allowed = []
+        for source in selected:
+            state = states[source['name']]
+            source = self._with_feed(source)
+            if state == HALF_OPEN:
+                # 시험 요청은 첫 번째 목록/피드 URL의 첫 페이지와 기사 본문 최대 1개만
+                source = dict(source, max_pages=1, max_articles=1)
+                for key in ('list_urls', 'rss_urls'):
+                    if source.get(key):
+                        source[key] = source[key][:1]
+            allowed.append(source)
+        return allowed
+
+    def _with_feed(self, source: Dict) -> Dict:
+        """소스에 찾아 둔 피드가 있으면 피드를 먼저 쓰는 소스 설정으로 바꿔 반환"""
+        if source.get('rss_urls'):
+            return source
+        feed = self.source_feeds.get(source['name'])
+        if not feed or not feed['feed_urls'] or feed['failures'] >= Config.FEED_MAX_FAILURES:
+            return source
+        return dict(source, rss_urls=list(feed['feed_urls']), feed_discovered=True)
+
+    def _fetch_for_discovery(self, url: str) -> Optional[bytes]:
+        """피드 탐색용 GET - 200 응답 본문, 실패하면 None"""
+        started = time.perf_counter() - self.scheduler.prepaid_seconds(url)
+        wait_seconds = 0.0
+        try:
+            response, wait_seconds = self.scheduler.request(url, deadline=self._deadline,
+                                                            timeout=self._request_timeout(10), stream=True)
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.debug(f"피드 탐색 요청 실패 {url}: {str(e)}")
+            wait_seconds += getattr(e, 'host_wait_seconds', 0.0)
+            self.metrics.record_request(time.perf_counter() - started - wait_seconds, wait_seconds, error=e)
+            return None
+        if response.status_code != 200:
+            response.close()
+            self.metrics.record_request(time.perf_counter() - started - wait_seconds, wait_seconds)
+            return None
+        body, _ = self._read_body(response, max_bytes=self.max_article_bytes * 8)
+        self.metrics.record_request(time.perf_counter() - started - wait_seconds, wait_seconds, size=len(body))
+        return body
+
+    def _discover_feeds(self, sources: List[Dict], force: bool = False):
+        """피드 확인 주기가 지난 소스(설정에 rss_urls가 없는 소스)의 피드를 찾아 저장"""
+        if not (self.use_db_state and self.feed_discovery_enabled):
+            return
+        recheck_before = datetime.utcnow() - timedelta(days=Config.FEED_DISCOVERY_RECHECK_DAYS)
+        due = []
+        for source in sources:
+            feed = self.source_feeds.get(source['name'])
+            if source.get('rss_urls'):
+                continue
+            if force or not feed or not feed.get('checked_at') or feed['checked_at'] < recheck_before:
+                due.append(source)
+        if not due:
+            return
+
+        logger.info(f"피드 탐색: {', '.join(source['name'] for source in due)}")
+        discovery = FeedDiscovery(self._fetch_for_discovery)
+        updates = {}
+        with ThreadPoolExecutor(max_workers=min(len(due), self.max_concurrency)) as executor:
+            results = executor.map(lambda source: (source, self._discover_source_feeds(discovery, source)), due)
+            for source, result in results:
+                if result is None:
+                    continue
+                updates[source['name']] = {**result, 'checked_at': datetime.utcnow(), 'failures': 0}
+                if result['feed_urls']:
+                    logger.info(f"{source['name']} 피드 발견 ({result['kind']}): {', '.join(result['feed_urls'])}")
+                else:
+                    logger.info(f"{source['name']} 피드 없음 - HTML 목록 사용")
+        self.source_feeds.update(
+            {name: {**self.source_feeds.get(name, {}), 'source': name, **data} for name, data in updates.items()}
+        )
+        self._save_source_feeds(updates)
+
+    def _discover_source_feeds(self, discovery: FeedDiscovery, source: Dict) -> Optional[Dict]:
+        try:
+            with attribute(source['name']):
+                return discovery.discover(source)
+        except Exception as e:
+            logger.warning(f"{source['name']} 피드 탐색 실패: {str(e)}")
+            return None
+
+    def refresh_feeds(self, names: Optional[List[str]] = None, force: bool = False) -> Dict[str, Dict]:
+        """크롤링 없이 피드 탐색만 실행하고 소스별 피드 정보를 반환"""
+        self.source_feeds = self._load_source_feeds() if self.use_db_state else {}
+        sources = [source for source in self.news_sources if names is None or source['name'] in names]
+        self._discover_feeds(sources, force=force)
+        return {source['name']: self.source_feeds[source['name']]
+                for source in sources if source['name'] in self.source_feeds}
+
+    def _load_source_feeds(self) -> Dict[str, Dict]:
+        """소스별로 찾아 둔 피드 주소 로드"""
+        session = get_db_session()
+        try:
+            return get_source_feeds(session)
+        except Exception as e:
+            logger.warning(f"피드 주소 로드 실패 (HTML 목록으로 진행): {str(e)}")
+            return {}
+        finally:
+            session.close()
+
+    def _save_source_feeds(self, updates: Dict[str, Dict]):
+        if not updates:
+            return
+        session = get_db_session()
+        try:
+            save_source_feeds(updates, session)
+        except Exception as e:
+            logger.warning(f"피드 주소 저장 실패: {str(e)}")
+            session.rollback()
+        finally:
+            session.close()
+
+    def _save_feed_results(self):
+        """자동으로 찾은 피드의 성공/실패 반영 (연속 실패가 FEED_MAX_FAILURES번이면 다음 실행에서 다시 탐색)"""
+        updates = {}
+        for name, ok in self._feed_results.items():
+            feed = self.source_feeds.get(name)
+            if not feed:
+                continue
+            failures = 0 if ok else feed['failures'] + 1
+            if failures == feed['failures']:
+                continue
+            feed['failures'] = failures
+            updates[name] = {'failures': failures}
+            if failures >= Config.FEED_MAX_FAILURES:
+                logger.warning(f"{name} 피드가 {failures}회 연속 실패 - HTML 목록으로 돌아가고 다음 실행에서 다시 탐색")
+                feed['checked_at'] = None
+                updates[name]['checked_at'] = None
+        self._save_source_feeds(updates)
+
+    def _load_list_cursors(self) -> Dict[str, Dict]:
+        """목록 URL별 증분 커서 로드"""
+        session = get_db_session()
+        try:
+            return get_list_cursors(session)
+        except Exception as e:
+            logger.warning(f"증분 커서 로드 실패 (전체 목록 확인으로 진행): {str(e)}")
+            return {}
+        finally:
+            session.close()
+
+    def _load_selector_rules(self) -> Dict[str, Dict]:
+        """도메인별 학습된 본문 선택자 로드"""
+        session = get_db_session()
+        try:
+            return get_selector_rules(session)
+        except Exception as e:
+            logger.warning(f"본문 선택자 규칙 로드 실패 (전체 선택자로 진행): {str(e)}")
+            return {}
+        finally:
+            session.close()
+
+    def _save_selector_rules(self):
+        """이번 실행에서 갱신된 본문 선택자 규칙 저장"""
+        if not self._selector_updates:
+            return
+        with self._stats_lock:
+            updates = {host: dict(self.selector_rules[host]) for host in self._selector_updates}
+        session = get_db_session()
+        try:
+            save_selector_rules(updates, session)
+        except Exception as e:
+            logger.warning(f"본문 선택자 규칙 저장 실패: {str(e)}")
+            session.rollback()
+        finally:
+            session.close()
+
+    def _settle_list_cursors(self) -> Dict[str, Dict]:
+        """저장할 증분 커서 확정 - 놓친 후보(상한/예산 초과로 버린 후보)를 넘어가지 않게 커서를 줄임
+
+        커서보다 번호가 작거나 같은 기사는 다음 실행에서 이미 본 것으로 건너뛰므로,
+        놓친 후보가 있으면 그중 가장 작은 번호보다 앞선 링크까지만 옮긴다.
+        번호가 없는 후보를 놓쳤거나 프런티어 기록에 실패한 소스는 커서를 옮기지 않는다.
+        """
+        settled = {}
+        for list_url, update in self._cursor_updates.items():
+            if update['source'] in self._cursor_blocked:
+                continue
+            dropped = self._dropped_ids.get(list_url)
+            if dropped:
+                if None in dropped or update['newest_id'] is None:
+                    continue
+                kept = [(article_id, url) for article_id, url in update['links'] if article_id < min(dropped)]
+                if not kept:
+                    continue
+                newest_id, newest_url = max(kept)
+                previous = self.list_cursors.get(list_url) or {}
+                if previous.get('newest_id') is not None and newest_id <= previous['newest_id']:
+                    continue
+                update = {**update, 'newest_id': newest_id, 'newest_url': newest_url}
+            settled[list_url] = {key: update[key] for key in ('source', 'newest_url', 'newest_id')}
+        return settled
+
+    def _save_list_cursors(self):
+        """이번 실행에서 갱신된 증분 커서 저장"""
+        self._cursor_updates = self._settle_list_cursors()
+        if not self._cursor_updates:
+            return
+        session = get_db_session()
+        try:
+            save_list_cursors(self._cursor_updates, session)
+        except Exception as e:
+            logger.warning(f"증분 커서 저장 실패: {str(e)}")
+            session.rollback()
+        finally:
+            session.close()
+
+    def _empty_run_stats(self) -> Dict:
+        """실행 단위 통계 초기값"""
+        return {
+            'known_skipped': 0,
+            'truncated_downloads': 0,
+            'bytes_not_downloaded': 0,
+            'parse_seconds': 0.0,
+            'body_fetches': 0,
+            'budget_deferred': 0,
+            'deadline_deferred': 0,
+            'host_wait_deferred': 0,
+            'canonical_duplicates': 0
+        }
+
+    def _load_known_urls(self) -> set:
+        """DB에 저장된 기사 URL 집합을 한 번에 로드"""
+        session = get_db_session()
+        try:
+            known_urls = get_known_article_urls(session)
+            logger.info(f"저장된 기사 URL {len(known_urls)}개 로드 (본문 재요청 생략)")
+            return known_urls
+        except Exception as e:
+            logger.warning(f"기사 URL 목록 로드 실패 (전체 수집으로 진행): {str(e)}")
+            return set()
+        finally:
+            session.close()
+
+    def _finish_crawl_run(self, all_articles: List[Dict]) -> List[Dict]:
+        """크롤링 실행 종료 - 중복 제거, 캐시 저장, 절감 통계 기록"""
+        unique_articles = self._dedupe_articles(all_articles)
+        self.unfinished_sources = sorted(
+            name for name, result in self.source_results.items() if result['unfinished']
+        )
+        self.http_cache.save()
+        if self.use_db_state:
+            self._save_list_cursors()
+            self._save_selector_rules()
+            self._save_feed_results()
+            self.breaker.record_run(self.source_results)
+        self.last_crawl_stats = {
+            **self.http_cache.stats, **self.run_stats, 'unfinished_sources': list(self.unfinished_sources)
+        }
+        if self.use_db_state:
+            self.last_run_id = self.metrics.save(
+                self._run_mode, len(unique_articles), self.source_results, self.last_crawl_stats,
+                deadline=self._run_deadline_seconds, unfinished_sources=self.unfinished_sources
+            )
+        logger.info(f"HTTP 캐시 통계: {self.http_cache.summary()}")
+        logger.info(f"이미 저장된 기사 {self.run_stats['known_skipped']}개 본문 요청 생략")
+        logger.info(
+            f"본문 조기 중단 {self.run_stats['truncated_downloads']}건 "
+            f"(미수신 {self.run_stats['bytes_not_downloaded']:,}B), "
+            f"파싱 시간 {self.run_stats['parse_seconds']:.2f}초"
+        )
+        for name, result in self.source_results.items():
+            if not result['skipped']:
+                logger.info(f"{name}에서 {result['articles']}개 기사 수집 완료")
+        if self.run_stats['budget_deferred']:
+            logger.info(
+                f"본문 요청 예산 초과로 {self.run_stats['budget_deferred']}개 기사 다음 실행으로 미룸 "
+                f"(요청 {self.run_stats['body_fetches']}건)"
+            )
+        if self.unfinished_sources:
+            logger.warning(
+                f"마감 시간까지 끝내지 못한 소스 {len(self.unfinished_sources)}개: "
+                f"{', '.join(self.unfinished_sources)} (기사 {self.run_stats['deadline_deferred']}개 다음 실행으로 미룸)"
+            )
+        return unique_articles
+
+    def crawl_semiconductor_news(self, concurrent: Optional[bool] = None,
+                                 workers: Optional[int] = None,
+                                 sources: Optional[List[str]] = None,
+                                 deadline: Optional[float] = None) -> List[Dict]:
+        """모든 소스(또는 sources로 지정한 소스)에서 반도체 뉴스 크롤링
+
+        concurrent가 None이면 Config.CRAWL_CONCURRENT 설정을 따른다.
+        동시 모드는 asyncio 엔진을 사용하며 반환 형식은 순차 모드와 같다.
+        workers는 HTML 파싱 워커 프로세스 수 (None이면 Config.CRAWL_PARSE_WORKERS).
+        본문은 모든 소스의 후보를 제목 사전 점수 순으로 정렬해 요청하고, 요청 수/시간
+        예산(fetch_budget_requests, fetch_budget_seconds)을 넘은 후보는 다음 실행으로 미룬다.
+        deadline(초)을 주면 그 시간이 지나는 즉시 남은 요청을 취소하고 그때까지 모은
+        기사만 반환하며, 끝내지 못한 소스는 self.unfinished_sources에 남는다.
+        소스별 결과는 실행 후 self.source_results에 남는다.
+        """
+        if concurrent is None:
+            concurrent = self.concurrent
+        if concurrent:
+            return asyncio.run(self.crawl_semiconductor_news_async(workers=workers, sources=sources,
+                                                                   deadline=deadline))
+
+        logger.info("반도체 뉴스 크롤링 시작...")
+        self._begin_crawl_run(deadline)
+        self._start_parse_pool(workers)
+        candidates = []
+        
+        try:
+            # 모든 소스의 후보를 먼저 모은 뒤, 소스와 관계없이 예상 우선순위 순으로 본문 요청
+            for source in self._select_sources(sources):
+                try:
+                    with attribute(source['name']):
+                        candidates.extend(self._discover_source(source))
+                except DeadlineExceeded:
+                    self._note_source_unfinished(source['name'])
+                    continue
+                except Exception as e:
+                    logger.error(f"소스 {source['name']} 크롤링 실패: {str(e)}")
+                    self._note_source_error(source['name'], e)
+                    self._note_source_articles(source['name'], 0)
+                    continue
+            all_articles = self._complete_candidates(candidates)
+        finally:
+            self._stop_parse_pool()
         
+        unique_articles = self._finish_crawl_run(all_articles)
+        
+        logger.info(f"총 {len(unique_articles)}개의 고유 기사 수집 완료")
+        return unique_articles
+
+    async def crawl_semiconductor_news_async(self, workers: Optional[int] = None,
+                                             sources: Optional[List[str]] = None,
+                                             deadline: Optional[float] = None) -> List[Dict]:
+        """모든 소스와 기사 본문을 동시에 크롤링 (asyncio)
+
+        전체 동시 요청 수는 max_concurrency, 호스트별 동시 요청 수는
+        per_host_concurrency로 제한한다. 요청 자체는 기존 requests 세션을
+        스레드에서 실행하고, workers가 2 이상이면 HTML 파싱은 워커 프로세스에서
+        실행되어 요청 스레드끼리 GIL을 두고 다투지 않는다.
+        deadline(초)이 지나면 끝나지 않은 요청 작업을 취소하고 그때까지 모은 기사를 반환한다.
+        """
+        logger.info("반도체 뉴스 동시 크롤링 시작...")
+        self._begin_crawl_run(deadline, mode='async')
+        self._start_parse_pool(workers)
+        loop = asyncio.get_running_loop()
+        # 전용 스레드 풀 - 마감 때 취소한 요청 스레드를 기다리지 않고 바로 반환하기 위해 기본 풀을 쓰지 않음
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency + 4, thread_name_prefix='crawl')
+        global_limit = asyncio.Semaphore(self.max_concurrency)
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+
+        def in_thread(func, *args):
+            # 소스 이름 같은 컨텍스트 변수를 작업 스레드로 전달
+            return loop.run_in_executor(executor, contextvars.copy_context().run, partial(func, *args))
+
+        async def limited(url: str, func, *args):
+            # 호스트 슬롯 -> 호스트 간격 대기 -> 전체 슬롯 순서로 잡아, 한 호스트 대기열이
+            # 전체 슬롯을 붙잡고 다른 호스트 요청을 굶기지 않게 함
+            host = urlparse(url).netloc
+            if host not in host_limits:
+                host_limits[host] = asyncio.Semaphore(self.per_host_concurrency)
+            async with host_limits[host]:
+                try:
+                    waited = await in_thread(self.scheduler.reserve, url, self._deadline)
+                except DeadlineExceeded:
+                    # 마감 전에 호스트 차례가 오지 않음 - 요청하지 않고 미완료로 (호출한 쪽이 미룸)
+                    with self._stats_lock:
+                        self.run_stats['host_wait_deferred'] += 1
+                    raise
+                if waited > 0:
+                    await asyncio.sleep(waited)
+                async with global_limit:
+                    with self.scheduler.prepaid(url, waited):
+                        return await in_thread(func, *args)
+
+        async def until_deadline(coros) -> List[Tuple[bool, object]]:
+            # 마감까지 끝난 작업은 (True, 결과), 취소했거나 마감(호스트 대기 포함)에 걸린 작업은 (False, None)
+            tasks = [asyncio.ensure_future(coro) for coro in coros]
+            if not tasks:
+                return []
+            done, pending = await asyncio.wait(tasks, timeout=self._time_left())
+            for task in pending:
+                task.cancel()
+            if pending:
+                logger.warning(f"마감 시간 도달: 진행 중인 작업 {len(pending)}개 취소")
+            results = []
+            for task in tasks:
+                error = task.exception() if task in done else None
+                if task not in done or error is not None:
+                    if error is not None and not isinstance(error, DeadlineExceeded):
+                        logger.error(f"크롤링 작업 실패: {str(error)}")
+                    results.append((False, None))
+                else:
+                    results.append((True, task.result()))
+            return results
+
+        async def discover(source: Dict) -> List[Dict]:
+            if source.get('rss_urls'):
+                candidates = await limited(source['rss_urls'][0], self._discover_rss_candidates, source)
+                if candidates is not None:
+                    return candidates
+
+            if source.get('list_urls'):
+                pages = await asyncio.gather(
+                    *(limited(list_url, self._discover_list_url, source, list_url)
+                      for list_url in source['list_urls']),
+                    return_exceptions=True
+                )
+                candidates = []
+                for list_url, page in zip(source['list_urls'], pages):
+                    if isinstance(page, DeadlineExceeded):
+                        self._note_source_unfinished(source['name'])
+                        continue
+                    if isinstance(page, Exception):
+                        logger.error(f"{source['name']} 목록 크롤링 실패 {list_url}: {str(page)}")
+                        self._note_source_error(source['name'], page)
+                        continue
+                    candidates.extend(page)
+                return self._dedupe_articles(candidates)
+
+            return await limited(source['url'], self._discover_selector_candidates, source)
+
+        async def discover_one(source: Dict) -> List[Dict]:
+            started = time.perf_counter()
+            current_source.set(source['name'])  # 작업(task)마다 컨텍스트가 따로라 다른 소스에 영향 없음
+            try:
+                candidates = await discover(source)
+                candidates = await in_thread(self._admit_candidates, source, candidates)
+            except DeadlineExceeded:
+                self._note_source_unfinished(source['name'])
+                candidates = []
+            except Exception as e:
+                logger.error(f"소스 {source['name']} 크롤링 실패: {str(e)}")
+                self._note_source_error(source['name'], e)
+                candidates = []
+            self._note_source_articles(source['name'], 0, time.perf_counter() - started)
+            return candidates
+
+        all_articles = []
+        try:
+            # 모든 소스의 후보를 모은 뒤 예상 우선순위 순으로 요청을 시작 (세마포어 대기열도 이 순서)
+            selected = self._select_sources(sources)
+            discovered = await until_deadline(discover_one(source) for source in selected)
+            candidates = []
+            for source, (finished, found) in zip(selected, discovered):
+                if finished:
+                    candidates.extend(found)
+                else:
+                    self._note_source_unfinished(source['name'])
+            candidates = self._fetch_order(candidates)
+
+            results = await until_deadline(
+                limited(candidate['url'], self._complete_article, candidate) for candidate in candidates
+            )
+            for candidate, (finished, article) in zip(candidates, results):
+                if not finished:
+                    self._defer_candidate(candidate, deadline=True)
+                elif article is not None:
+                    all_articles.append(article)
+        finally:
+            # 취소한 작업의 스레드는 남은 타임아웃 안에 스스로 끝남 (마감 이후 실패는 DeadlineExceeded)
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._stop_parse_pool()
+
+        unique_articles = self._finish_crawl_run(all_articles)
+
         logger.info(f"총 {len(unique_articles)}개의 고유 기사 수집 완료")
         return unique_articles
 
@@ -0,0 +1,266 @@
+"""
+뉴스 수집 파이프라인
+크롤링 -> 번역/분석 -> 저장 단계를 크롤링 프런티어로 이어서
+중간에 멈춰도 다음 실행이 남은 단계부터 처리
+"""
+
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from config import Config
+from crawl_frontier import CrawlFrontier, FETCHED, ANALYZED, STORED, DUPLICATE
+from database import get_db_session, NewsArticle
+from url_canonical import canonical_url
+from near_duplicate import NearDuplicateIndex
+
+logger = logging.getLogger(__name__)
+
+
+def _time_left(deadline_at: Optional[float]) -> Optional[float]:
+    """마감(time.monotonic() 기준)까지 남은 초 (마감이 없으면 None)"""
+    if deadline_at is None:
+        return None
+    return max(0.0, deadline_at - time.monotonic())
+
+
+class NewsPipeline:
+    """크롤러와 분석기를 프런티어로 연결한 수집 파이프라인
+
+    각 단계는 프런티어에서 자기 입력 상태(fetched, analyzed)의 항목을 임대해
+    처리하므로, 이전 실행이 남긴 항목이나 다른 프로세스가 포기한 항목도
+    같은 방식으로 이어서 처리된다. 분석 전에 근접 중복 색인을 확인해 이미 다른
+    매체로 들어와 분석까지 마친 같은 보도는 번역/요약 없이 duplicate로 넘긴다.
+    색인에는 분석을 마친 기사만 넣으므로 원본 분석이 실패해도 사본이 함께 사라지지 않는다.
+    """
+
+    def __init__(self, crawler=None, analyzer=None, frontier: Optional[CrawlFrontier] = None,
+                 batch_size: int = 20, duplicate_index: Optional[NearDuplicateIndex] = None):
+        if crawler is None:
+            from news_crawler import NewsCrawler
+            crawler = NewsCrawler()
+        if analyzer is None:
+            from news_analyzer import NewsAnalyzer
+            analyzer = NewsAnalyzer()
+        self.crawler = crawler
+        self.analyzer = analyzer
+        self.frontier = frontier or CrawlFrontier()
+        self.duplicate_index = duplicate_index or NearDuplicateIndex()
+        self.batch_size = batch_size
+        # 최근 묶음의 기사당 번역/요약 시간 (마감 안에 끝낼 수 있는 묶음 크기 계산용)
+        self._seconds_per_entry: Optional[float] = None
+
+    def run(self, sources: Optional[List[str]] = None, crawl: bool = True,
+            deadline: Optional[float] = None, **crawl_options) -> Dict:
+        """크롤링 후 대기 중인 항목을 분석/저장 (crawl=False면 남은 항목만 처리)
+
+        deadline(초)을 주면 크롤링과 분석을 그 시간 안에서 멈추고, 끝내지 못한
+        항목은 프런티어에 남겨 다음 실행이 이어서 처리한다.
+        """
+        deadline_at = time.monotonic() + deadline if deadline else None
+        crawled = 0
+        unfinished_sources = []
+        if crawl:
+            self.crawler.frontier = self.frontier
+            self.crawler.prescorer = self.analyzer
+            try:
+                crawled = len(self.crawler.crawl_semiconductor_news(sources=sources, deadline=deadline,
+                                                                    **crawl_options))
+                unfinished_sources = list(self.crawler.unfinished_sources)
+            finally:
+                self.crawler.frontier = None
+
+        analyzed = self.analyze_pending(deadline_at)
+        stored = self.store_pending()
+
+        try:
+            self.frontier.prune()
+            self.duplicate_index.prune()
+        except Exception as e:
+            logger.warning(f"프런티어 정리 실패: {str(e)}")
+
+        return {
+            'crawled': crawled,
+            'analyzed': analyzed,
+            'stored': stored,
+            'unfinished_sources': unfinished_sources,
+            'pending': self.frontier.counts()
+        }
+
+    def _analyze(self, entry: Dict, translated_title: str, translated_content: str, summary: str) -> Dict:
+        """우선순위 계산 (번역/요약은 analyze_pending에서 묶음으로)"""
+        priority = self.analyzer.calculate_priority({
+            'title': translated_title,
+            'content': translated_content,
+            'source': entry['source'],
+            'published_date': entry['published_date'] or datetime.now()
+        })
+        return {
+            'translated_title': translated_title,
+            'translated_content': translated_content,
+            'priority_score': priority,
+            'summary': summary
+        }
+
+    def _translate_and_summarize(self, entries: List[Dict],
+                                 deadline_at: Optional[float] = None) -> Optional[List[Tuple[str, str, str]]]:
+        """항목들의 제목/본문을 묶음 번역하고 요약을 동시에 생성해 (제목, 본문, 요약) 목록으로 반환
+
+        각 LLM 단계는 마감까지 남은 시간 안에서만 기다리고, 마감을 넘기면 None을 반환한다
+        (끝난 번역/요약은 캐시에 남아 다음 실행이 다시 요청하지 않음).
+        """
+        titles = self.analyzer.translate_batch([entry['title'] for entry in entries], is_title=True,
+                                               timeout=_time_left(deadline_at))
+        if _time_left(deadline_at) == 0:
+            return None
+        contents = self.analyzer.translate_batch([entry['content'] or entry['title'] for entry in entries],
+                                                 is_title=False, timeout=_time_left(deadline_at))
+        if _time_left(deadline_at) == 0:
+            return None
+        summaries = self.analyzer.summarize_batch(contents, timeout=_time_left(deadline_at))
+        if _time_left(deadline_at) == 0:
+            return None
+        return list(zip(titles, contents, summaries))
+
+    def _batch_size_for(self, deadline_at: Optional[float]) -> int:
+        """마감까지 남은 시간에 끝낼 수 있는 묶음 크기 (처음에는 LLM 동시 요청 수만큼)"""
+        if deadline_at is None:
+            return self.batch_size
+        if self._seconds_per_entry is None:
+            return max(1, min(self.batch_size, Config.LLM_MAX_CONCURRENCY))
+        return max(1, min(self.batch_size, int(_time_left(deadline_at) / self._seconds_per_entry)))
+
+    def _find_original(self, entry: Dict) -> Optional[Tuple[int, str]]:
+        """분석을 마친 기사 중 근접 중복 원본의 (묶음 ID, URL) 반환 (조회 실패 시 중복 아님으로 처리)"""
+        try:
+            return self.duplicate_index.find(entry['url'], entry['title'], entry['content'] or '')
+        except Exception as e:
+            logger.warning(f"근접 중복 확인 실패 {entry['url']}: {str(e)}")
+            return None
+
+    def _cluster(self, entry: Dict) -> Optional[int]:
+        """분석을 마친 항목을 근접 중복 색인에 추가하고 묶음 ID 반환 (색인 실패 시 None)"""
+        try:
+            cluster_id, _ = self.duplicate_index.add(entry['url'], entry['source'], entry['title'],
+                                                     entry['content'] or '')
+            return cluster_id
+        except Exception as e:
+            logger.warning(f"근접 중복 색인 실패 {entry['url']}: {str(e)}")
+            return None
+
+    def analyze_pending(self, deadline_at: Optional[float] = None) -> int:
+        """본문을 받은(fetched) 항목을 번역/분석해 analyzed로 넘김 (deadline_at: time.monotonic() 기준 마감)"""
+        analyzed = 0
+        duplicates = 0
+        while deadline_at is None or time.monotonic() < deadline_at:
+            entries = self.frontier.claim(FETCHED, self._batch_size_for(deadline_at))
+            if not entries:
+                break
+            to_analyze = []
+            for entry in entries:
+                original = self._find_original(entry)
+                if original:
+                    if self.frontier.advance(entry['id'], DUPLICATE, cluster_id=original[0]):
+                        duplicates += 1
+                    continue
+                to_analyze.append(entry)
+            if not to_analyze:
+                continue
+            started = time.monotonic()
+            try:
+                analyses = self._translate_and_summarize(to_analyze, deadline_at)
+            except Exception as e:
+                logger.error(f"기사 번역/요약 실패: {str(e)}")
+                for entry in to_analyze:
+                    self.frontier.release(entry['id'], str(e))
+                continue
+            if analyses is None:
+                # 마감이 지나면 묶음 전체를 실패로 세지 않고 임대만 풀어 다음 실행에 넘김
+                for entry in to_analyze:
+                    self.frontier.unclaim(entry['id'])
+                logger.info(f"마감 시간 도달: 분석하지 못한 기사 {len(to_analyze)}개 다음 실행으로 미룸")
+                break
+            self._seconds_per_entry = (time.monotonic() - started) / len(to_analyze)
+            for entry, (title, content, summary) in zip(to_analyze, analyses):
+                try:
+                    fields = self._analyze(entry, title, content, summary)
+                    if self.frontier.advance(entry['id'], ANALYZED, cluster_id=self._cluster(entry), **fields):
+                        analyzed += 1
+                except Exception as e:
+                    logger.error(f"기사 분석 실패 {entry['url']}: {str(e)}")
+                    self.frontier.release(entry['id'], str(e))
+        if analyzed:
+            logger.info(f"기사 {analyzed}개 번역/분석 완료")
+        if duplicates:
+            logger.info(f"근접 중복 기사 {duplicates}개 번역/요약 생략")
+        return analyzed
+
+    def store_pending(self) -> List[Dict]:
+        """분석이 끝난(analyzed) 항목을 기사 테이블에 저장하고 stored로 넘김"""
+        stored = []
+        while True:
+            entries = self.frontier.claim(ANALYZED, self.batch_size)
+            if not entries:
+                break
+            session = get_db_session()
+            try:
+                for entry in entries:
+                    try:
+                        canonical = entry.get('canonical_url') or canonical_url(entry['url'])
+                        article = session.query(NewsArticle).filter(
+                            (NewsArticle.url == entry['url']) | (NewsArticle.canonical_url == canonical)
+                        ).first()
+                        if article is None:
+                            original_content = entry['content'] or entry['title']
+                            language = self.analyzer.detect_language(entry['title'], original_content)
+                            translated = (language == 'en' and entry['translated_title'] != entry['title'] and
+                                          entry['translated_content'] != original_content)
+                            article = NewsArticle(
+                                title=entry['translated_title'],
+                                content=entry['translated_content'],
+                                original_title=entry['title'],
+                                original_content=original_content,
+                                language=language,
+                                # 번역하지 못한 영어 기사는 백그라운드 번역 작업이 다시 시도
+                                translated_at=datetime.now() if translated else None,
+                                summary=entry['summary'],
+                                url=entry['url'],
+                                canonical_url=canonical,
+                                source=entry['source'],
+                                published_date=entry['published_date'],
+                                priority_score=entry['priority_score'],
+                                cluster_id=entry['cluster_id'],
+                                matched_keywords=json.dumps(entry['matched_keywords'], ensure_ascii=False),
+                                crawled_at=datetime.now()
+                            )
+                            session.add(article)
+                            session.commit()
+                            stored.append({
+                                'id': article.id,
+                                'title': article.title,
+                                'priority_score': article.priority_score,
+                                'source': article.source
+                            })
+                        self.frontier.advance(entry['id'], STORED, article_id=article.id)
+                    except Exception as e:
+                        logger.error(f"기사 저장 실패 {entry['url']}: {str(e)}")
+                        session.rollback()
+                        self.frontier.release(entry['id'], str(e))
+            finally:
+                session.close()
+        if stored:
+            logger.info(f"새 기사 {len(stored)}개 저장 완료")
+        return stored
+
+
+def run_pipeline(sources: Optional[List[str]] = None, crawl: bool = True, **crawl_options) -> Dict:
+    """기본 크롤러/분석기로 파이프라인 한 번 실행"""
+    started = time.perf_counter()
+    result = NewsPipeline().run(sources=sources, crawl=crawl, **crawl_options)
+    logger.info(
+        f"파이프라인 완료 ({time.perf_counter() - started:.1f}초): 수집 {result['crawled']}개, "
+        f"분석 {result['analyzed']}개, 저장 {len(result['stored'])}개, 대기 {result['pending']}"
+    )
+    return result
@@ -0,0 +1,189 @@
+"""
+뉴스 소스 서킷 브레이커
+연속으로 실패하거나 빈 결과를 내는 소스는 쿨다운 동안 건너뛰고,
+쿨다운이 끝나면 요청 하나로 시험(half-open)한 뒤 복구 여부를 결정
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from config import Config
+from database import get_db_session, get_source_states, save_source_states
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# 실패한 실행 시간 평균 가중치
+FAILURE_SECONDS_ALPHA = 0.3
+
+# 이 브레이커가 저장하는 필드 (같은 행의 스케줄 필드는 건드리지 않음)
+BREAKER_FIELDS = (
+    'breaker_state', 'consecutive_failures', 'cooldown_minutes', 'retry_at',
+    'breaker_reason', 'failure_seconds', 'skipped_runs', 'time_saved_seconds'
+)
+
+
+class SourceCircuitBreaker:
+    """소스별 서킷 브레이커 (closed -> open -> half_open -> closed/open)
+
+    failure_threshold번 연속으로 실패(오류 또는 링크 0개)하면 open이 되어
+    cooldown 동안 건너뛴다. 쿨다운이 끝나면 half_open으로 한 번 시험하고,
+    성공하면 closed, 다시 실패하면 쿨다운을 두 배로 늘려 open으로 돌아간다.
+    건너뛸 때마다 실패한 실행에 들던 평균 시간을 절약한 시간으로 누적한다.
+    """
+
+    def __init__(self, failure_threshold: Optional[int] = None, cooldown_minutes: Optional[float] = None,
+                 max_cooldown_minutes: Optional[float] = None):
+        self.failure_threshold = failure_threshold or Config.CRAWL_BREAKER_FAILURE_THRESHOLD
+        self.cooldown_minutes = cooldown_minutes or Config.CRAWL_BREAKER_COOLDOWN_MINUTES
+        self.max_cooldown_minutes = max_cooldown_minutes or Config.CRAWL_BREAKER_MAX_COOLDOWN_MINUTES
+        self.states: Dict[str, Dict] = {}
+        self._dirty = set()
+        self._new = set()
+
+    def load(self):
+        """DB에서 소스별 브레이커 상태 로드"""
+        session = get_db_session()
+        try:
+            self.states = get_source_states(session)
+        except Exception as e:
+            logger.warning(f"소스 브레이커 상태 로드 실패 (모든 소스 허용): {str(e)}")
+            self.states = {}
+        finally:
+            session.close()
+        return self
+
+    def save(self):
+        """변경된 브레이커 상태 저장"""
+        if not self._dirty:
+            return
+        updates = {}
+        for name in self._dirty:
+            fields = BREAKER_FIELDS + (('interval_minutes',) if name in self._new else ())
+            updates[name] = {field: self.states[name][field] for field in fields}
+        session = get_db_session()
+        try:
+            save_source_states(updates, session)
+            self._dirty.clear()
+            self._new.clear()
+        except Exception as e:
+            logger.warning(f"소스 브레이커 상태 저장 실패: {str(e)}")
+            session.rollback()
+        finally:
+            session.close()
+
+    def _state(self, name: str) -> Dict:
+        state = self.states.get(name)
+        if state is None:
+            # 새 행은 필수 스케줄 필드(주기)도 함께 저장
+            state = self.states[name] = {
+                'source': name,
+                'interval_minutes': Config.CRAWL_SOURCE_INITIAL_INTERVAL_MINUTES
+            }
+            self._new.add(name)
+        for field, default in (('breaker_state', CLOSED), ('consecutive_failures', 0),
+                               ('cooldown_minutes', None), ('retry_at', None), ('breaker_reason', None),
+                               ('failure_seconds', 0.0), ('skipped_runs', 0), ('time_saved_seconds', 0.0)):
+            state.setdefault(field, default)
+        return state
+
+    def allow(self, name: str, now: Optional[datetime] = None) -> Optional[str]:
+        """소스를 크롤링해도 되는지 확인 - closed/half_open이면 그 상태, 건너뛸 소스면 None"""
+        state = self.states.get(name)
+        if not state or state.get('breaker_state', CLOSED) == CLOSED:
+            return CLOSED
+        now = now or datetime.utcnow()
+        if state['breaker_state'] == OPEN and state.get('retry_at') and state['retry_at'] > now:
+            return None
+        if state['breaker_state'] != HALF_OPEN:
+            state['breaker_state'] = HALF_OPEN
+            self._dirty.add(name)
+            logger.info(f"{name} 서킷 브레이커 half-open: 요청 하나로 복구 여부 확인")
+        return HALF_OPEN
+
+    def record_skip(self, name: str):
+        """open 상태로 건너뛴 실행 기록 (실패 실행 평균 시간만큼 절약)"""
+        state = self._state(name)
+        state['skipped_runs'] += 1
+        state['time_saved_seconds'] += state['failure_seconds']
+        self._dirty.add(name)
+
+    def record(self, name: str, failed: bool, seconds: float = 0.0, reason: Optional[str] = None,
+               now: Optional[datetime] = None):
+        """크롤링 결과 반영 (failed: 오류가 났거나 링크를 하나도 찾지 못함)"""
+        now = now or datetime.utcnow()
+        state = self._state(name)
+        previous = state['breaker_state']
+
+        if not failed:
+            if previous != CLOSED:
+                logger.info(f"{name} 서킷 브레이커 closed: 소스 복구")
+            state.update({
+                'breaker_state': CLOSED, 'consecutive_failures': 0,
+                'cooldown_minutes': None, 'retry_at': None, 'breaker_reason': None
+            })
+            self._dirty.add(name)
+            return
+
+        state['consecutive_failures'] += 1
+        state['breaker_reason'] = reason
+        state['failure_seconds'] = (
+            seconds if not state['failure_seconds']
+            else (1 - FAILURE_SECONDS_ALPHA) * state['failure_seconds'] + FAILURE_SECONDS_ALPHA * seconds
+        )
+
+        if previous == HALF_OPEN:
+            cooldown = min((state['cooldown_minutes'] or self.cooldown_minutes) * 2, self.max_cooldown_minutes)
+        elif state['consecutive_failures'] >= self.failure_threshold:
+            cooldown = self.cooldown_minutes
+        else:
+            self._dirty.add(name)
+            return
+
+        state['breaker_state'] = OPEN
+        state['cooldown_minutes'] = cooldown
+        state['retry_at'] = now + timedelta(minutes=cooldown)
+        self._dirty.add(name)
+        logger.warning(
+            f"{name} 서킷 브레이커 open: 연속 실패 {state['consecutive_failures']}회, "
+            f"{cooldown:.0f}분 동안 건너뜀 ({reason})"
+        )
+
+    def record_run(self, source_results: Dict[str, Dict], now: Optional[datetime] = None):
+        """크롤러의 소스별 결과(NewsCrawler.source_results) 반영 후 저장"""
+        for name, result in source_results.items():
+            if result.get('skipped'):
+                self.record_skip(name)
+                continue
+            if result.get('unfinished'):
+                continue  # 마감 시간에 끊긴 실행은 성공/실패를 판단하지 않음
+            empty = not result['failed'] and result.get('links', 0) == 0
+            reason = result.get('error') if result['failed'] else ("링크 0개" if empty else None)
+            self.record(name, result['failed'] or empty, result.get('seconds', 0.0), reason, now)
+        self.save()
+
+    def summary(self) -> Dict:
+        """API용 상태 요약"""
+        sources = []
+        for name, state in sorted(self.states.items()):
+            state = self._state(name)
+            sources.append({
+                'source': name,
+                'state': state['breaker_state'],
+                'consecutive_failures': state['consecutive_failures'],
+                'retry_at': state['retry_at'].isoformat() if state['retry_at'] else None,
+                'reason': state['breaker_reason'],
+                'skipped_runs': state['skipped_runs'],
+                'time_saved_seconds': round(state['time_saved_seconds'], 1),
+                'last_crawled_at': state['last_crawled_at'].isoformat() if state.get('last_crawled_at') else None,
+                'interval_minutes': state.get('interval_minutes')
+            })
+        return {
+            'sources': sources,
+            'open_sources': sum(1 for source in sources if source['state'] == OPEN),
+            'total_time_saved_seconds': round(sum(source['time_saved_seconds'] for source in sources), 1)
+        }
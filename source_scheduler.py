@@ -0,0 +1,160 @@
+"""
+뉴스 소스별 적응형 크롤링 스케줄러
+소스마다 새 기사 수와 실패율을 추적해 크롤링 주기를 설정된 범위 안에서 조절
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from config import Config
+from database import get_db_session, get_source_states, save_source_states
+
+logger = logging.getLogger(__name__)
+
+# 지수 이동 평균 가중치 (최근 실행 반영 비율)
+EWMA_ALPHA = 0.3
+
+# 한 번에 주기를 바꾸는 최대 배율
+MAX_STEP_FACTOR = 2.0
+
+# 이 스케줄러가 저장하는 필드 (같은 행의 서킷 브레이커 필드는 건드리지 않음)
+SCHEDULE_FIELDS = (
+    'interval_minutes', 'next_due_at', 'last_crawled_at', 'yield_ewma',
+    'failure_ewma', 'runs', 'last_new_articles', 'last_error'
+)
+
+
+class SourceScheduler:
+    """소스별 다음 크롤링 시각을 관리하는 스케줄러
+
+    새 기사가 목표보다 많이 나오는 소스는 주기를 줄이고, 새 기사가 없거나
+    실패하는 소스는 주기를 늘린다. 주기는 항상 [min_interval, max_interval]
+    (분) 범위 안에 있고, 처음 보는 소스는 바로 크롤링 대상이 된다.
+    """
+
+    def __init__(self, min_interval: Optional[float] = None, max_interval: Optional[float] = None,
+                 initial_interval: Optional[float] = None, target_yield: Optional[float] = None):
+        self.min_interval = min_interval or Config.CRAWL_SOURCE_MIN_INTERVAL_MINUTES
+        self.max_interval = max_interval or Config.CRAWL_SOURCE_MAX_INTERVAL_MINUTES
+        self.initial_interval = initial_interval or Config.CRAWL_SOURCE_INITIAL_INTERVAL_MINUTES
+        self.target_yield = target_yield or Config.CRAWL_SOURCE_TARGET_YIELD
+        self.states: Dict[str, Dict] = {}
+        self._dirty = set()
+
+    def load(self):
+        """DB에서 소스별 상태 로드"""
+        session = get_db_session()
+        try:
+            self.states = get_source_states(session)
+        except Exception as e:
+            logger.warning(f"소스 스케줄 상태 로드 실패 (모든 소스 크롤링): {str(e)}")
+            self.states = {}
+        finally:
+            session.close()
+        return self
+
+    def save(self):
+        """변경된 소스 상태 저장"""
+        if not self._dirty:
+            return
+        updates = {
+            name: {field: self.states[name][field] for field in SCHEDULE_FIELDS}
+            for name in self._dirty
+        }
+        session = get_db_session()
+        try:
+            save_source_states(updates, session)
+            self._dirty.clear()
+        except Exception as e:
+            logger.warning(f"소스 스케줄 상태 저장 실패: {str(e)}")
+            session.rollback()
+        finally:
+            session.close()
+
+    def _clamp(self, minutes: float) -> float:
+        return max(self.min_interval, min(self.max_interval, minutes))
+
+    def _state(self, name: str) -> Dict:
+        state = self.states.get(name)
+        if state is None:
+            state = self.states[name] = {
+                'source': name,
+                'interval_minutes': self._clamp(self.initial_interval),
+                'next_due_at': None,
+                'last_crawled_at': None,
+                'yield_ewma': 0.0,
+                'failure_ewma': 0.0,
+                'runs': 0,
+                'last_new_articles': 0,
+                'last_error': None
+            }
+        return state
+
+    def is_due(self, name: str, now: Optional[datetime] = None) -> bool:
+        """소스를 지금 크롤링할 차례인지 확인"""
+        state = self.states.get(name)
+        if not state or not state.get('next_due_at'):
+            return True
+        return state['next_due_at'] <= (now or datetime.utcnow())
+
+    def due_sources(self, sources: List[Dict], now: Optional[datetime] = None) -> List[str]:
+        """크롤링할 차례가 된 소스 이름 목록"""
+        now = now or datetime.utcnow()
+        return [source['name'] for source in sources if self.is_due(source['name'], now)]
+
+    def record(self, name: str, new_articles: int, failed: bool = False,
+               error: Optional[str] = None, now: Optional[datetime] = None):
+        """소스 크롤링 결과를 반영해 다음 주기 계산"""
+        now = now or datetime.utcnow()
+        state = self._state(name)
+        first_run = state['runs'] == 0
+
+        state['failure_ewma'] = (1 - EWMA_ALPHA) * state['failure_ewma'] + EWMA_ALPHA * (1.0 if failed else 0.0)
+        if not failed:
+            # 실패한 실행은 새 기사 수를 알 수 없으므로 수율에 반영하지 않음
+            state['yield_ewma'] = (
+                float(new_articles) if first_run
+                else (1 - EWMA_ALPHA) * state['yield_ewma'] + EWMA_ALPHA * new_articles
+            )
+
+        if failed:
+            factor = MAX_STEP_FACTOR
+        elif state['yield_ewma'] <= 0:
+            factor = MAX_STEP_FACTOR
+        else:
+            factor = self.target_yield / state['yield_ewma']
+            factor = max(1 / MAX_STEP_FACTOR, min(MAX_STEP_FACTOR, factor))
+
+        previous = state['interval_minutes']
+        state['interval_minutes'] = self._clamp(previous * factor)
+        state['last_crawled_at'] = now
+        state['next_due_at'] = now + timedelta(minutes=state['interval_minutes'])
+        state['runs'] += 1
+        state['last_new_articles'] = new_articles
+        state['last_error'] = error if failed else None
+        self._dirty.add(name)
+
+        if round(previous) != round(state['interval_minutes']):
+            logger.info(
+                f"{name} 크롤링 주기 {previous:.0f}분 -> {state['interval_minutes']:.0f}분 "
+                f"(새 기사 평균 {state['yield_ewma']:.1f}개, 실패율 {state['failure_ewma']:.0%})"
+            )
+
+    def record_run(self, source_results: Dict[str, Dict], now: Optional[datetime] = None):
+        """크롤러의 소스별 결과(NewsCrawler.source_results) 반영 후 저장"""
+        for name, result in source_results.items():
+            if result.get('skipped'):
+                self.postpone(name, now)
+                continue
+            if result.get('unfinished'):
+                continue  # 마감 시간에 끊긴 소스는 주기를 바꾸지 않고 다음 실행에서 바로 다시 크롤링
+            self.record(name, result['articles'], result['failed'], result.get('error'), now)
+        self.save()
+
+    def postpone(self, name: str, now: Optional[datetime] = None):
+        """크롤링하지 않고 건너뛴 소스(서킷 브레이커 열림)는 수율 변화 없이 다음 주기로 미룸"""
+        now = now or datetime.utcnow()
+        state = self._state(name)
+        state['next_due_at'] = now + timedelta(minutes=state['interval_minutes'])
+        self._dirty.add(name)
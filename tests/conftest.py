@@ -0,0 +1,25 @@
+"""공용 픽스처: 실제 news_database.db 대신 쓰는 메모리 SQLite"""
+
+import sys
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import database
+from database import Base
+
+
+@pytest.fixture
+def memory_db(monkeypatch):
+    """모든 테이블을 만든 메모리 DB의 세션 팩토리 (이미 불러온 모듈의 get_db_session도 이 DB로 바꿈)"""
+    engine = create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    original = database.get_db_session
+    for module in list(sys.modules.values()):
+        if getattr(module, 'get_db_session', None) is original:
+            monkeypatch.setattr(module, 'get_db_session', factory)
+    yield factory
+    engine.dispose()
@@ -0,0 +1,67 @@
+"""마감 시간이 있는 크롤링: 마감에 걸려도 예외 없이 그때까지 모은 기사를 반환"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from crawl_scheduler import HostScheduler
+from news_crawler import NewsCrawler
+
+ARTICLE_COUNT = 12
+
+
+class _NewsHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path == '/list':
+            body = ''.join(f'<a href="/a/{index}">Samsung HBM chip story {index}</a>'
+                           for index in range(ARTICLE_COUNT))
+        elif self.path.startswith('/a/'):
+            body = f'<div class="article-body"><p>{"Memory chip demand keeps rising. " * 40}</p></div>'
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+        data = f'<html><body>{body}</body></html>'.encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def news_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _NewsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+def _crawler(base_url: str) -> NewsCrawler:
+    crawler = NewsCrawler()
+    crawler.set_db_state(False)
+    crawler.prescorer = False
+    crawler.news_sources = [{'name': 'Local', 'list_urls': [f'{base_url}/list'], 'link_pattern': '/a/'}]
+    # 호스트 간격 1초 - 기사 12개를 마감(3초) 안에 모두 받을 수 없음
+    crawler.scheduler = HostScheduler(crawler.session, default_delay=1.0)
+    return crawler
+
+
+@pytest.mark.parametrize('concurrent', [True, False])
+def test_crawl_returns_partial_results_when_deadline_is_reached(news_server, concurrent):
+    crawler = _crawler(news_server)
+    started = time.monotonic()
+    articles = crawler.crawl_semiconductor_news(concurrent=concurrent, deadline=3)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 5
+    assert 0 < len(articles) < ARTICLE_COUNT
+    assert crawler.unfinished_sources == ['Local']
+    assert crawler.run_stats['deadline_deferred'] == ARTICLE_COUNT - len(articles)
+    assert crawler.last_crawl_stats['unfinished_sources'] == ['Local']
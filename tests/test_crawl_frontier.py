@@ -0,0 +1,108 @@
+"""crawl_frontier: 후보 추가, 임대, 단계 이동, 실패 재시도, 임대 만료"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from crawl_frontier import ANALYZED, DISCOVERED, FAILED, FETCHED, STORED, CrawlFrontier
+from database import CrawlFrontierEntry
+
+
+def _candidate(number: int, priority: float = 0.0, **fields) -> dict:
+    candidate = {'url': f'https://news.example.com/article/{number}', 'source': 'A',
+                 'title': f'HBM story {number}', 'matched_keywords': ['HBM'], 'expected_priority': priority}
+    candidate.update(fields)
+    return candidate
+
+
+@pytest.fixture
+def frontier(memory_db):
+    return CrawlFrontier(owner='worker-1', lease_seconds=60, max_attempts=2)
+
+
+def test_add_skips_known_urls_and_canonical_aliases(frontier):
+    assert frontier.add([_candidate(1), _candidate(2)]) == 2
+    alias = _candidate(1, url='http://news.example.com/article/1?utm_source=feed')
+    assert frontier.add([alias, _candidate(2), _candidate(3), _candidate(3)]) == 1
+    assert frontier.counts() == {DISCOVERED: 3}
+
+
+def test_claim_orders_by_priority_and_leases_each_entry_once(frontier):
+    frontier.add([_candidate(1, 1.0), _candidate(2, 5.0), _candidate(3, 3.0)])
+    other = CrawlFrontier(owner='worker-2', lease_seconds=60)
+
+    first = frontier.claim(DISCOVERED, 2)
+    assert [entry['url'][-1] for entry in first] == ['2', '3']
+    assert [entry['url'][-1] for entry in other.claim(DISCOVERED, 5)] == ['1']
+    assert frontier.claim(DISCOVERED, 5) == []
+
+
+def test_advance_requires_the_lease(frontier):
+    frontier.add([_candidate(1)])
+    entry = frontier.claim(DISCOVERED, 1)[0]
+    other = CrawlFrontier(owner='worker-2', lease_seconds=60)
+
+    assert not other.advance(entry['id'], FETCHED, content='body')
+    assert frontier.advance(entry['id'], FETCHED, content='body')
+    assert frontier.counts() == {FETCHED: 1}
+    fetched = other.claim(FETCHED, 1)[0]
+    assert fetched['content'] == 'body'
+    assert other.advance(fetched['id'], ANALYZED) and not frontier.advance(fetched['id'], STORED)
+
+
+def test_expired_lease_can_be_claimed_by_another_worker(frontier, memory_db):
+    frontier.add([_candidate(1)])
+    entry = frontier.claim(DISCOVERED, 1)[0]
+    session = memory_db()
+    session.query(CrawlFrontierEntry).update(
+        {CrawlFrontierEntry.lease_expires_at: datetime.utcnow() - timedelta(seconds=1)})
+    session.commit()
+    session.close()
+
+    other = CrawlFrontier(owner='worker-2', lease_seconds=60)
+    assert [claimed['id'] for claimed in other.claim(DISCOVERED, 1)] == [entry['id']]
+    # 원래 작업자의 늦은 결과는 버려짐
+    assert not frontier.advance(entry['id'], FETCHED)
+    assert other.advance(entry['id'], FETCHED)
+
+
+def test_release_backs_off_then_fails_after_max_attempts(frontier, memory_db):
+    frontier.add([_candidate(1)])
+    entry = frontier.claim(DISCOVERED, 1)[0]
+    assert frontier.release(entry['id'], 'timeout')
+    assert frontier.claim(DISCOVERED, 1) == []  # 재시도 대기 중
+
+    session = memory_db()
+    row = session.query(CrawlFrontierEntry).one()
+    assert (row.attempts, row.last_error, row.lease_owner) == (1, 'timeout', None)
+    row.lease_expires_at = datetime.utcnow() - timedelta(seconds=1)
+    session.commit()
+    session.close()
+
+    entry = frontier.claim(DISCOVERED, 1)[0]
+    assert frontier.release(entry['id'], 'timeout')
+    assert frontier.counts() == {FAILED: 1}
+
+
+def test_unclaim_releases_without_counting_a_failure(frontier, memory_db):
+    frontier.add([_candidate(1)])
+    entry = frontier.claim(DISCOVERED, 1)[0]
+    assert frontier.unclaim(entry['id'])
+    assert [claimed['id'] for claimed in frontier.claim(DISCOVERED, 1)] == [entry['id']]
+    session = memory_db()
+    assert session.query(CrawlFrontierEntry).one().attempts in (0, None)
+    session.close()
+
+
+def test_prune_removes_only_old_finished_entries(frontier, memory_db):
+    frontier.add([_candidate(1), _candidate(2)])
+    for entry in frontier.claim(DISCOVERED, 2):
+        frontier.advance(entry['id'], STORED if entry['url'].endswith('1') else FETCHED)
+    session = memory_db()
+    session.query(CrawlFrontierEntry).update(
+        {CrawlFrontierEntry.updated_at: datetime.utcnow() - timedelta(days=60)})
+    session.commit()
+    session.close()
+
+    assert frontier.prune(days=30) == 1
+    assert frontier.counts() == {FETCHED: 1}
@@ -0,0 +1,71 @@
+"""crawl_scheduler: 토큰 버킷, 호스트 간격, 마감 시간"""
+
+import time
+
+import pytest
+
+from crawl_scheduler import DeadlineExceeded, HostScheduler, TokenBucket
+
+
+class _OfflineSession:
+    """robots.txt 요청이 항상 실패하는 세션 (기본 간격만 적용)"""
+
+    headers = {'User-Agent': 'test'}
+
+    def get(self, url, **kwargs):
+        raise ConnectionError(url)
+
+
+def test_token_bucket_spaces_reservations_by_rate():
+    bucket = TokenBucket(rate=2.0, capacity=1.0)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5, abs=0.05)
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.05)
+
+
+def test_token_bucket_refused_reservation_keeps_token():
+    bucket = TokenBucket(rate=1.0, capacity=1.0)
+    assert bucket.reserve() == 0.0
+    deadline = time.monotonic() + 0.5
+    for _ in range(5):
+        assert bucket.reserve(deadline) is None
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.05)
+
+
+def test_host_scheduler_waits_per_host_only():
+    scheduler = HostScheduler(_OfflineSession(), default_delay=1.0)
+    assert scheduler.reserve('http://a.test/1') == 0.0
+    assert scheduler.reserve('http://b.test/1') == 0.0
+    assert scheduler.reserve('http://a.test/2') == pytest.approx(1.0, abs=0.05)
+
+
+def test_host_scheduler_reserve_past_deadline_raises_without_pushing_next_slot():
+    scheduler = HostScheduler(_OfflineSession(), default_delay=2.0)
+    scheduler.reserve('http://a.test/1')
+    deadline = time.monotonic() + 1.0
+    for _ in range(5):
+        with pytest.raises(DeadlineExceeded):
+            scheduler.reserve('http://a.test/2', deadline)
+    assert scheduler.reserve('http://a.test/3') == pytest.approx(2.0, abs=0.05)
+
+
+
+def test_host_scheduler_prepaid_wait_is_used_once():
+    scheduler = HostScheduler(_OfflineSession(), default_delay=1.0)
+    scheduler.reserve('http://a.test/1')
+    waited = scheduler.reserve('http://a.test/2')
+    with scheduler.prepaid('http://a.test/2', waited):
+        assert scheduler.prepaid_seconds('http://a.test/x') == waited
+        assert scheduler.prepaid_seconds('http://b.test/x') == 0.0
+        started = time.monotonic()
+        assert scheduler.wait('http://a.test/2') == waited
+        assert time.monotonic() - started < 0.1
+        assert scheduler.prepaid_seconds('http://a.test/x') == 0.0
+
+
+def test_host_scheduler_request_reports_wait_on_error():
+    scheduler = HostScheduler(_OfflineSession(), default_delay=0.2)
+    scheduler.reserve('http://a.test/1')
+    with pytest.raises(ConnectionError) as raised:
+        scheduler.request('http://a.test/2')
+    assert raised.value.host_wait_seconds == pytest.approx(0.2, abs=0.05)
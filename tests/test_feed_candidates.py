@@ -0,0 +1,49 @@
+"""피드/사이트맵 후보: 자동으로 찾은 피드의 요약이나 사이트맵 키워드를 본문으로 쓰지 않음"""
+
+from html_parsing import parse_feed_items
+from news_crawler import NewsCrawler
+
+SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
+  <url>
+    <loc>https://news.example.com/article/1</loc>
+    <news:news>
+      <news:title>New packaging line announced</news:title>
+      <news:keywords>Samsung, HBM, semiconductor</news:keywords>
+    </news:news>
+  </url>
+</urlset>"""
+
+
+def _crawler(items, discovered):
+    crawler = NewsCrawler()
+    crawler.set_db_state(False)
+    crawler._fetch_rss_items = lambda rss_urls, merge=False: items
+    source = {'name': 'Feed', 'rss_urls': ['https://news.example.com/feed']}
+    if discovered:
+        source['feed_discovered'] = True
+    return crawler, source
+
+
+def test_sitemap_keywords_are_not_a_description():
+    items = parse_feed_items(SITEMAP)
+    assert items[0]['description'] == ''
+    assert items[0]['keywords'] == 'Samsung, HBM, semiconductor'
+
+
+def test_sitemap_keywords_match_but_body_is_fetched():
+    crawler, source = _crawler(parse_feed_items(SITEMAP), discovered=True)
+    candidates = crawler._discover_rss_candidates(source)
+    assert [c['url'] for c in candidates] == ['https://news.example.com/article/1']
+    assert candidates[0]['content'] == ''
+
+
+def test_discovered_feed_teaser_is_not_used_as_content():
+    items = [{'title': 'Samsung ships HBM4', 'link': 'https://news.example.com/article/2',
+              'description': '<p>Samsung began HBM shipments...</p>', 'pub_date': ''}]
+    crawler, source = _crawler(items, discovered=True)
+    assert crawler._discover_rss_candidates(source)[0]['content'] == ''
+
+    crawler, source = _crawler(items, discovered=False)
+    assert crawler._discover_rss_candidates(source)[0]['content'] == 'Samsung began HBM shipments...'
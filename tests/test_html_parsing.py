@@ -0,0 +1,35 @@
+"""html_parsing: 기사 본문과 정규 URL 추출"""
+
+from html_parsing import extract_article
+
+
+def _page(head: str = '', body: str = '') -> bytes:
+    return (f'<html><head>{head}</head><body><div class="article-body">'
+            f'<p>Samsung begins HBM4 mass production.</p>{body}</div></body></html>').encode()
+
+
+def test_extract_article_reads_rel_canonical():
+    result = extract_article(_page(head='<link rel="stylesheet" href="/a.css">'
+                                        '<link rel="canonical" href=" https://a.com/news/1 ">'))
+    assert result['canonical'] == 'https://a.com/news/1'
+    assert result['content'] == 'Samsung begins HBM4 mass production.'
+
+
+def test_extract_article_falls_back_to_og_url():
+    result = extract_article(_page(head='<meta name="description" content="teaser">'
+                                        '<meta property="og:url" content="https://a.com/news/2">'))
+    assert result['canonical'] == 'https://a.com/news/2'
+
+
+def test_extract_article_ignores_stray_link_and_meta_in_body():
+    result = extract_article(_page(body='<link rel="preload" href="/img/a.png">'
+                                        '<meta itemprop="author" content="Reporter Kim">'
+                                        '<p>More text.</p>'))
+    assert result['canonical'] == ''
+    assert 'More text.' in result['content']
+
+
+def test_extract_article_prefers_canonical_over_body_tags():
+    result = extract_article(_page(head='<link rel="Canonical" href="https://a.com/news/3">',
+                                   body='<link rel="preload" href="/img/a.png">'))
+    assert result['canonical'] == 'https://a.com/news/3'
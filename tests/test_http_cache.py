@@ -0,0 +1,106 @@
+"""http_cache: 조건부 요청 헤더, 304 재사용, 저장/로드, 크롤러의 조건부 GET"""
+
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from database import HttpCacheEntry
+from http_cache import HttpValidatorCache
+from news_crawler import NewsCrawler
+
+URL = 'https://news.example.com/rss'
+
+
+def test_store_keeps_only_responses_with_validators():
+    cache = HttpValidatorCache(persistent=False)
+    cache.store(URL, {}, 100, ['a'])
+    assert cache.request_headers(URL) == {}
+    assert cache.not_modified(URL) is None
+
+    cache.store(URL, {'ETag': '"v1"', 'Last-Modified': 'Thu, 01 Jan 2026 00:00:00 GMT'}, 100, ['a'])
+    assert cache.request_headers(URL) == {'If-None-Match': '"v1"',
+                                          'If-Modified-Since': 'Thu, 01 Jan 2026 00:00:00 GMT'}
+    assert cache.stats['bytes_downloaded'] == 200
+
+
+def test_not_modified_returns_cached_payload_and_counts_savings():
+    cache = HttpValidatorCache(persistent=False)
+    cache.store(URL, {'ETag': '"v1"'}, 1000, [{'title': 'HBM', 'link': 'https://news.example.com/1'}])
+    assert cache.not_modified(URL) == [{'title': 'HBM', 'link': 'https://news.example.com/1'}]
+    assert cache.stats == {'requests': 2, 'not_modified': 1, 'bytes_downloaded': 1000, 'bytes_saved': 1000}
+
+
+def test_entries_persist_and_old_entries_are_pruned(memory_db):
+    cache = HttpValidatorCache(max_age_days=30)
+    cache.load()
+    cache.store(URL, {'ETag': '"v1"'}, 10, ['a'])
+    cache.save()
+
+    session = memory_db()
+    session.add(HttpCacheEntry(url='https://old.example.com/', etag='"x"', payload='[]',
+                               fetched_at=datetime.utcnow() - timedelta(days=31)))
+    session.commit()
+    session.close()
+
+    reloaded = HttpValidatorCache(max_age_days=30)
+    assert reloaded.request_headers(URL) == {'If-None-Match': '"v1"'}
+    assert reloaded.not_modified(URL) == ['a']
+    reloaded.save()
+    session = memory_db()
+    assert [entry.url for entry in session.query(HttpCacheEntry)] == [URL]
+    session.close()
+
+
+class _EtagHandler(BaseHTTPRequestHandler):
+    hits = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        if self.path != '/feed':
+            self.send_response(404)  # robots.txt 없음
+            self.end_headers()
+            return
+        if self.headers.get('If-None-Match') == '"v1"':
+            self.hits.append(304)
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.hits.append(200)
+        data = b'<html><body>feed</body></html>'
+        self.send_response(200)
+        self.send_header('ETag', '"v1"')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def etag_server():
+    _EtagHandler.hits = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _EtagHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/feed'
+    server.shutdown()
+    server.server_close()
+
+
+def test_crawler_reuses_parsed_result_on_304(etag_server):
+    crawler = NewsCrawler()
+    crawler.set_db_state(False)
+    crawler._begin_crawl_run()
+    parsed = []
+
+    def parse(body):
+        parsed.append(body)
+        return {'length': len(body)}
+
+    first = crawler._fetch_parsed(etag_server, parse)
+    second = crawler._fetch_parsed(etag_server, parse)
+    assert first == second == {'length': 30}
+    assert len(parsed) == 1
+    assert _EtagHandler.hits == [200, 304]
+    assert crawler.http_cache.stats['not_modified'] == 1
@@ -0,0 +1,65 @@
+"""llm_gateway: 분당 한도 토큰 버킷과 토큰 수 추정"""
+
+import asyncio
+import time
+
+from llm_gateway import RateBudget, estimate_tokens
+
+
+def _timed(coro_factory) -> float:
+    async def run():
+        started = time.monotonic()
+        await coro_factory()
+        return time.monotonic() - started
+    return asyncio.run(run())
+
+
+def test_rate_budget_without_limit_never_waits():
+    budget = RateBudget(0)
+
+    async def spend():
+        for _ in range(1000):
+            await budget.acquire(10_000)
+    assert _timed(spend) < 0.1
+
+
+def test_rate_budget_spends_full_minute_capacity_without_waiting():
+    budget = RateBudget(600)
+
+    async def spend():
+        await budget.acquire(300)
+        await budget.acquire(300)
+    assert _timed(spend) < 0.1
+
+
+def test_rate_budget_waits_for_refill_when_exhausted():
+    budget = RateBudget(600)  # 초당 10
+
+    async def spend():
+        await budget.acquire(600)
+        await budget.acquire(5)
+    assert 0.4 <= _timed(spend) < 1.0
+
+
+def test_rate_budget_caps_oversized_request_at_capacity():
+    budget = RateBudget(600)
+
+    async def spend():
+        await budget.acquire(10_000)
+    assert _timed(spend) < 0.1
+    assert budget.available < 1
+
+
+def test_rate_budget_serializes_concurrent_waiters():
+    budget = RateBudget(600)
+
+    async def spend():
+        await budget.acquire(600)
+        await asyncio.gather(*(budget.acquire(2) for _ in range(3)))
+    assert 0.5 <= _timed(spend) < 1.2
+
+
+def test_estimate_tokens_counts_ascii_by_four_and_other_chars_by_one():
+    assert estimate_tokens('') == 1
+    assert estimate_tokens('abcd' * 10) == 11
+    assert estimate_tokens('반도체') == 4
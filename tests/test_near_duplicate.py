@@ -0,0 +1,203 @@
+"""near_duplicate: MinHash 서명, LSH 구간, DB 색인, 근접 중복 접기, 파이프라인의 중복 건너뛰기"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from crawl_frontier import ANALYZED, DUPLICATE
+from database import NewsArticle, NearDuplicateBand, NearDuplicateFingerprint, collapse_near_duplicates
+from near_duplicate import BAND_COUNT, SIGNATURE_SIZE, NearDuplicateIndex, bands, signature, similarity
+from news_pipeline import NewsPipeline
+
+TITLE = "Samsung starts HBM4 mass production"
+
+MEMORY_WORDS = "samsung memory wafer foundry yield node process packaging demand supply price".split()
+
+# 같은 발표를 다른 매체가 고쳐 쓴 기사 (문장 순서/표현은 다르고 수치/인용문/고유명사는 같음)
+ORIGINAL_TITLE = "Samsung begins mass production of 12-layer HBM4 for AI accelerators"
+ORIGINAL = """Samsung Electronics said on Tuesday it has begun mass production of its sixth-generation
+high bandwidth memory, HBM4, stacking twelve DRAM layers on a logic base die built on its 4-nanometer
+foundry process. The company said the new chips deliver a data transfer speed of 11 gigabits per second
+per pin, about 60 percent faster than the previous generation, while cutting power consumption by
+roughly 40 percent. Shipments to a major US graphics processor customer will start in the fourth quarter,
+and the company plans to expand HBM4 output threefold next year at its Pyeongtaek and Cheonan campuses.
+"HBM4 marks a turning point for our memory business as we combine memory and foundry under one roof,"
+said Jun Young-hyun, head of the Device Solutions division. Analysts expect the HBM market to exceed
+50 billion dollars next year as demand for AI data center chips continues to outpace supply. SK hynix,
+the current market leader, began supplying HBM4 samples earlier this year, while Micron Technology has
+said it will start volume shipments in 2026. Samsung shares rose 3.2 percent in Seoul trading after
+the announcement."""
+
+REWORDED_TITLE = "Samsung Electronics starts volume production of HBM4 memory for AI chips"
+REWORDED = """Samsung Electronics has started mass producing HBM4, the sixth generation of high bandwidth
+memory, the company announced Tuesday. The product stacks twelve DRAM layers on a logic base die made
+with Samsung's own 4-nanometer foundry process. According to the company, the chips transfer data at
+11 gigabits per second per pin, roughly 60 percent faster than the previous generation, and use about
+40 percent less power. Samsung will begin shipping HBM4 to a major US graphics processor customer in the
+fourth quarter and intends to triple output next year at its Pyeongtaek and Cheonan sites.
+"HBM4 marks a turning point for our memory business as we combine memory and foundry under one roof,"
+Jun Young-hyun, who heads the Device Solutions division, said. Market analysts forecast the HBM market
+will top 50 billion dollars next year, as demand for AI data center chips keeps outpacing supply.
+Market leader SK hynix began supplying HBM4 samples earlier this year, and Micron Technology plans volume
+shipments in 2026. Samsung shares closed 3.2 percent higher in Seoul."""
+
+# 같은 주제(HBM, 같은 회사들)지만 다른 보도
+OTHER_TITLE = "SK hynix posts record quarterly profit on HBM demand"
+OTHER = """SK hynix reported a record operating profit for the third quarter on Thursday, as strong demand
+for high bandwidth memory used in AI data center chips lifted prices and shipments. The company said HBM
+accounted for more than 40 percent of its DRAM revenue during the quarter and that its HBM supply for next
+year is already sold out. SK hynix expects the HBM market to keep growing as customers such as Nvidia
+expand production of AI accelerators. The company plans to begin mass production of 12-layer HBM4 in the
+fourth quarter and will expand capacity at its Cheongju and Icheon plants. "We will keep our leadership in
+AI memory by supplying HBM4 on schedule," chief financial officer Kim Woo-hyun said during the earnings
+call. Analysts said Samsung Electronics and Micron Technology are racing to catch up, but SK hynix retains
+an edge with its packaging technology. Shares of SK hynix rose 2.1 percent in Seoul trading."""
+
+
+def _article(seed: int, vocabulary=MEMORY_WORDS, words: int = 300) -> str:
+    rng = random.Random(seed)
+    return ' '.join(f"{rng.choice(vocabulary)}{rng.randint(0, 99)}" for _ in range(words))
+
+
+@pytest.fixture
+def session(memory_db):
+    session = memory_db()
+    yield session
+    session.close()
+
+
+def test_signature_is_stable_and_ignores_markup_case_and_punctuation():
+    body = _article(1)
+    assert signature(TITLE, body) == signature(TITLE, body)
+    assert signature(TITLE, body) == signature(TITLE.upper() + '!!', f"<p>{body}</p>")
+    assert signature('', '') == ()
+    assert len(signature(TITLE, body)) == SIGNATURE_SIZE
+
+
+def test_similarity_separates_reworded_copy_from_same_topic_story():
+    original = signature(ORIGINAL_TITLE, ORIGINAL)
+    index = NearDuplicateIndex(window_days=14)
+    assert similarity(original, signature(REWORDED_TITLE, REWORDED)) >= index.min_similarity
+    assert similarity(original, signature(OTHER_TITLE, OTHER)) < index.min_similarity
+    assert similarity(original, original) == 1.0
+    assert similarity(original, ()) == 0.0
+
+
+def test_bands_are_keyed_by_position():
+    value = signature(TITLE, _article(1))
+    keys = bands(value)
+    assert len(keys) == BAND_COUNT
+    # 다른 구간에 같은 값이 있어도 키가 겹치지 않음
+    assert bands((1, 2, 3) * BAND_COUNT)[0] != bands((1, 2, 3) * BAND_COUNT)[1]
+    assert all(-(1 << 63) <= key < 1 << 63 for key in keys)
+
+
+def test_index_clusters_reworded_copy_but_not_same_topic_story(session):
+    index = NearDuplicateIndex(window_days=14)
+    first_cluster, original = index.add('https://a.com/1', 'A', ORIGINAL_TITLE, ORIGINAL, session=session)
+    assert original is None
+    assert session.query(NearDuplicateBand).count() == BAND_COUNT
+
+    assert index.find('https://b.com/9', REWORDED_TITLE, REWORDED, session=session) == (first_cluster, 'https://a.com/1')
+    cluster, original = index.add('https://b.com/9', 'B', REWORDED_TITLE, REWORDED, session=session)
+    assert (cluster, original) == (first_cluster, 'https://a.com/1')
+
+    assert index.find('https://c.com/2', OTHER_TITLE, OTHER, session=session) is None
+    other_cluster, original = index.add('https://c.com/2', 'C', OTHER_TITLE, OTHER, session=session)
+    assert other_cluster != first_cluster and original is None
+
+
+def test_index_add_is_idempotent_per_url(session):
+    index = NearDuplicateIndex(window_days=14)
+    body = _article(1)
+    index.add('https://a.com/1', 'A', TITLE, body, session=session)
+    first = index.add('https://b.com/9', 'B', TITLE, body, session=session)
+    assert index.add('https://b.com/9', 'B', 'different title', 'different body', session=session) == first
+    assert session.query(NearDuplicateFingerprint).count() == 2
+
+
+def test_index_ignores_signatures_outside_window_and_prunes_them(session):
+    index = NearDuplicateIndex(window_days=14)
+    body = _article(1)
+    index.add('https://a.com/1', 'A', TITLE, body, session=session)
+    session.query(NearDuplicateFingerprint).update(
+        {NearDuplicateFingerprint.created_at: datetime.utcnow() - timedelta(days=30)})
+    session.commit()
+    assert index.find('https://b.com/9', TITLE, body, session=session) is None
+
+    assert index.prune() == 1
+    session.expire_all()
+    assert session.query(NearDuplicateFingerprint).count() == 0
+    assert session.query(NearDuplicateBand).count() == 0
+
+
+def test_collapse_near_duplicates_keeps_first_article_per_cluster(session):
+    for article_id, cluster_id in [(1, 1), (2, 1), (3, 3), (4, None), (5, 3), (6, None)]:
+        session.add(NewsArticle(id=article_id, title=f't{article_id}', content='c', url=f'https://a.com/{article_id}',
+                                source='A', cluster_id=cluster_id))
+    session.commit()
+    kept = collapse_near_duplicates(session.query(NewsArticle)).order_by(NewsArticle.id).all()
+    assert [article.id for article in kept] == [1, 3, 4, 6]
+
+
+class _Frontier:
+    """FETCHED 항목을 묶음마다 하나씩 내주고 상태 변경을 기록"""
+
+    def __init__(self, entries):
+        self.pending = list(entries)
+        self.advanced = []
+        self.released = []
+
+    def claim(self, state, limit, source=None):
+        return [self.pending.pop(0)] if self.pending else []
+
+    def advance(self, entry_id, state, **fields):
+        self.advanced.append((entry_id, state, fields.get('cluster_id')))
+        return True
+
+    def release(self, entry_id, error=None):
+        self.released.append(entry_id)
+        # 실패한 항목은 다음 차례에 다시 시도
+        self.pending.extend(entry for entry in self.entries if entry['id'] == entry_id)
+        return True
+
+    def unclaim(self, entry_id):
+        return True
+
+
+class _Analyzer:
+    def __init__(self, fail_first: int = 0):
+        self.fail_first = fail_first
+
+    def translate_batch(self, texts, is_title=False, timeout=None):
+        if self.fail_first:
+            self.fail_first -= 1
+            raise RuntimeError('번역 API 오류')
+        return list(texts)
+
+    def summarize_batch(self, contents, timeout=None):
+        return ['요약' for _ in contents]
+
+    def calculate_priority(self, article_data):
+        return 1.0
+
+
+def _entry(entry_id, url, title, content):
+    return {'id': entry_id, 'url': url, 'source': 'S', 'title': title, 'content': content, 'published_date': None}
+
+
+def test_pipeline_does_not_collapse_copy_onto_original_that_failed_analysis(memory_db):
+    entries = [_entry(1, 'https://a.com/1', ORIGINAL_TITLE, ORIGINAL),
+               _entry(2, 'https://b.com/9', REWORDED_TITLE, REWORDED)]
+    frontier = _Frontier(entries)
+    frontier.entries = entries
+    # 원본 분석이 실패한 뒤 사본이 먼저 분석되고, 원본은 재시도에서 사본의 중복으로 넘어감
+    pipeline = NewsPipeline(crawler=object(), analyzer=_Analyzer(fail_first=1), frontier=frontier,
+                            duplicate_index=NearDuplicateIndex(window_days=14))
+    assert pipeline.analyze_pending() == 1
+
+    assert frontier.released == [1]
+    (copy_id, copy_state, cluster_id), (original_id, original_state, original_cluster) = frontier.advanced
+    assert (copy_id, copy_state) == (2, ANALYZED)
+    assert (original_id, original_state, original_cluster) == (1, DUPLICATE, cluster_id)
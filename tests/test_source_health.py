@@ -0,0 +1,78 @@
+"""source_health: 서킷 브레이커 상태 전이, 쿨다운, 절약 시간, 저장/로드"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from source_health import CLOSED, HALF_OPEN, OPEN, SourceCircuitBreaker
+
+NOW = datetime(2026, 1, 1, 9, 0)
+
+
+@pytest.fixture
+def breaker():
+    return SourceCircuitBreaker(failure_threshold=3, cooldown_minutes=60, max_cooldown_minutes=150)
+
+
+def _fail(breaker, times, now=NOW, seconds=10.0):
+    for _ in range(times):
+        breaker.record('A', failed=True, seconds=seconds, reason='HTTP 503', now=now)
+
+
+def test_opens_after_threshold_consecutive_failures(breaker):
+    _fail(breaker, 2)
+    assert breaker.allow('A', NOW) == CLOSED
+    breaker.record('A', failed=False, now=NOW)  # 성공하면 연속 실패 수 초기화
+    _fail(breaker, 2)
+    assert breaker.allow('A', NOW) == CLOSED
+    _fail(breaker, 1)
+    assert breaker.states['A']['breaker_state'] == OPEN
+    assert breaker.states['A']['retry_at'] == NOW + timedelta(minutes=60)
+    assert breaker.allow('A', NOW + timedelta(minutes=59)) is None
+    assert breaker.allow('B', NOW) == CLOSED
+
+
+def test_half_open_probe_closes_on_success(breaker):
+    _fail(breaker, 3)
+    later = NOW + timedelta(minutes=61)
+    assert breaker.allow('A', later) == HALF_OPEN
+    breaker.record('A', failed=False, now=later)
+    state = breaker.states['A']
+    assert (state['breaker_state'], state['consecutive_failures'], state['retry_at']) == (CLOSED, 0, None)
+
+
+def test_failed_half_open_probe_doubles_cooldown_up_to_max(breaker):
+    _fail(breaker, 3)
+    now = NOW
+    for expected in (120, 150):
+        now = breaker.states['A']['retry_at'] + timedelta(minutes=1)
+        assert breaker.allow('A', now) == HALF_OPEN
+        _fail(breaker, 1, now=now)
+        assert breaker.states['A']['breaker_state'] == OPEN
+        assert breaker.states['A']['cooldown_minutes'] == expected
+    assert breaker.states['A']['retry_at'] == now + timedelta(minutes=150)
+
+
+def test_record_run_counts_empty_results_and_skips_unfinished(breaker):
+    for _ in range(3):
+        breaker.record_run({'A': {'failed': False, 'links': 0, 'seconds': 4.0},
+                            'B': {'failed': False, 'links': 0, 'unfinished': True}}, now=NOW)
+    assert breaker.states['A']['breaker_state'] == OPEN
+    assert breaker.states['A']['breaker_reason'] == '링크 0개'
+    assert 'B' not in breaker.states
+
+    breaker.record_run({'A': {'skipped': True}}, now=NOW)
+    summary = breaker.summary()
+    assert summary['open_sources'] == 1
+    assert summary['sources'][0]['skipped_runs'] == 1
+    assert summary['total_time_saved_seconds'] == pytest.approx(4.0)
+
+
+def test_state_survives_save_and_load(memory_db, breaker):
+    _fail(breaker, 3)
+    breaker.save()
+
+    loaded = SourceCircuitBreaker(failure_threshold=3, cooldown_minutes=60).load()
+    assert loaded.allow('A', NOW + timedelta(minutes=30)) is None
+    assert loaded.states['A']['breaker_reason'] == 'HTTP 503'
+    assert loaded.allow('A', NOW + timedelta(minutes=61)) == HALF_OPEN
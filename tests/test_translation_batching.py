@@ -0,0 +1,58 @@
+"""news_analyzer: 묶음 번역 응답 해석과 긴 본문 분할"""
+
+import json
+
+from llm_gateway import estimate_tokens
+from news_analyzer import NewsAnalyzer, TRANSLATION_SEGMENT_TOKENS, _parse_batch_translation
+
+
+def test_parse_batch_translation_reads_indexed_object():
+    content = json.dumps({'0': ' 첫 번째 번역 ', '1': '두 번째 번역'}, ensure_ascii=False)
+    assert _parse_batch_translation(content, 2) == ['첫 번째 번역', '두 번째 번역']
+
+
+def test_parse_batch_translation_accepts_code_fence_wrapper_and_list():
+    fenced = '```json\n' + json.dumps({'translations': {'0': '번역 하나'}}, ensure_ascii=False) + '\n```'
+    assert _parse_batch_translation(fenced, 1) == ['번역 하나']
+    assert _parse_batch_translation(json.dumps(['번역 하나', '번역 둘'], ensure_ascii=False), 2) == \
+        ['번역 하나', '번역 둘']
+
+
+def test_parse_batch_translation_marks_missing_or_unusable_items():
+    content = json.dumps({'0': '번역 하나', '2': 'ok', '3': 7}, ensure_ascii=False)
+    assert _parse_batch_translation(content, 4) == ['번역 하나', None, None, None]
+    assert _parse_batch_translation(json.dumps(['번역 하나'], ensure_ascii=False), 2) == [None, None]
+
+
+def test_parse_batch_translation_returns_none_for_invalid_json():
+    assert _parse_batch_translation('not json', 3) == [None, None, None]
+    assert _parse_batch_translation('', 1) == [None]
+    assert _parse_batch_translation('"just a string"', 1) == [None]
+
+
+def _join(segments):
+    return ''.join(joiner + segment for segment, joiner in segments)
+
+
+def test_split_for_translation_keeps_short_text_whole():
+    assert NewsAnalyzer()._split_for_translation('  Samsung ships HBM4 samples.  ') == \
+        [('Samsung ships HBM4 samples.', '')]
+
+
+def test_split_for_translation_splits_paragraphs_within_token_limit():
+    paragraphs = [' '.join(f'Paragraph {index} sentence {n} about wafer supply.' for n in range(30))
+                  for index in range(6)]
+    text = '\n'.join(paragraphs)
+    segments = NewsAnalyzer()._split_for_translation(text)
+    assert len(segments) > 1
+    assert all(estimate_tokens(segment) <= TRANSLATION_SEGMENT_TOKENS for segment, _ in segments)
+    assert segments[0][1] == ''
+    assert _join(segments) == text
+
+
+def test_split_for_translation_breaks_oversized_sentence():
+    text = 'x' * (TRANSLATION_SEGMENT_TOKENS * 10)
+    segments = NewsAnalyzer()._split_for_translation(text)
+    assert len(segments) > 1
+    assert all(estimate_tokens(segment) <= TRANSLATION_SEGMENT_TOKENS for segment, _ in segments)
+    assert _join(segments) == text
@@ -0,0 +1,66 @@
+"""backfill_translate_articles: 요청한 필드만 번역해도 완료 처리, 실패하면 재시도 예약"""
+
+import pytest
+
+from backfill_translate_articles import translate_pending_articles
+from database import NewsArticle
+
+TITLE = "Samsung starts HBM4 mass production"
+CONTENT = "Samsung Electronics said it has begun mass production of HBM4 memory for AI accelerators."
+
+
+class _Analyzer:
+    openai_api_key = 'test'
+
+    def __init__(self, fail_content: bool = False):
+        self.fail_content = fail_content
+        self.requested = []
+
+    def detect_language(self, title, content=''):
+        return 'en'
+
+    def _is_english_text(self, text):
+        return not text.startswith('[ko]')
+
+    def translate_batch(self, texts, is_title=False, timeout=None):
+        self.requested.append('title' if is_title else 'content')
+        if self.fail_content and not is_title:
+            return list(texts)  # 번역 실패 시 원문 그대로
+        return [f"[ko] {text}" for text in texts]
+
+
+@pytest.fixture
+def article(memory_db):
+    session = memory_db()
+    session.add(NewsArticle(id=1, title=TITLE, content=CONTENT, url='https://a.com/1', source='A'))
+    session.commit()
+    session.close()
+
+    def load():
+        session = memory_db()
+        row = session.get(NewsArticle, 1)
+        session.close()
+        return row
+    return load
+
+
+@pytest.mark.parametrize('include_title,include_content', [(True, False), (False, True), (True, True)])
+def test_article_is_done_once_requested_fields_are_translated(article, include_title, include_content):
+    analyzer = _Analyzer()
+    counts = translate_pending_articles(analyzer, include_title=include_title, include_content=include_content)
+    assert counts['translated'] == 1 and counts['pending'] == 0
+
+    row = article()
+    assert row.translated_at is not None and row.translation_retry_at is None
+    assert row.title == (f"[ko] {TITLE}" if include_title else TITLE)
+    assert row.content == (f"[ko] {CONTENT}" if include_content else CONTENT)
+    assert (row.original_title, row.original_content) == (TITLE, CONTENT)
+    assert translate_pending_articles(analyzer)['total'] == 0
+
+
+def test_failed_requested_field_schedules_retry(article):
+    counts = translate_pending_articles(_Analyzer(fail_content=True), include_title=True, include_content=True)
+    assert counts == {'total': 1, 'korean': 0, 'translated': 0, 'pending': 1}
+    row = article()
+    assert row.translated_at is None and row.translation_attempts == 1
+    assert row.translation_retry_at is not None
@@ -0,0 +1,38 @@
+"""url_canonical: 요청용 URL 정리와 중복 판단용 정규 URL"""
+
+from url_canonical import canonical_url, clean_url
+
+
+def test_canonical_url_drops_tracking_params_and_fragment():
+    assert canonical_url('https://www.etnews.com/news/123?utm_source=tw&fbclid=x&id=5#top') == \
+        'https://www.etnews.com/news/123?id=5'
+    assert canonical_url('https://a.com/x?view_type=sm&idxno=9') == 'https://a.com/x?idxno=9'
+
+
+def test_canonical_url_unifies_scheme_host_alias_and_port():
+    assert canonical_url('http://M.ETNEWS.com:80/news/123') == 'https://www.etnews.com/news/123'
+    assert canonical_url('https://m.thelec.kr/news/articleView.html?idxno=1') == \
+        canonical_url('http://thelec.kr/news/articleView.html?idxno=1')
+    assert canonical_url('http://127.0.0.1:8080/a') == 'https://127.0.0.1:8080/a'
+
+
+def test_canonical_url_keeps_distinct_mirrors_apart():
+    # thelec.net은 영문판이라 thelec.kr과 합치지 않음
+    assert canonical_url('https://thelec.net/news/1') != canonical_url('https://thelec.kr/news/1')
+
+
+def test_canonical_url_sorts_query_params():
+    assert canonical_url('https://a.com/x?b=2&a=1') == canonical_url('https://a.com/x?a=1&b=2&utm_medium=y')
+    assert canonical_url('https://a.com') == 'https://a.com/'
+
+
+def test_canonical_url_resolves_relative_urls_and_leaves_other_schemes():
+    assert canonical_url('/news/1?utm_source=x', 'http://www.bloter.net/list') == 'https://www.bloter.net/news/1'
+    assert canonical_url('mailto:desk@a.com') == 'mailto:desk@a.com'
+    assert canonical_url('') == ''
+
+
+def test_clean_url_preserves_query_text_params_and_host():
+    url = 'http://M.ETNEWS.com/p;jsessionid=1?x&b=%2F&utm_medium=y&q=a+b#top'
+    assert clean_url(url) == 'http://M.ETNEWS.com/p;jsessionid=1?x&b=%2F&q=a+b'
+    assert clean_url('https://a.com/x?utm_source=1') == 'https://a.com/x'
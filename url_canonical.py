@@ -0,0 +1,80 @@
+"""
+URL 정규화
+추적 파라미터, 표시 옵션 파라미터, http/https, 호스트 별칭 차이로 같은 기사가
+다른 URL로 보이는 것을 막기 위해 중복 판단용 정규 URL을 만든다
+"""
+
+from typing import Optional
+from urllib.parse import urljoin, urlparse, urlunparse, parse_qsl, urlencode, unquote_plus
+
+# 기사 내용과 관계없는 쿼리 파라미터 (광고/유입 추적, 목록 보기 방식)
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'gbraid', 'wbraid', 'msclkid', 'igshid', 'yclid',
+    'mc_cid', 'mc_eid', '_ga', '_gl', 'ref_src', 'cmpid', 'view_type'
+}
+TRACKING_PREFIXES = ('utm_',)
+
+# 같은 사이트의 다른 호스트 이름 -> 대표 호스트
+# 같은 기사 번호를 쓰는 미러만 등록 (thelec.net은 영문판이라 기사 번호 체계가 달라 thelec.kr과 합치지 않음)
+HOST_ALIASES = {
+    'thelec.kr': 'www.thelec.kr',
+    'm.thelec.kr': 'www.thelec.kr',
+    'thelec.net': 'www.thelec.net',
+    'm.thelec.net': 'www.thelec.net',
+    'etnews.com': 'www.etnews.com',
+    'm.etnews.com': 'www.etnews.com',
+    'www.zdnet.co.kr': 'zdnet.co.kr',
+    'm.zdnet.co.kr': 'zdnet.co.kr',
+    'bloter.net': 'www.bloter.net',
+    'm.bloter.net': 'www.bloter.net',
+    'sedaily.com': 'www.sedaily.com',
+    'm.sedaily.com': 'www.sedaily.com',
+    'mt.co.kr': 'www.mt.co.kr',
+    'm.mt.co.kr': 'www.mt.co.kr',
+}
+
+
+def _is_tracking_param(key: str) -> bool:
+    key = key.lower()
+    return key in TRACKING_PARAMS or key.startswith(TRACKING_PREFIXES)
+
+
+def _strip_tracking_query(query: str) -> str:
+    """쿼리 문자열에서 추적 파라미터만 빼고 나머지는 원래 텍스트(순서, 인코딩, 값 없는 키) 그대로 유지"""
+    kept = [part for part in query.split('&')
+            if part and not _is_tracking_param(unquote_plus(part.split('=', 1)[0]))]
+    return '&'.join(kept)
+
+
+def clean_url(url: str, base_url: Optional[str] = None) -> str:
+    """요청에 쓸 URL 정리 - 추적 파라미터와 프래그먼트만 제거 (나머지는 원래 URL 그대로)
+
+    쿼리를 다시 인코딩하면 `?x`가 `?x=`로 바뀌거나 값의 인코딩이 달라져 다른 페이지가 올 수 있으므로
+    쿼리 텍스트는 추적 파라미터 부분만 잘라낸다. 중복 비교에는 canonical_url()을 쓴다.
+    """
+    if not url:
+        return url
+    if base_url:
+        url = urljoin(base_url, url)
+    parsed = urlparse(url.strip())
+    if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+        return url.strip()
+    return urlunparse(parsed._replace(path=parsed.path or '/', query=_strip_tracking_query(parsed.query),
+                                      fragment=''))
+
+
+def canonical_url(url: str, base_url: Optional[str] = None) -> str:
+    """중복 판단용 정규 URL - clean_url에 더해 https로 통일, 호스트 소문자화와 별칭 적용, 쿼리 파라미터 순서 정렬"""
+    cleaned = clean_url(url, base_url)
+    parsed = urlparse(cleaned)
+    if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+        return cleaned
+
+    host = (parsed.hostname or '').lower()
+    host = HOST_ALIASES.get(host, host)
+    port = parsed.port
+    if port and not ((parsed.scheme == 'http' and port == 80) or (parsed.scheme == 'https' and port == 443)):
+        host = f"{host}:{port}"
+
+    query = sorted(parse_qsl(parsed.query, keep_blank_values=True))
+    return urlunparse(('https', host, parsed.path, '', urlencode(query), ''))
@@ -9,13 +9,17 @@ from database import (init_db, NewsArticle, UserPreferences, ArticleBookmark, Ar
                      ArticleShare, AdminNews, get_articles_by_priority, 
                      get_recent_articles, search_articles, get_db_session, 
                      get_user_preferences, update_user_preferences, get_filtered_articles,
-                     add_bookmark, remove_bookmark, get_bookmarked_articles, is_bookmarked, update_bookmark_notes)
+                     add_bookmark, remove_bookmark, get_bookmarked_articles, is_bookmarked, update_bookmark_notes,
+                     collapse_near_duplicates)
 from datetime import datetime, timedelta
 import logging
 import json
+import math
 import threading
+import time
 import os
 from dotenv import load_dotenv
+from config import Config
 
 # Optional imports
 try:
@@ -48,6 +52,45 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# 마감 때문에 남은 프런티어 항목을 응답 후 처리하는 백그라운드 작업 (한 번에 하나만)
+_drain_lock = threading.Lock()
+
+def _deadline_param(payload):
+    """요청의 deadline(초) - 없으면 CRAWL_API_DEADLINE_SECONDS, 최대 CRAWL_API_DEADLINE_SECONDS로 제한
+
+    숫자가 아니거나 0 이하이면 ValueError
+    """
+    value = payload.get('deadline') if isinstance(payload, dict) else None
+    if value is None:
+        value = request.args.get('deadline')
+    if value is None or value == '':
+        return Config.CRAWL_API_DEADLINE_SECONDS
+    if isinstance(value, bool):
+        raise ValueError(f"잘못된 deadline: {value}")
+    deadline = float(value)
+    if not math.isfinite(deadline) or deadline <= 0:
+        raise ValueError(f"잘못된 deadline: {value}")
+    return min(deadline, Config.CRAWL_API_DEADLINE_SECONDS)
+
+def _drain_frontier():
+    """프런티어에 남은 항목 분석/저장 (다른 스레드가 이미 처리 중이면 건너뜀)"""
+    if not _drain_lock.acquire(blocking=False):
+        return
+    try:
+        from news_pipeline import NewsPipeline
+        NewsPipeline().run(crawl=False)
+    except Exception as e:
+        logger.error(f"프런티어 후속 처리 오류: {str(e)}")
+    finally:
+        _drain_lock.release()
+
+def _collapse_param():
+    """요청의 collapse 파라미터 (없으면 FEED_COLLAPSE_DUPLICATES 설정)"""
+    value = request.args.get('collapse')
+    if value is None:
+        return Config.FEED_COLLAPSE_DUPLICATES
+    return value.lower() in ('1', 'true', 'yes')
+
 def create_app():
     """Flask 앱 생성 및 설정"""
     app = Flask(__name__)
@@ -115,10 +158,6 @@ def create_app():
                 logger.warning("뉴스 크롤러/분석기 모듈을 찾을 수 없습니다.")
                 return
             
-            from news_crawler import NewsCrawler
-            from news_analyzer import NewsAnalyzer
-            from database import database_session, NewsArticle
-            
             # 기존 기사 개수 확인
             session = get_db_session()
             existing_count = session.query(NewsArticle).count()
@@ -128,58 +167,10 @@ def create_app():
             if existing_count < 5:
                 logger.info(f"현재 기사 {existing_count}개 - 크롤링 시작...")
                 
-                crawler = NewsCrawler()
-                analyzer = NewsAnalyzer()
-                
-                articles = crawler.crawl_semiconductor_news()
-                logger.info(f"크롤링 완료: {len(articles)}개 기사 수집")
-                
-                saved_count = 0
-                for article_data in articles:
-                    try:
-                        # 중복 체크
-                        session = get_db_session()
-                        existing = session.query(NewsArticle).filter_by(url=article_data['url']).first()
-                        
-                        if existing:
-                            session.close()
-                            continue
-                        
-                        # 번역 및 분석
-                        translated_title = analyzer._translate_text(article_data['title'], is_title=True)
-                        translated_content = analyzer._translate_text(article_data['content'], is_title=False)
-                        priority = analyzer.calculate_priority({
-                            **article_data,
-                            'title': translated_title,
-                            'content': translated_content
-                        })
-                        summary = analyzer.summarize_article(translated_content)
-                        
-                        # DB 저장
-                        article = NewsArticle(
-                            title=translated_title,
-                            content=translated_content,
-                            summary=summary,
-                            url=article_data['url'],
-                            source=article_data['source'],
-                            published_date=article_data['published_date'],
-                            priority_score=priority,
-                            crawled_at=datetime.now()
-                        )
-                        
-                        session.add(article)
-                        session.commit()
-                        saved_count += 1
-                        session.close()
-                    except Exception as e:
-                        logger.error(f"기사 저장 실패: {str(e)}")
-                        try:
-                            session.rollback()
-                            session.close()
-                        except:
-                            pass
-                
-                logger.info(f"✅ 크롤링 완료: {saved_count}개 기사 저장")
+                from news_pipeline import NewsPipeline
+                result = NewsPipeline().run()
+                logger.info(f"크롤링 완료: {result['crawled']}개 기사 수집")
+                logger.info(f"✅ 크롤링 완료: {len(result['stored'])}개 기사 저장")
             else:
                 logger.info(f"기사 {existing_count}개 존재 - 크롤링 스킵")
         except Exception as e:
@@ -189,7 +180,23 @@ def create_app():
     if os.getenv('RUN_CRAWL_ON_STARTUP', 'true').lower() == 'true':
         crawl_thread = threading.Thread(target=run_initial_crawl, daemon=True)
         crawl_thread.start()
-    
+
+    # 저장된 기사 중 번역되지 않은 기사를 주기적으로 번역 (요청 처리 중에는 번역하지 않음)
+    def run_translation_job():
+        """백그라운드 번역 작업"""
+        from backfill_translate_articles import translate_pending_articles
+        interval = Config.TRANSLATION_JOB_INTERVAL_MINUTES * 60
+        while True:
+            try:
+                translate_pending_articles(limit=Config.TRANSLATION_JOB_BATCH_SIZE)
+            except Exception as e:
+                logger.error(f"백그라운드 번역 오류: {str(e)}")
+            time.sleep(interval)
+
+    if Config.TRANSLATION_JOB_ENABLED and NewsAnalyzer is not None:
+        translation_thread = threading.Thread(target=run_translation_job, daemon=True)
+        translation_thread.start()
+
     # Captain DDandDan 최고 보안 시스템 적용
     init_security(app)
     
@@ -224,20 +231,11 @@ def create_app():
         try:
             session = get_db_session()
             
-            # 우선순위 높은 기사들
-            priority_articles = get_articles_by_priority(session, limit=10)
+            # 우선순위 높은 기사들 (같은 보도의 근접 중복은 하나로)
+            collapse = Config.FEED_COLLAPSE_DUPLICATES
+            priority_articles = get_articles_by_priority(session, limit=10, collapse_duplicates=collapse)
             # 최근 기사들 (30개로 확대)
-            recent_articles = get_recent_articles(session, limit=30)
-            
-            # 영어 제목 한글로 번역 처리
-            if NewsAnalyzer:
-                analyzer = NewsAnalyzer()
-                for article in recent_articles:
-                    if article.title:
-                        # 영어 제목이면 번역
-                        translated = analyzer._translate_text(article.title, is_title=True)
-                        if translated != article.title:
-                            article.title = translated
+            recent_articles = get_recent_articles(session, limit=30, collapse_duplicates=collapse)
             
             # 통계 정보
             total_articles = session.query(NewsArticle).count()
@@ -293,20 +291,24 @@ def create_app():
             limit = min(int(request.args.get('limit', 20)), 100)
             sort_by = request.args.get('sort', 'priority')  # priority, recent, title
             search_query = request.args.get('search', '').strip()
+            collapse = _collapse_param()
             
             # 검색 또는 일반 조회
             if search_query:
-                articles = search_articles(search_query, session, limit=limit)
+                articles = search_articles(search_query, session, limit=limit, collapse_duplicates=collapse)
             else:
+                articles = session.query(NewsArticle)
+                if collapse:
+                    articles = collapse_near_duplicates(articles)
                 if sort_by == 'recent':
-                    articles = session.query(NewsArticle).order_by(
+                    articles = articles.order_by(
                         NewsArticle.crawled_at.desc(),
                         NewsArticle.id.desc()
                     )
                 elif sort_by == 'title':
-                    articles = session.query(NewsArticle).order_by(NewsArticle.title)
+                    articles = articles.order_by(NewsArticle.title)
                 else:  # priority
-                    articles = session.query(NewsArticle).order_by(NewsArticle.priority_score.desc())
+                    articles = articles.order_by(NewsArticle.priority_score.desc())
                 
                 # 페이징 적용
                 offset = (page - 1) * limit
@@ -315,16 +317,6 @@ def create_app():
             # JSON 응답 준비
             articles_data = [article.to_dict() for article in articles]
             
-            # 영어 제목 한글 번역 처리
-            if NewsAnalyzer:
-                analyzer = NewsAnalyzer()
-                for article_dict in articles_data:
-                    if article_dict.get('title'):
-                        # 영어 제목이면 번역
-                        translated = analyzer._translate_text(article_dict['title'], is_title=True)
-                        if translated and translated != article_dict['title']:
-                            article_dict['title'] = translated
-            
             session.close()
             
             return jsonify({
@@ -350,19 +342,9 @@ def create_app():
                 session.close()
                 return jsonify({'success': False, 'error': '기사를 찾을 수 없습니다'}), 404
             
+            # 번역은 저장 시점/백그라운드 작업에서 끝나 있으므로 저장된 텍스트만 반환
             article_data = article.to_dict()
-            
-            # 영어 제목/내용 한글 번역 처리
-            if NewsAnalyzer:
-                analyzer = NewsAnalyzer()
-                if article_data.get('title'):
-                    translated = analyzer._translate_text(article_data['title'], is_title=True)
-                    if translated and translated != article_data['title']:
-                        article_data['title'] = translated
-                if article_data.get('content'):
-                    translated = analyzer._translate_text(article_data['content'], is_title=False)
-                    if translated and translated != article_data['content']:
-                        article_data['content'] = translated
+            article_data['original_content'] = article.original_content
             
             session.close()
             
@@ -392,16 +374,7 @@ def create_app():
             limit = int(request.args.get('limit', 5))
             related = get_related_articles(article_id, session, limit=limit)
             
-            # 영어 제목 번역
-            related_data = []
-            for rel_article in related:
-                article_dict = rel_article.to_dict()
-                if article_dict.get('title') and NewsAnalyzer:
-                    analyzer = NewsAnalyzer()
-                    translated = analyzer._translate_text(article_dict['title'], is_title=True)
-                    if translated and translated != article_dict['title']:
-                        article_dict['title'] = translated
-                related_data.append(article_dict)
+            related_data = [rel_article.to_dict() for rel_article in related]
             
             session.close()
             
@@ -420,89 +393,73 @@ def create_app():
         """수동 뉴스 크롤링 API"""
         try:
             # 크롤링 시작 알림
-            app.send_notification('뉴스 크롤링을 시작합니다...', 'info')
-            
-            # 크롤링 실행
-            crawler = NewsCrawler()
-            articles = crawler.crawl_semiconductor_news()
-            
-            # 분석 및 저장
-            analyzer = NewsAnalyzer()
-            session = get_db_session()
-            
-            new_articles_count = 0
-            high_priority_articles = []
+            logger.info('뉴스 크롤링을 시작합니다...')
             
-            for article_data in articles:
-                # 중복 체크
-                existing = session.query(NewsArticle).filter_by(url=article_data['url']).first()
-                if existing:
-                    continue
-                
-                # 분석
-                translated_title = analyzer._translate_text(article_data['title'], is_title=True)
-                translated_content = analyzer._translate_text(article_data['content'], is_title=False)
-                summary = analyzer.summarize_article(translated_content)
-                priority = analyzer.calculate_priority({
-                    **article_data,
-                    'title': translated_title,
-                    'content': translated_content
-                })
-                
-                # 저장
-                article = NewsArticle(
-                    title=translated_title,
-                    content=translated_content,
-                    summary=summary,
-                    url=article_data['url'],
-                    source=article_data['source'],
-                    published_date=article_data['published_date'],
-                    priority_score=priority,
-                    crawled_at=datetime.now()
-                )
-                
-                session.add(article)
-                new_articles_count += 1
-                
-                # 높은 우선순위 기사 체크
-                if priority >= 8.0:
-                    high_priority_articles.append({
-                        'id': None,  # DB 저장 후 설정
-                        'title': translated_title,
-                        'priority_score': priority,
-                        'source': article_data['source']
-                    })
-            
-            session.commit()
+            # 크롤링 -> 분석 -> 저장 (프런티어에 남은 이전 항목도 함께 처리)
+            # 프록시 타임아웃 전에 응답하도록 마감 시간 안에서만 실행하고, 남은 항목은 다음 실행이 처리
+            from news_pipeline import NewsPipeline
+            try:
+                deadline = _deadline_param(request.get_json(silent=True))
+            except (TypeError, ValueError):
+                return jsonify({'success': False, 'error': 'deadline은 0보다 큰 숫자(초)여야 합니다'}), 400
+            result = NewsPipeline().run(deadline=deadline)
             
-            # 새 기사들의 ID 업데이트
-            for i, high_priority in enumerate(high_priority_articles):
-                article = session.query(NewsArticle).filter_by(
-                    title=high_priority['title']
-                ).first()
-                if article:
-                    high_priority_articles[i]['id'] = article.id
+            # 본문까지 받았지만 마감 때문에 분석/저장하지 못한 기사는 응답 후 백그라운드에서 마저 처리
+            if (result['pending'].get('fetched') or result['pending'].get('analyzed')) and not _drain_lock.locked():
+                threading.Thread(target=_drain_frontier, daemon=True).start()
             
-            session.close()
+            new_articles_count = len(result['stored'])
+            high_priority_articles = [
+                article for article in result['stored'] if (article['priority_score'] or 0) >= 8.0
+            ]
             
             # 완료 알림
-            app.send_notification(
-                f'{new_articles_count}개의 새로운 기사를 추가했습니다.',
-                'success'
-            )
+            logger.info(f'{new_articles_count}개의 새로운 기사를 추가했습니다.')
             
             # 크롤링 완료
             return jsonify({
                 'success': True,
                 'message': f'{new_articles_count}개의 새로운 기사를 추가했습니다.',
                 'new_articles': new_articles_count,
-                'high_priority_articles': len(high_priority_articles)
+                'high_priority_articles': len(high_priority_articles),
+                'partial': bool(result['unfinished_sources']),
+                'unfinished_sources': result['unfinished_sources'],
+                'pending': result['pending']
             })
             
         except Exception as e:
             logger.error(f"크롤링 API 오류: {str(e)}")
             return jsonify({'success': False, 'error': str(e)}), 500
 
+    @app.route('/api/crawl/health', methods=['GET'])
+    def api_crawl_health():
+        """뉴스 소스별 서킷 브레이커 상태와 건너뛰어 절약한 시간 API"""
+        try:
+            from source_health import SourceCircuitBreaker
+            health = SourceCircuitBreaker().load().summary()
+            return jsonify({'success': True, **health})
+        except Exception as e:
+            logger.error(f"크롤링 상태 API 오류: {str(e)}")
+            return jsonify({'success': False, 'error': str(e)}), 500
+
+    @app.route('/api/crawl/runs', methods=['GET'])
+    def api_crawl_runs():
+        """최근 크롤링 실행 기록과 소스별 측정값(지연 백분위수, 바이트, 수집량, 오류 종류) API"""
+        try:
+            from crawl_metrics import source_trends
+            from database import get_crawl_runs
+            limit = min(request.args.get('limit', 20, type=int), 200)
+            source = request.args.get('source') or None
+            session = get_db_session()
+            try:
+                runs = get_crawl_runs(limit=limit, source=source, session=session)
+            finally:
+                session.close()
+            return jsonify({'success': True, 'runs': runs, 'sources': source_trends(runs)})
+        except Exception as e:
+            logger.error(f"크롤링 실행 기록 API 오류: {str(e)}")
+            return jsonify({'success': False, 'error': str(e)}), 500
+
     @app.route('/api/stats')
     @security_required('api')
     def api_statistics():
@@ -642,18 +599,10 @@ def create_app():
             
             session = get_db_session()
             
-            articles = get_filtered_articles(user_id, session, limit, sort_by)
+            articles = get_filtered_articles(user_id, session, limit, sort_by,
+                                             collapse_duplicates=_collapse_param())
             articles_data = [article.to_dict() for article in articles]
             
-            # 영어 제목 한글 번역 처리
-            if NewsAnalyzer:
-                analyzer = NewsAnalyzer()
-                for article_dict in articles_data:
-                    if article_dict.get('title'):
-                        translated = analyzer._translate_text(article_dict['title'], is_title=True)
-                        if translated and translated != article_dict['title']:
-                            article_dict['title'] = translated
-            
             session.close()
             
             return jsonify({